@@ -13,6 +13,7 @@ Requirements addressed:
 - 1.1: Accept natural language questions about player statistics
 """
 
+import asyncio
 import chainlit as cl
 from dotenv import load_dotenv
 import os
@@ -20,12 +21,16 @@ import logging
 from typing import Dict, Any
 import uuid
 
-from workflow import compile_workflow, configure_logging
-from models.models import ChatbotState
+from workflow import arun_workflow, get_compiled_workflow, configure_logging
 from nodes.memory import initialize_memory
 from error_handler import handle_error, ErrorType, log_error
 from logging_config import create_context_logger
-from cache_utils import configure_cache, warm_kaggle_cache, print_cache_statistics
+from cache_utils import (
+    configure_cache,
+    warm_caches,
+    refresh_nflreadpy_cache_periodically,
+    print_cache_statistics
+)
 
 # Highlight live data support and give users ideas for queries
 SAMPLE_QUERIES = [
@@ -50,17 +55,31 @@ configure_cache(
     kaggle_cache_enabled=os.getenv("KAGGLE_CACHE_ENABLED", "true").lower() == "true",
     nflreadpy_ttl_hours=int(os.getenv("NFLREADPY_CACHE_TTL_HOURS", "24")),
     query_cache_capacity=int(os.getenv("QUERY_CACHE_CAPACITY", "100")),
-    query_cache_ttl_hours=int(os.getenv("QUERY_CACHE_TTL_HOURS", "1"))
+    query_cache_ttl_hours=int(os.getenv("QUERY_CACHE_TTL_HOURS", "1")),
+    persist_dir=(
+        os.getenv("CACHE_DIR", "./.cache")
+        if os.getenv("PERSIST_KAGGLE_CACHE", "false").lower() == "true"
+        else None
+    )
 )
 
-# Warm Kaggle cache on startup if enabled
-if os.getenv("WARM_KAGGLE_CACHE_ON_STARTUP", "true").lower() == "true":
-    logger.info("Warming Kaggle cache on startup...")
-    kaggle_path = os.getenv("KAGGLE_DATA_PATH")
-    if warm_kaggle_cache(kaggle_path):
-        logger.info("Kaggle cache warmed successfully")
+# Warm the Kaggle and nflreadpy caches concurrently so the first queries
+# are cache hits
+warm_results = warm_caches(
+    kaggle_path=os.getenv("KAGGLE_DATA_PATH"),
+    warm_kaggle=os.getenv("WARM_KAGGLE_CACHE_ON_STARTUP", "true").lower() == "true",
+    warm_nflreadpy=os.getenv("WARM_NFLREADPY_CACHE_ON_STARTUP", "true").lower() == "true"
+)
+for cache_name, warmed in warm_results.items():
+    if warmed:
+        logger.info(f"{cache_name} cache warmed successfully")
     else:
-        logger.warning("Failed to warm Kaggle cache - will load on first use")
+        logger.warning(f"Failed to warm {cache_name} cache - will load on first use")
+
+# Reload the current season's nflreadpy data on this interval (0 disables).
+# The task needs Chainlit's event loop, so the first chat session starts it.
+NFLREADPY_REFRESH_INTERVAL_HOURS = float(os.getenv("NFLREADPY_REFRESH_INTERVAL_HOURS", "12"))
+_nflreadpy_refresh_task = None
 
 
 @cl.on_chat_start
@@ -78,6 +97,14 @@ async def start():
     """
     logger.info("New chat session started")
     
+    # Start the server-wide nflreadpy refresh once
+    global _nflreadpy_refresh_task
+    if _nflreadpy_refresh_task is None and NFLREADPY_REFRESH_INTERVAL_HOURS > 0:
+        _nflreadpy_refresh_task = asyncio.create_task(
+            refresh_nflreadpy_cache_periodically(NFLREADPY_REFRESH_INTERVAL_HOURS)
+        )
+        logger.info(f"nflreadpy refresh scheduled every {NFLREADPY_REFRESH_INTERVAL_HOURS}h")
+    
     # Generate unique session ID
     session_id = str(uuid.uuid4())
     cl.user_session.set("session_id", session_id)
@@ -98,11 +125,10 @@ async def start():
     ).send()
     
     try:
-        # Initialize LangGraph workflow
-        logger.info("Compiling LangGraph workflow")
-        workflow = compile_workflow()
-        cl.user_session.set("workflow", workflow)
-        logger.info("LangGraph workflow compiled and stored in session")
+        # Compile the process-wide LangGraph workflow up front (arun_workflow
+        # uses it directly), so build errors surface at chat start
+        get_compiled_workflow()
+        logger.info("LangGraph workflow ready")
         
         # Initialize conversation history
         conversation_history = initialize_memory()
@@ -139,19 +165,10 @@ async def main(message: cl.Message):
     user_query = message.content
     logger.info(f"Processing user query: '{user_query[:50]}...'")
     
-    # Get workflow and conversation history from session
-    workflow = cl.user_session.get("workflow")
+    # Get conversation history from session
     conversation_history = cl.user_session.get("conversation_history", [])
     session_id = cl.user_session.get("session_id")
     
-    # Check if workflow is initialized
-    if workflow is None:
-        logger.error("Workflow not initialized in session")
-        await cl.Message(
-            content="⚠️ The chatbot is not properly initialized. Please refresh the page and try again."
-        ).send()
-        return
-    
     # Create a message for processing indicator
     processing_msg = cl.Message(content="")
     await processing_msg.send()
@@ -161,15 +178,9 @@ async def main(message: cl.Message):
         processing_msg.content = "🔄 Processing your query..."
         await processing_msg.update()
         
-        # Initialize state for workflow
-        initial_state: ChatbotState = {
-            "messages": [],
-            "user_query": user_query,
-            "parsed_query": {},
-            "retrieved_data": None,
-            "generated_response": "",
+        # Session state for the workflow (history is carried between turns)
+        session_state = {
             "conversation_history": conversation_history,
-            "error": None,
             "session_id": session_id
         }
         
@@ -182,8 +193,10 @@ async def main(message: cl.Message):
             processing_msg.content = "🔍 Analyzing your question..."
         await processing_msg.update()
         
-        # Execute workflow
-        final_state = workflow.invoke(initial_state)
+        # Execute workflow (async, so the event loop stays free while the
+        # nodes wait on data sources and the LLM; repeated questions are
+        # answered from the response cache)
+        final_state = await arun_workflow(user_query, session_state)
         
         logger.info("Workflow execution completed")
         
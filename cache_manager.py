@@ -11,17 +11,150 @@ Requirements addressed:
 - 4.4: Implement caching to improve performance and reduce data source load
 """
 
+import atexit
+import io
 import logging
+import os
+import pickle
+import threading
 import time
 from datetime import datetime, timedelta
+from pathlib import Path
 from typing import Any, Dict, Optional, Tuple
 from collections import OrderedDict
+import numpy as np
 import pandas as pd
 import hashlib
-import json
+
+try:
+    import pyarrow as pa
+    _PYARROW_AVAILABLE = True
+except ImportError:
+    _PYARROW_AVAILABLE = False
+
+try:
+    import diskcache
+    _DISKCACHE_AVAILABLE = True
+except ImportError:
+    _DISKCACHE_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# File name of the Kaggle dataset snapshot inside the persist directory
+# (used when diskcache isn't installed)
+KAGGLE_SNAPSHOT_FILE = "kaggle.arrow"
+
+# diskcache store directory (inside the persist directory) and entry key
+# for the Kaggle dataset
+KAGGLE_STORE_DIR = "kaggle"
+KAGGLE_STORE_KEY = "kaggle:data"
+
+# Bounds on how often the background sweeper removes expired entries
+MIN_SWEEP_INTERVAL_SECONDS = 60
+MAX_SWEEP_INTERVAL_SECONDS = 15 * 60
+
+
+def _hash_df(df: pd.DataFrame) -> bytes:
+    """
+    Hash a DataFrame's column names, shape and contents.
+    
+    Uses pandas' vectorized row hashing rather than repr(), which truncates
+    large frames and ignores column names.
+    
+    Args:
+        df: DataFrame to hash
+        
+    Returns:
+        16-byte blake2b digest
+    """
+    h = hashlib.blake2b(digest_size=16)
+    h.update(str(tuple(df.columns)).encode())
+    h.update(str(df.shape).encode())
+    h.update(pd.util.hash_pandas_object(df, index=True).values.tobytes())
+    return h.digest()
+
+
+def _freeze(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Mark a DataFrame's numeric NumPy buffers read-only.
+    
+    Cached frames are shared by reference rather than defensively copied,
+    so freezing them turns an accidental in-place write by a caller into an
+    error instead of silently changing the cached data. Column assignment
+    (df[col] = ...) still works because it replaces the block.
+    
+    The large shared frames (Kaggle dataset, nflreadpy seasons) are frozen
+    in place; small per-player and per-query results are copied first, so
+    the frame the caller passed in (and goes on to return) stays writable.
+    
+    Args:
+        df: DataFrame to freeze
+        
+    Returns:
+        The same DataFrame
+    """
+    for block in df._mgr.blocks:
+        values = block.values
+        # Extension arrays (categorical, nullable ints) have no flags, and
+        # object blocks are left writable because several pandas Cython
+        # routines (e.g. memory_usage(deep=True)) reject read-only buffers
+        if isinstance(values, np.ndarray) and values.dtype != object:
+            values.flags.writeable = False
+    return df
+
+
+def _canonicalize(value: Any) -> Any:
+    """
+    Convert query parameters into a canonical, order-independent form.
+    
+    Dicts become tuples of (key, value) pairs sorted by key and lists become
+    tuples, recursively, so equal parameters always serialize identically.
+    DataFrames are replaced by their content hash (see _hash_df).
+    
+    Args:
+        value: Query parameter value
+        
+    Returns:
+        Canonical (hashable) representation of value
+    """
+    if isinstance(value, pd.DataFrame):
+        return ("__dataframe__", _hash_df(value))
+    if isinstance(value, dict):
+        return tuple(sorted((k, _canonicalize(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_canonicalize(v) for v in value)
+    return value
+
+
+def _dataframe_to_ipc(df: pd.DataFrame) -> bytes:
+    """
+    Serialize a DataFrame to Arrow IPC stream bytes.
+    
+    Args:
+        df: DataFrame to serialize
+        
+    Returns:
+        Arrow IPC stream bytes
+    """
+    table = pa.Table.from_pandas(df)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def _dataframe_from_ipc(buf: bytes) -> pd.DataFrame:
+    """
+    Deserialize a DataFrame from Arrow IPC stream bytes.
+    
+    Args:
+        buf: Bytes written by _dataframe_to_ipc
+        
+    Returns:
+        Reconstructed DataFrame
+    """
+    return pa.ipc.open_stream(buf).read_all().to_pandas(zero_copy_only=False)
+
 
 class CacheEntry:
     """
@@ -89,6 +222,7 @@ class LRUCache:
         self.cache: OrderedDict[str, CacheEntry] = OrderedDict()
         self._hits = 0
         self._misses = 0
+        self._lock = threading.RLock()
     
     def get(self, key: str) -> Optional[Any]:
         """
@@ -100,24 +234,24 @@ class LRUCache:
         Returns:
             Cached value or None if not found or expired
         """
-        if key not in self.cache:
-            self._misses += 1
-            return None
-        
-        entry = self.cache[key]
-        
-        # Check if expired
-        if entry.is_expired():
-            logger.debug(f"Cache entry expired: {key}")
-            del self.cache[key]
-            self._misses += 1
-            return None
-        
-        # Move to end (most recently used)
-        self.cache.move_to_end(key)
-        self._hits += 1
-        
-        return entry.access()
+        with self._lock:
+            entry = self.cache.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            
+            # Check if expired
+            if entry.is_expired():
+                logger.debug(f"Cache entry expired: {key}")
+                del self.cache[key]
+                self._misses += 1
+                return None
+            
+            # Move to end (most recently used)
+            self.cache.move_to_end(key)
+            self._hits += 1
+            
+            return entry.access()
     
     def set(
         self,
@@ -135,23 +269,20 @@ class LRUCache:
             ttl: Time-to-live for this entry
             tags: Optional metadata tags
         """
-        # Remove existing entry if present
-        if key in self.cache:
-            del self.cache[key]
-        
-        # Check capacity and evict if necessary
-        if len(self.cache) >= self.capacity:
-            # Remove least recently used (first item)
-            evicted_key, evicted_entry = self.cache.popitem(last=False)
-            logger.debug(
-                f"Cache capacity reached. Evicted: {evicted_key} "
-                f"(age: {evicted_entry.age()}, accesses: {evicted_entry.access_count})"
-            )
-        
-        # Add new entry
-        entry = CacheEntry(value, ttl=ttl, tags=tags)
-        self.cache[key] = entry
-        logger.debug(f"Cache entry added: {key} (TTL: {ttl})")
+        with self._lock:
+            # Add or replace the entry as most recently used
+            self.cache[key] = CacheEntry(value, ttl=ttl, tags=tags)
+            self.cache.move_to_end(key)
+            logger.debug(f"Cache entry added: {key} (TTL: {ttl})")
+            
+            # Check capacity and evict if necessary
+            while len(self.cache) > self.capacity:
+                # Remove least recently used (first item)
+                evicted_key, evicted_entry = self.cache.popitem(last=False)
+                logger.debug(
+                    f"Cache capacity reached. Evicted: {evicted_key} "
+                    f"(age: {evicted_entry.age()}, accesses: {evicted_entry.access_count})"
+                )
     
     def delete(self, key: str) -> bool:
         """
@@ -163,19 +294,21 @@ class LRUCache:
         Returns:
             True if entry was deleted, False if not found
         """
-        if key in self.cache:
-            del self.cache[key]
-            logger.debug(f"Cache entry deleted: {key}")
-            return True
-        return False
+        with self._lock:
+            if key in self.cache:
+                del self.cache[key]
+                logger.debug(f"Cache entry deleted: {key}")
+                return True
+            return False
     
     def clear(self):
         """Clear all entries from cache."""
-        count = len(self.cache)
-        self.cache.clear()
-        self._hits = 0
-        self._misses = 0
-        logger.info(f"Cache cleared ({count} entries removed)")
+        with self._lock:
+            count = len(self.cache)
+            self.cache.clear()
+            self._hits = 0
+            self._misses = 0
+            logger.info(f"Cache cleared ({count} entries removed)")
     
     def invalidate_by_tag(self, tag_key: str, tag_value: Any) -> int:
         """
@@ -188,22 +321,23 @@ class LRUCache:
         Returns:
             Number of entries invalidated
         """
-        keys_to_delete = []
-        
-        for key, entry in self.cache.items():
-            if entry.tags.get(tag_key) == tag_value:
-                keys_to_delete.append(key)
-        
-        for key in keys_to_delete:
-            del self.cache[key]
-        
-        if keys_to_delete:
-            logger.info(
-                f"Invalidated {len(keys_to_delete)} cache entries "
-                f"with tag {tag_key}={tag_value}"
-            )
-        
-        return len(keys_to_delete)
+        with self._lock:
+            keys_to_delete = []
+            
+            for key, entry in self.cache.items():
+                if entry.tags.get(tag_key) == tag_value:
+                    keys_to_delete.append(key)
+            
+            for key in keys_to_delete:
+                del self.cache[key]
+            
+            if keys_to_delete:
+                logger.info(
+                    f"Invalidated {len(keys_to_delete)} cache entries "
+                    f"with tag {tag_key}={tag_value}"
+                )
+            
+            return len(keys_to_delete)
     
     def get_stats(self) -> Dict[str, Any]:
         """
@@ -212,20 +346,21 @@ class LRUCache:
         Returns:
             Dictionary with cache statistics
         """
-        total_requests = self._hits + self._misses
-        hit_rate = (self._hits / total_requests * 100) if total_requests > 0 else 0
-        
-        # Count expired entries
-        expired_count = sum(1 for entry in self.cache.values() if entry.is_expired())
-        
-        return {
-            "size": len(self.cache),
-            "capacity": self.capacity,
-            "hits": self._hits,
-            "misses": self._misses,
-            "hit_rate": round(hit_rate, 2),
-            "expired_entries": expired_count
-        }
+        with self._lock:
+            total_requests = self._hits + self._misses
+            hit_rate = (self._hits / total_requests * 100) if total_requests > 0 else 0
+            
+            # Count expired entries
+            expired_count = sum(1 for entry in self.cache.values() if entry.is_expired())
+            
+            return {
+                "size": len(self.cache),
+                "capacity": self.capacity,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": round(hit_rate, 2),
+                "expired_entries": expired_count
+            }
     
     def cleanup_expired(self) -> int:
         """
@@ -234,18 +369,19 @@ class LRUCache:
         Returns:
             Number of entries removed
         """
-        keys_to_delete = [
-            key for key, entry in self.cache.items()
-            if entry.is_expired()
-        ]
-        
-        for key in keys_to_delete:
-            del self.cache[key]
-        
-        if keys_to_delete:
-            logger.info(f"Cleaned up {len(keys_to_delete)} expired cache entries")
-        
-        return len(keys_to_delete)
+        with self._lock:
+            keys_to_delete = [
+                key for key, entry in self.cache.items()
+                if entry.is_expired()
+            ]
+            
+            for key in keys_to_delete:
+                del self.cache[key]
+            
+            if keys_to_delete:
+                logger.info(f"Cleaned up {len(keys_to_delete)} expired cache entries")
+            
+            return len(keys_to_delete)
 
 
 class CacheManager:
@@ -263,7 +399,8 @@ class CacheManager:
         kaggle_cache_enabled: bool = True,
         nflreadpy_ttl_hours: int = 24,
         query_cache_capacity: int = 100,
-        query_cache_ttl_hours: int = 1
+        query_cache_ttl_hours: int = 1,
+        persist_dir: Optional[str] = None
     ):
         """
         Initialize the cache manager.
@@ -273,21 +410,47 @@ class CacheManager:
             nflreadpy_ttl_hours: TTL for nflreadpy data in hours
             query_cache_capacity: Maximum number of query results to cache
             query_cache_ttl_hours: TTL for query cache in hours
+            persist_dir: Directory for the on-disk Kaggle dataset store
+                (diskcache, or an Arrow IPC snapshot file when diskcache
+                isn't installed). None disables persistence.
         """
         self.kaggle_cache_enabled = kaggle_cache_enabled
         self.nflreadpy_ttl = timedelta(hours=nflreadpy_ttl_hours)
         self.query_cache_ttl = timedelta(hours=query_cache_ttl_hours)
+        self.persist_dir = persist_dir
         
         # Kaggle dataset cache (single entry, no expiration)
         self._kaggle_data: Optional[pd.DataFrame] = None
         self._kaggle_loaded_at: Optional[datetime] = None
         
+        # On-disk Kaggle store that survives restarts (SQLite-backed)
+        self._kaggle_store = None
+        if kaggle_cache_enabled and persist_dir is not None and _DISKCACHE_AVAILABLE:
+            self._kaggle_store = diskcache.Cache(os.path.join(persist_dir, KAGGLE_STORE_DIR))
+        
         # nflreadpy data cache (TTL-based)
         self._nflreadpy_cache: Dict[str, CacheEntry] = {}
+        self._lock = threading.RLock()
         
         # Query results cache (LRU with TTL)
         self._query_cache = LRUCache(capacity=query_cache_capacity)
         
+        # Background sweeper removing expired entries at a quarter of the
+        # shortest TTL, so dead entries don't linger until their next access
+        shortest_ttl = min(self.nflreadpy_ttl, self.query_cache_ttl).total_seconds()
+        self._sweep_interval = min(
+            max(shortest_ttl / 4, MIN_SWEEP_INTERVAL_SECONDS),
+            MAX_SWEEP_INTERVAL_SECONDS
+        )
+        self._stop = threading.Event()
+        self._sweeper = threading.Thread(
+            target=self._sweep_loop,
+            name="cache-sweeper",
+            daemon=True
+        )
+        self._sweeper.start()
+        atexit.register(self.close)
+        
         logger.info(
             f"CacheManager initialized: "
             f"Kaggle={kaggle_cache_enabled}, "
@@ -296,6 +459,26 @@ class CacheManager:
             f"query_ttl={query_cache_ttl_hours}h"
         )
     
+    def _sweep_loop(self):
+        """Periodically remove expired entries until close() is called."""
+        while not self._stop.wait(self._sweep_interval):
+            try:
+                self.cleanup_expired()
+            except Exception as e:
+                logger.warning(f"Cache sweep failed: {e}")
+    
+    def close(self):
+        """Stop the background sweeper thread and close the on-disk store."""
+        if self._stop.is_set():
+            return
+        self._stop.set()
+        if self._sweeper is not threading.current_thread():
+            self._sweeper.join(timeout=1)
+        if self._kaggle_store is not None:
+            self._kaggle_store.close()
+        atexit.unregister(self.close)
+        logger.debug("Cache sweeper stopped")
+    
     # Kaggle Dataset Cache Methods
     
     def get_kaggle_data(self) -> Optional[pd.DataFrame]:
@@ -312,6 +495,13 @@ class CacheManager:
             logger.debug("Returning cached Kaggle dataset")
             return self._kaggle_data
         
+        # Fall back to the snapshot persisted by a previous run
+        snapshot = self._load_kaggle_snapshot()
+        if snapshot is not None:
+            self._kaggle_data = snapshot
+            self._kaggle_loaded_at = datetime.now()
+            return snapshot
+        
         return None
     
     def set_kaggle_data(self, data: pd.DataFrame):
@@ -325,20 +515,93 @@ class CacheManager:
             logger.debug("Kaggle caching disabled, skipping cache")
             return
         
-        self._kaggle_data = data
+        self._kaggle_data = _freeze(data)
         self._kaggle_loaded_at = datetime.now()
         
         logger.info(
             f"Kaggle dataset cached: {len(data)} records, "
             f"{data.memory_usage(deep=True).sum() / 1024 / 1024:.2f} MB"
         )
+        
+        self._save_kaggle_snapshot(data)
+    
+    def _kaggle_snapshot_path(self) -> Optional[Path]:
+        """Path of the persisted Kaggle snapshot, or None if persistence is off."""
+        if self.persist_dir is None or not _PYARROW_AVAILABLE:
+            return None
+        return Path(self.persist_dir) / KAGGLE_SNAPSHOT_FILE
+    
+    def _save_kaggle_snapshot(self, data: pd.DataFrame):
+        """
+        Persist the Kaggle dataset to the on-disk store.
+        
+        Stored as Arrow IPC bytes when pyarrow is installed.
+        
+        Args:
+            data: Kaggle dataset DataFrame
+        """
+        try:
+            if self._kaggle_store is not None:
+                self._kaggle_store[KAGGLE_STORE_KEY] = (
+                    _dataframe_to_ipc(data) if _PYARROW_AVAILABLE else data
+                )
+                logger.info(f"Kaggle dataset persisted to {self._kaggle_store.directory}")
+                return
+            
+            path = self._kaggle_snapshot_path()
+            if path is None:
+                return
+            
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(".tmp")
+            tmp_path.write_bytes(_dataframe_to_ipc(data))
+            os.replace(tmp_path, path)
+            logger.info(f"Kaggle dataset snapshot written to {path}")
+        except Exception as e:
+            logger.warning(f"Failed to persist Kaggle dataset snapshot: {e}")
+    
+    def _load_kaggle_snapshot(self) -> Optional[pd.DataFrame]:
+        """
+        Load the persisted Kaggle dataset, if one exists.
+        
+        Returns:
+            DataFrame from the on-disk store, or None
+        """
+        try:
+            if self._kaggle_store is not None:
+                stored = self._kaggle_store.get(KAGGLE_STORE_KEY)
+                if stored is None:
+                    return None
+                data = _dataframe_from_ipc(stored) if isinstance(stored, bytes) else stored
+                source = self._kaggle_store.directory
+            else:
+                path = self._kaggle_snapshot_path()
+                if path is None or not path.exists():
+                    return None
+                data = _dataframe_from_ipc(path.read_bytes())
+                source = path
+            
+            logger.info(f"Loaded persisted Kaggle dataset from {source}: {len(data)} records")
+            return data
+        except Exception as e:
+            logger.warning(f"Failed to load Kaggle dataset snapshot: {e}")
+            return None
     
     def clear_kaggle_cache(self):
-        """Clear the Kaggle dataset cache."""
+        """Clear the Kaggle dataset cache, including any persisted copy."""
         if self._kaggle_data is not None:
             logger.info("Clearing Kaggle dataset cache")
             self._kaggle_data = None
             self._kaggle_loaded_at = None
+        
+        if self._kaggle_store is not None:
+            self._kaggle_store.clear()
+            logger.info(f"Cleared Kaggle store {self._kaggle_store.directory}")
+        
+        path = self._kaggle_snapshot_path()
+        if path is not None and path.exists():
+            path.unlink()
+            logger.info(f"Removed Kaggle dataset snapshot {path}")
     
     def get_kaggle_cache_info(self) -> Dict[str, Any]:
         """
@@ -390,23 +653,25 @@ class CacheManager:
             week: Week number
             
         Returns:
-            Cached DataFrame or None if not cached or expired
+            Cached DataFrame (read-only; copy before modifying) or None if
+            not cached or expired
         """
-        key = self._make_nflreadpy_key(player_name, season, week)
-        
-        if key not in self._nflreadpy_cache:
-            return None
-        
-        entry = self._nflreadpy_cache[key]
-        
-        # Check if expired
-        if entry.is_expired():
-            logger.debug(f"nflreadpy cache entry expired: {key}")
-            del self._nflreadpy_cache[key]
-            return None
-        
-        logger.debug(f"Returning cached nflreadpy data: {key}")
-        return entry.access()
+        with self._lock:
+            key = self._make_nflreadpy_key(player_name, season, week)
+            
+            if key not in self._nflreadpy_cache:
+                return None
+            
+            entry = self._nflreadpy_cache[key]
+            
+            # Check if expired
+            if entry.is_expired():
+                logger.debug(f"nflreadpy cache entry expired: {key}")
+                del self._nflreadpy_cache[key]
+                return None
+            
+            logger.debug(f"Returning cached nflreadpy data: {key}")
+            return entry.access()
     
     def set_nflreadpy_data(
         self,
@@ -424,24 +689,92 @@ class CacheManager:
             season: Season year
             week: Week number
         """
-        key = self._make_nflreadpy_key(player_name, season, week)
+        with self._lock:
+            key = self._make_nflreadpy_key(player_name, season, week)
+            
+            entry = CacheEntry(
+                data=_freeze(data.copy()),
+                ttl=self.nflreadpy_ttl,
+                tags={
+                    "source": "nflreadpy",
+                    "player": player_name,
+                    "season": season
+                }
+            )
+            
+            self._nflreadpy_cache[key] = entry
+            
+            logger.debug(
+                f"nflreadpy data cached: {key} "
+                f"(TTL: {self.nflreadpy_ttl}, records: {len(data)})"
+            )
+    
+    def get_nflreadpy_season_data(self, season: int) -> Optional[pd.DataFrame]:
+        """
+        Get the cached full-season nflreadpy DataFrame.
         
-        entry = CacheEntry(
-            data=data,
-            ttl=self.nflreadpy_ttl,
-            tags={
-                "source": "nflreadpy",
-                "player": player_name,
-                "season": season
-            }
-        )
+        Args:
+            season: Season year
+            
+        Returns:
+            Cached DataFrame or None if not cached or expired
+        """
+        with self._lock:
+            key = f"nflreadpy:season:{season}"
+            
+            if key not in self._nflreadpy_cache:
+                return None
+            
+            entry = self._nflreadpy_cache[key]
+            
+            if entry.is_expired():
+                logger.debug(f"nflreadpy cache entry expired: {key}")
+                del self._nflreadpy_cache[key]
+                return None
+            
+            logger.debug(f"Returning cached nflreadpy season data: {key}")
+            return entry.access()
+    
+    def has_nflreadpy_season_data(self, season: int) -> bool:
+        """
+        Check for an unexpired full-season nflreadpy DataFrame.
         
-        self._nflreadpy_cache[key] = entry
+        Unlike get_nflreadpy_season_data(), this doesn't count as an access.
         
-        logger.debug(
-            f"nflreadpy data cached: {key} "
-            f"(TTL: {self.nflreadpy_ttl}, records: {len(data)})"
-        )
+        Args:
+            season: Season year
+            
+        Returns:
+            True if the season is cached and not expired
+        """
+        with self._lock:
+            entry = self._nflreadpy_cache.get(f"nflreadpy:season:{season}")
+            return entry is not None and not entry.is_expired()
+    
+    def set_nflreadpy_season_data(self, season: int, data: pd.DataFrame):
+        """
+        Cache the full-season nflreadpy DataFrame with TTL.
+        
+        Args:
+            season: Season year
+            data: Season DataFrame to cache
+        """
+        with self._lock:
+            key = f"nflreadpy:season:{season}"
+            
+            self._nflreadpy_cache[key] = CacheEntry(
+                data=_freeze(data),
+                ttl=self.nflreadpy_ttl,
+                tags={
+                    "source": "nflreadpy",
+                    "season": season
+                }
+            )
+            
+            logger.debug(
+                f"nflreadpy season data cached: {key} "
+                f"(TTL: {self.nflreadpy_ttl}, records: {len(data)})"
+            )
     
     def invalidate_nflreadpy_player(self, player_name: str) -> int:
         """
@@ -453,21 +786,22 @@ class CacheManager:
         Returns:
             Number of entries invalidated
         """
-        keys_to_delete = [
-            key for key, entry in self._nflreadpy_cache.items()
-            if entry.tags.get("player") == player_name
-        ]
-        
-        for key in keys_to_delete:
-            del self._nflreadpy_cache[key]
-        
-        if keys_to_delete:
-            logger.info(
-                f"Invalidated {len(keys_to_delete)} nflreadpy cache entries "
-                f"for player: {player_name}"
-            )
-        
-        return len(keys_to_delete)
+        with self._lock:
+            keys_to_delete = [
+                key for key, entry in self._nflreadpy_cache.items()
+                if entry.tags.get("player") == player_name
+            ]
+            
+            for key in keys_to_delete:
+                del self._nflreadpy_cache[key]
+            
+            if keys_to_delete:
+                logger.info(
+                    f"Invalidated {len(keys_to_delete)} nflreadpy cache entries "
+                    f"for player: {player_name}"
+                )
+            
+            return len(keys_to_delete)
     
     def invalidate_nflreadpy_season(self, season: int) -> int:
         """
@@ -479,27 +813,29 @@ class CacheManager:
         Returns:
             Number of entries invalidated
         """
-        keys_to_delete = [
-            key for key, entry in self._nflreadpy_cache.items()
-            if entry.tags.get("season") == season
-        ]
-        
-        for key in keys_to_delete:
-            del self._nflreadpy_cache[key]
-        
-        if keys_to_delete:
-            logger.info(
-                f"Invalidated {len(keys_to_delete)} nflreadpy cache entries "
-                f"for season: {season}"
-            )
-        
-        return len(keys_to_delete)
+        with self._lock:
+            keys_to_delete = [
+                key for key, entry in self._nflreadpy_cache.items()
+                if entry.tags.get("season") == season
+            ]
+            
+            for key in keys_to_delete:
+                del self._nflreadpy_cache[key]
+            
+            if keys_to_delete:
+                logger.info(
+                    f"Invalidated {len(keys_to_delete)} nflreadpy cache entries "
+                    f"for season: {season}"
+                )
+            
+            return len(keys_to_delete)
     
     def clear_nflreadpy_cache(self):
         """Clear all nflreadpy cache entries."""
-        count = len(self._nflreadpy_cache)
-        self._nflreadpy_cache.clear()
-        logger.info(f"nflreadpy cache cleared ({count} entries removed)")
+        with self._lock:
+            count = len(self._nflreadpy_cache)
+            self._nflreadpy_cache.clear()
+            logger.info(f"nflreadpy cache cleared ({count} entries removed)")
     
     def cleanup_nflreadpy_expired(self) -> int:
         """
@@ -508,20 +844,21 @@ class CacheManager:
         Returns:
             Number of entries removed
         """
-        keys_to_delete = [
-            key for key, entry in self._nflreadpy_cache.items()
-            if entry.is_expired()
-        ]
-        
-        for key in keys_to_delete:
-            del self._nflreadpy_cache[key]
-        
-        if keys_to_delete:
-            logger.info(
-                f"Cleaned up {len(keys_to_delete)} expired nflreadpy cache entries"
-            )
-        
-        return len(keys_to_delete)
+        with self._lock:
+            keys_to_delete = [
+                key for key, entry in self._nflreadpy_cache.items()
+                if entry.is_expired()
+            ]
+            
+            for key in keys_to_delete:
+                del self._nflreadpy_cache[key]
+            
+            if keys_to_delete:
+                logger.info(
+                    f"Cleaned up {len(keys_to_delete)} expired nflreadpy cache entries"
+                )
+            
+            return len(keys_to_delete)
     
     # Query Results Cache Methods
     
@@ -535,10 +872,14 @@ class CacheManager:
         Returns:
             Cache key string
         """
-        # Create a stable hash of query parameters
-        # Sort keys to ensure consistent hashing
-        sorted_params = json.dumps(query_params, sort_keys=True)
-        hash_obj = hashlib.md5(sorted_params.encode())
+        # Hash a binary pickle of the canonical parameters. Fast mode turns
+        # off the pickle memo, whose output depends on object identity
+        # (two equal but distinct strings would otherwise pickle differently).
+        buffer = io.BytesIO()
+        pickler = pickle.Pickler(buffer, protocol=5)
+        pickler.fast = True
+        pickler.dump(_canonicalize(query_params))
+        hash_obj = hashlib.blake2b(buffer.getvalue(), digest_size=16)
         return f"query:{hash_obj.hexdigest()}"
     
     def get_query_result(self, query_params: Dict[str, Any]) -> Optional[pd.DataFrame]:
@@ -549,7 +890,8 @@ class CacheManager:
             query_params: Query parameters
             
         Returns:
-            Cached DataFrame or None if not cached or expired
+            Cached DataFrame (read-only; copy before modifying) or None if
+            not cached or expired
         """
         key = self._make_query_key(query_params)
         result = self._query_cache.get(key)
@@ -575,7 +917,7 @@ class CacheManager:
         
         self._query_cache.set(
             key=key,
-            value=result,
+            value=_freeze(result.copy()),
             ttl=self.query_cache_ttl,
             tags={
                 "type": "query_result",
@@ -682,7 +1024,8 @@ def initialize_cache_manager(
     kaggle_cache_enabled: bool = True,
     nflreadpy_ttl_hours: int = 24,
     query_cache_capacity: int = 100,
-    query_cache_ttl_hours: int = 1
+    query_cache_ttl_hours: int = 1,
+    persist_dir: Optional[str] = None
 ) -> CacheManager:
     """
     Initialize the global cache manager with custom settings.
@@ -692,17 +1035,23 @@ def initialize_cache_manager(
         nflreadpy_ttl_hours: TTL for nflreadpy data
         query_cache_capacity: Query cache capacity
         query_cache_ttl_hours: TTL for query cache
+        persist_dir: Directory for the on-disk Kaggle dataset snapshot
         
     Returns:
         Initialized CacheManager instance
     """
     global _cache_manager
     
+    # Stop the replaced manager's sweeper thread
+    if _cache_manager is not None:
+        _cache_manager.close()
+    
     _cache_manager = CacheManager(
         kaggle_cache_enabled=kaggle_cache_enabled,
         nflreadpy_ttl_hours=nflreadpy_ttl_hours,
         query_cache_capacity=query_cache_capacity,
-        query_cache_ttl_hours=query_cache_ttl_hours
+        query_cache_ttl_hours=query_cache_ttl_hours,
+        persist_dir=persist_dir
     )
     
     logger.info("Global cache manager initialized with custom settings")
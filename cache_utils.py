@@ -5,8 +5,11 @@ This module provides utility functions for managing and monitoring
 the cache system, including cache warming, cleanup, and statistics.
 """
 
+import asyncio
 import logging
-from typing import Dict, Any
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional
 import pandas as pd
 
 from cache_manager import get_cache_manager, initialize_cache_manager
@@ -63,6 +66,107 @@ def warm_kaggle_cache(data_path: str = None) -> bool:
         return False
 
 
+def warm_nflreadpy_cache(season: Optional[int] = None, refresh: bool = False) -> bool:
+    """
+    Pre-load the current season's nflreadpy player stats into cache.
+    
+    Fetching a season from nflreadpy is the slowest part of the first
+    current-season query, so warming it up front makes that query a
+    cache hit.
+    
+    Args:
+        season: Season to load (defaults to the current NFL season)
+        refresh: Drop any cached entries for the season and re-fetch
+        
+    Returns:
+        True if cache was warmed successfully, False otherwise
+    """
+    try:
+        from data_sources.base import current_nfl_season
+        from data_sources.nflreadpy_source import NFLReadPyDataSource
+        
+        if season is None:
+            season = current_nfl_season()
+        
+        logger.info(f"Warming nflreadpy cache for season {season}...")
+        
+        if refresh:
+            get_cache_manager().invalidate_nflreadpy_season(season)
+        
+        nflreadpy_source = NFLReadPyDataSource()
+        if not nflreadpy_source.is_available():
+            logger.warning("nflreadpy not available, skipping cache warming")
+            return False
+        
+        df = nflreadpy_source.get_season_stats(season)
+        logger.info(f"nflreadpy cache warmed successfully: {len(df)} records")
+        return True
+        
+    except Exception as e:
+        logger.error(f"Error warming nflreadpy cache: {e}")
+        return False
+
+
+def warm_caches(
+    kaggle_path: Optional[str] = None,
+    warm_kaggle: bool = True,
+    warm_nflreadpy: bool = True
+) -> Dict[str, bool]:
+    """
+    Warm the Kaggle and nflreadpy caches concurrently.
+    
+    The Kaggle load is disk-bound and the nflreadpy fetch is network-bound,
+    so running them on separate threads makes startup take as long as the
+    slower of the two rather than their sum.
+    
+    Args:
+        kaggle_path: Path to Kaggle dataset (optional)
+        warm_kaggle: Whether to warm the Kaggle cache
+        warm_nflreadpy: Whether to warm the nflreadpy cache
+        
+    Returns:
+        Dictionary mapping each warmed cache ("kaggle", "nflreadpy") to
+        whether it was warmed successfully
+    """
+    tasks = {}
+    if warm_kaggle:
+        tasks["kaggle"] = (warm_kaggle_cache, kaggle_path)
+    if warm_nflreadpy:
+        tasks["nflreadpy"] = (warm_nflreadpy_cache,)
+    
+    if not tasks:
+        return {}
+    
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=len(tasks)) as executor:
+        futures = {
+            name: executor.submit(func, *args)
+            for name, (func, *args) in tasks.items()
+        }
+        results = {name: future.result() for name, future in futures.items()}
+    
+    logger.info(
+        f"Cache warming finished in {time.perf_counter() - start:.2f}s: {results}"
+    )
+    return results
+
+
+async def refresh_nflreadpy_cache_periodically(interval_hours: float = 12):
+    """
+    Periodically reload the current season's nflreadpy data.
+    
+    app.py schedules this once on Chainlit's event loop, every
+    NFLREADPY_REFRESH_INTERVAL_HOURS. The blocking fetch runs in a worker
+    thread.
+    
+    Args:
+        interval_hours: Refresh interval in hours
+    """
+    while True:
+        await asyncio.sleep(interval_hours * 3600)
+        await asyncio.to_thread(warm_nflreadpy_cache, None, True)
+
+
 def get_cache_statistics() -> Dict[str, Any]:
     """
     Get comprehensive cache statistics.
@@ -193,7 +297,8 @@ def configure_cache(
     kaggle_cache_enabled: bool = True,
     nflreadpy_ttl_hours: int = 24,
     query_cache_capacity: int = 100,
-    query_cache_ttl_hours: int = 1
+    query_cache_ttl_hours: int = 1,
+    persist_dir: Optional[str] = None
 ):
     """
     Configure the cache manager with custom settings.
@@ -206,6 +311,8 @@ def configure_cache(
         nflreadpy_ttl_hours: TTL for nflreadpy data in hours
         query_cache_capacity: Maximum number of query results to cache
         query_cache_ttl_hours: TTL for query cache in hours
+        persist_dir: Directory for the on-disk Kaggle dataset snapshot
+            (None disables persistence)
     """
     logger.info("Configuring cache manager...")
     
@@ -213,7 +320,8 @@ def configure_cache(
         kaggle_cache_enabled=kaggle_cache_enabled,
         nflreadpy_ttl_hours=nflreadpy_ttl_hours,
         query_cache_capacity=query_cache_capacity,
-        query_cache_ttl_hours=query_cache_ttl_hours
+        query_cache_ttl_hours=query_cache_ttl_hours,
+        persist_dir=persist_dir
     )
     
     logger.info(
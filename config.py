@@ -124,11 +124,20 @@ class CacheConfig:
     warm_kaggle_cache_on_startup: bool = field(
         default_factory=lambda: os.getenv("WARM_KAGGLE_CACHE_ON_STARTUP", "true").lower() == "true"
     )
+    persist_kaggle_cache: bool = field(
+        default_factory=lambda: os.getenv("PERSIST_KAGGLE_CACHE", "false").lower() == "true"
+    )
     
     # nflreadpy cache configuration
     nflreadpy_cache_ttl_hours: int = field(
         default_factory=lambda: int(os.getenv("NFLREADPY_CACHE_TTL_HOURS", "24"))
     )
+    warm_nflreadpy_cache_on_startup: bool = field(
+        default_factory=lambda: os.getenv("WARM_NFLREADPY_CACHE_ON_STARTUP", "true").lower() == "true"
+    )
+    nflreadpy_refresh_interval_hours: float = field(
+        default_factory=lambda: float(os.getenv("NFLREADPY_REFRESH_INTERVAL_HOURS", "12"))
+    )
     
     # Query cache configuration
     query_cache_capacity: int = field(
@@ -256,6 +265,8 @@ class AppConfig:
             raise ValueError("QUERY_CACHE_CAPACITY must be positive")
         if self.cache.nflreadpy_cache_ttl_hours < 1:
             raise ValueError("NFLREADPY_CACHE_TTL_HOURS must be positive")
+        if self.cache.nflreadpy_refresh_interval_hours < 0:
+            raise ValueError("NFLREADPY_REFRESH_INTERVAL_HOURS must not be negative")
         
         # Validate memory settings
         if self.memory.max_history_turns < 1:
@@ -387,6 +398,7 @@ def print_config(config: Optional[AppConfig] = None) -> None:
     print("\n[Cache Configuration]")
     print(f"  Kaggle Cache Enabled: {config.cache.kaggle_cache_enabled}")
     print(f"  Warm Cache on Startup: {config.cache.warm_kaggle_cache_on_startup}")
+    print(f"  Persist Kaggle Cache: {config.cache.persist_kaggle_cache}")
     print(f"  NFLReadPy Cache TTL: {config.cache.nflreadpy_cache_ttl_hours}h")
     print(f"  Query Cache Capacity: {config.cache.query_cache_capacity}")
     print(f"  Query Cache TTL: {config.cache.query_cache_ttl_hours}h")
@@ -0,0 +1,42 @@
+"""
+One-time conversion of the Kaggle CSV dataset to Parquet.
+
+Loads the CSV through KaggleDataSource (so the output is already validated
+and normalized) and writes it under <data_dir>/parquet, partitioned by
+season. KaggleDataSource picks up the Parquet copy automatically when
+pyarrow is installed.
+
+Usage:
+    python convert_kaggle_to_parquet.py [data_dir]
+"""
+
+import sys
+from pathlib import Path
+
+from data_sources.kaggle_source import KaggleDataSource, PARQUET_DIR_NAME
+
+
+def convert(data_dir: str = "data/kaggle") -> Path:
+    """
+    Convert the Kaggle CSV dataset to a season-partitioned Parquet dataset.
+    
+    Args:
+        data_dir: Kaggle dataset directory containing the CSV file
+        
+    Returns:
+        Path of the written Parquet directory
+    """
+    source = KaggleDataSource(data_path=data_dir)
+    df = source._load_data()
+    
+    # player_name_normalized is derived again on load
+    df = df.drop(columns=['player_name_normalized'], errors='ignore')
+    
+    output_dir = Path(data_dir) / PARQUET_DIR_NAME
+    df.to_parquet(output_dir, engine='pyarrow', partition_cols=['season'], index=False)
+    print(f"Wrote {len(df)} records to {output_dir}")
+    return output_dir
+
+
+if __name__ == "__main__":
+    convert(sys.argv[1] if len(sys.argv) > 1 else "data/kaggle")
@@ -7,7 +7,7 @@ This package contains data source adapters for:
 - ESPN API as supplementary source
 """
 
-from data_sources.base import DataSource
+from data_sources.base import DataSource, current_nfl_season
 from data_sources.espn_source import ESPNDataSource
 from data_sources.kaggle_source import KaggleDataSource
 from data_sources.nflreadpy_source import NFLReadPyDataSource
@@ -17,4 +17,5 @@ __all__ = [
     'KaggleDataSource',
     'NFLReadPyDataSource',
     'ESPNDataSource',
+    'current_nfl_season',
 ]
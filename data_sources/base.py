@@ -6,11 +6,30 @@ ensuring consistent data retrieval across different sources (Kaggle, nflreadpy,
 """
 
 from abc import ABC, abstractmethod
+from datetime import date
 from typing import List, Optional
 
 import pandas as pd
 
 
+def current_nfl_season(today: Optional[date] = None) -> int:
+    """
+    Get the NFL season in progress (or most recently finished) on a date.
+    
+    A season runs into the following calendar year, through the playoffs in
+    January and February, so before March the previous year's season is
+    still the current one.
+    
+    Args:
+        today: Date to evaluate (defaults to today)
+        
+    Returns:
+        Season year
+    """
+    today = today or date.today()
+    return today.year - 1 if today.month < 3 else today.year
+
+
 class DataSource(ABC):
     """
     Abstract base class for NFL player statistics data sources.
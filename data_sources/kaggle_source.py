@@ -3,6 +3,10 @@ Kaggle dataset data source implementation.
 
 This module provides access to the Kaggle NFL Player Stats dataset (1999-2023)
 using Pandas for efficient data loading and querying.
+
+When a Parquet copy of the dataset exists (see convert_kaggle_to_parquet.py)
+and pyarrow is installed, it is preferred over the CSV so season and player
+filters can be pushed down to the file scan.
 """
 
 import logging
@@ -14,8 +18,19 @@ import pandas as pd
 
 from data_sources.base import DataSource
 
+try:
+    import pyarrow.dataset as pa_ds
+    _PYARROW_AVAILABLE = True
+except ImportError:
+    pa_ds = None
+    _PYARROW_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Subdirectory of the Kaggle data directory holding the season-partitioned
+# Parquet copy of the dataset
+PARQUET_DIR_NAME = "parquet"
+
 # Import cache manager (lazy import to avoid circular dependencies)
 _cache_manager = None
 
@@ -49,6 +64,68 @@ class KaggleDataSource(DataSource):
         self.data_path = data_path or os.path.join("data", "kaggle")
         self._data_cache: Optional[pd.DataFrame] = None
         self._is_loaded = False
+        self._dataset = None
+    
+    def _get_parquet_path(self) -> Optional[Path]:
+        """
+        Locate the Parquet copy of the dataset, if one exists.
+        
+        Returns:
+            Path to a .parquet file or partitioned Parquet directory, or None
+        """
+        path = Path(self.data_path)
+        if path.is_file():
+            return path if path.suffix == ".parquet" else None
+        parquet_dir = path / PARQUET_DIR_NAME
+        if parquet_dir.is_dir() and any(parquet_dir.iterdir()):
+            return parquet_dir
+        return None
+    
+    def _get_dataset(self):
+        """
+        Open the Parquet dataset for filtered scans.
+        
+        Returns:
+            pyarrow Dataset, or None if pyarrow or the Parquet copy is unavailable
+        """
+        if self._dataset is None and _PYARROW_AVAILABLE:
+            parquet_path = self._get_parquet_path()
+            if parquet_path is not None:
+                self._dataset = pa_ds.dataset(
+                    str(parquet_path), format="parquet", partitioning="hive"
+                )
+        return self._dataset
+    
+    def _scan_dataset(self, player_name: str, season: Optional[int]) -> pd.DataFrame:
+        """
+        Read one player's rows from the Parquet dataset.
+        
+        The player and season filters are pushed down to pyarrow, so
+        non-matching season partitions and row groups are never read.
+        
+        Args:
+            player_name: Normalized player name
+            season: NFL season year, or None for all seasons
+            
+        Returns:
+            DataFrame containing the matching rows
+            
+        Raises:
+            ValueError: If season is out of range for the dataset
+        """
+        condition = pa_ds.field("player_name") == player_name
+        if season is not None:
+            from validators import validate_season
+            try:
+                season = validate_season(season, strict=True)
+            except Exception:
+                raise ValueError(
+                    f"Season {season} out of range for Kaggle dataset (1999-2023)"
+                )
+            condition = condition & (pa_ds.field("season") == season)
+        
+        table = self._get_dataset().to_table(filter=condition)
+        return table.to_pandas()
         
     def _load_data(self) -> pd.DataFrame:
         """
@@ -75,6 +152,20 @@ class KaggleDataSource(DataSource):
             return cached_data
         
         try:
+            # Prefer the Parquet copy (already validated when it was written)
+            dataset = self._get_dataset()
+            if dataset is not None:
+                logger.info(f"Loading Kaggle dataset from {self._get_parquet_path()}")
+                df = dataset.to_table().to_pandas()
+                if 'player_name' in df.columns:
+                    df['player_name_normalized'] = df['player_name']
+                
+                self._data_cache = df
+                self._is_loaded = True
+                logger.info(f"Loaded {len(df)} records from Kaggle dataset")
+                cache.set_kaggle_data(df)
+                return df
+            
             # Check if data_path is a file or directory
             path = Path(self.data_path)
             
@@ -160,18 +251,27 @@ class KaggleDataSource(DataSource):
             Exception: For data retrieval errors
         """
         try:
-            df = self._load_data()
-            
             # Normalize player name for lookup
             normalized_name = self.normalize_player_name(player_name)
             
-            # Filter by player name
-            if 'player_name_normalized' in df.columns:
-                result = df[df['player_name_normalized'] == normalized_name].copy()
-            elif 'player_name' in df.columns:
-                result = df[df['player_name'].str.strip().str.title() == normalized_name].copy()
+            # Until the full frame is in memory, scan only this player's rows
+            # from the Parquet copy instead of loading the whole dataset
+            in_memory = (
+                self._data_cache is not None
+                or _get_cache().get_kaggle_data() is not None
+            )
+            if not in_memory and self._get_dataset() is not None:
+                result = self._scan_dataset(normalized_name, season)
             else:
-                raise ValueError("Dataset does not contain player_name column")
+                df = self._load_data()
+                
+                # Filter by player name
+                if 'player_name_normalized' in df.columns:
+                    result = df[df['player_name_normalized'] == normalized_name].copy()
+                elif 'player_name' in df.columns:
+                    result = df[df['player_name'].str.strip().str.title() == normalized_name].copy()
+                else:
+                    raise ValueError("Dataset does not contain player_name column")
             
             if result.empty:
                 raise ValueError(f"Player '{player_name}' not found in Kaggle dataset")
@@ -242,6 +342,9 @@ class KaggleDataSource(DataSource):
             if self._is_loaded:
                 return True
             
+            if _PYARROW_AVAILABLE and self._get_parquet_path() is not None:
+                return True
+            
             path = Path(self.data_path)
             if path.is_file():
                 return path.exists()
@@ -116,6 +116,71 @@ class NFLReadPyDataSource(DataSource):
             f"Failed after {max_retries} attempts. Last error: {last_error}"
         )
     
+    def _load_season(self, season: int) -> pd.DataFrame:
+        """
+        Load weekly player stats for a season from nflreadpy.
+        
+        Args:
+            season: NFL season year
+            
+        Returns:
+            DataFrame with weekly stats for every player in the season
+            
+        Raises:
+            ConnectionError: If nflreadpy cannot provide the data
+        """
+        # nflreadpy uses 'seasons' parameter (plural)
+        try:
+            # Try to load weekly stats
+            df = self.nfl.load_player_stats(seasons=season)
+            # Convert from polars to pandas if needed
+            if hasattr(df, 'to_pandas'):
+                df = df.to_pandas()
+        except AttributeError:
+            # Fallback to alternative method if available
+            try:
+                df = self.nfl.get_player_stats(year=season)
+                if hasattr(df, 'to_pandas'):
+                    df = df.to_pandas()
+            except:
+                raise ConnectionError("Unable to fetch data from nflreadpy")
+        
+        return df
+    
+    def get_season_stats(self, season: int) -> pd.DataFrame:
+        """
+        Retrieve the full weekly player-stats DataFrame for a season.
+        
+        The frame is cached in the global cache manager, so every player
+        lookup for the same season reuses a single nflreadpy download.
+        
+        Args:
+            season: NFL season year
+            
+        Returns:
+            DataFrame with weekly stats for every player in the season
+            
+        Raises:
+            ConnectionError: If nflreadpy is unavailable
+            Exception: If all fetch attempts fail
+        """
+        if not self._nflreadpy_available or self.nfl is None:
+            raise ConnectionError(
+                "nflreadpy is not available. Please install it with: pip install nflreadpy"
+            )
+        
+        cache = _get_cache()
+        cached_df = cache.get_nflreadpy_season_data(season)
+        if cached_df is not None:
+            logger.info(f"Returning cached nflreadpy season data for {season}")
+            return cached_df
+        
+        # Fetch data with retry logic
+        df = self._fetch_with_retry(lambda: self._load_season(season))
+        cache.set_nflreadpy_season_data(season, df)
+        
+        return df
+    
     def get_player_stats(
         self,
         player_name: str,
@@ -168,30 +233,11 @@ class NFLReadPyDataSource(DataSource):
                     columns_to_select = list(set(available_key_cols + available_stats))
                     return cached_df[columns_to_select]
                 
-                return cached_df
-            
-            # Fetch data with retry logic
-            def fetch_data():
-                # Load player stats for the season
-                # nflreadpy uses 'seasons' parameter (plural)
-                try:
-                    # Try to load weekly stats
-                    df = self.nfl.load_player_stats(seasons=season)
-                    # Convert from polars to pandas if needed
-                    if hasattr(df, 'to_pandas'):
-                        df = df.to_pandas()
-                except AttributeError:
-                    # Fallback to alternative method if available
-                    try:
-                        df = self.nfl.get_player_stats(year=season)
-                        if hasattr(df, 'to_pandas'):
-                            df = df.to_pandas()
-                    except:
-                        raise ConnectionError("Unable to fetch data from nflreadpy")
-                
-                return df
+                # Cached frames are read-only; callers get their own copy
+                return cached_df.copy()
             
-            df = self._fetch_with_retry(fetch_data)
+            # Load the full season frame (shared across players via the cache)
+            df = self.get_season_stats(season)
             
             # Filter by player name (use player_display_name which has full names)
             if 'player_display_name' in df.columns:
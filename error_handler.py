@@ -264,6 +264,27 @@ ERROR_MESSAGES = {
 }
 
 
+def _format_suggestions(suggestions) -> str:
+    """Render a suggestions list as the markdown block appended to messages."""
+    if not suggestions:
+        return ""
+    return "\n\n**Suggestions:**\n" + "".join(f"- {suggestion}\n" for suggestion in suggestions)
+
+
+# Messages are static, so render them once at import instead of on every error
+_ERROR_MSGS: Dict[ErrorType, str] = {
+    error_type: info["message"] for error_type, info in ERROR_MESSAGES.items()
+}
+_SUGGESTIONS: Dict[ErrorType, str] = {
+    error_type: _format_suggestions(info.get("suggestions"))
+    for error_type, info in ERROR_MESSAGES.items()
+}
+_FULL_MSGS: Dict[ErrorType, str] = {
+    error_type: _ERROR_MSGS[error_type] + _SUGGESTIONS[error_type]
+    for error_type in ERROR_MESSAGES
+}
+
+
 def get_user_friendly_message(
     error_type: ErrorType,
     custom_message: Optional[str] = None,
@@ -284,20 +305,14 @@ def get_user_friendly_message(
         - 7.2: Provides clear error messages to users
         - 7.4: Suggests alternative queries when appropriate
     """
-    error_info = ERROR_MESSAGES.get(error_type, ERROR_MESSAGES[ErrorType.UNKNOWN_ERROR])
-    
-    # Use custom message if provided, otherwise use default
-    message = custom_message if custom_message else error_info["message"]
+    if error_type not in ERROR_MESSAGES:
+        error_type = ErrorType.UNKNOWN_ERROR
     
-    # Add suggestions if requested
-    if include_suggestions and "suggestions" in error_info:
-        suggestions = error_info["suggestions"]
-        if suggestions:
-            message += "\n\n**Suggestions:**\n"
-            for suggestion in suggestions:
-                message += f"- {suggestion}\n"
+    # Use custom message if provided, otherwise use the prerendered default
+    if custom_message:
+        return custom_message + _SUGGESTIONS[error_type] if include_suggestions else custom_message
     
-    return message
+    return (_FULL_MSGS if include_suggestions else _ERROR_MSGS)[error_type]
 
 
 def log_error(
@@ -7,9 +7,10 @@ This module defines the core data structures used throughout the application:
 - ChatbotState: LangGraph state for workflow orchestration
 """
 
+import operator
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List, Optional, TypedDict
+from typing import Annotated, Any, Dict, List, Optional, Sequence, TypedDict
 
 import pandas as pd
 from langchain_core.messages import BaseMessage
@@ -78,13 +79,14 @@ class PlayerStats:
                 self.yards_per_carry = round(self.rushing_yards / self.rushing_attempts, 2)
 
 
-@dataclass
+@dataclass(slots=True)
 class ConversationTurn:
     """
     Represents a single turn in the conversation between user and chatbot.
     
     Tracks the query, response, and extracted entities for context maintenance
-    and reference resolution in follow-up queries.
+    and reference resolution in follow-up queries. Uses __slots__ since one is
+    created for every turn.
     """
     user_query: str
     bot_response: str
@@ -109,6 +111,51 @@ class ConversationTurn:
         if 'timestamp' in data_copy and isinstance(data_copy['timestamp'], str):
             data_copy['timestamp'] = datetime.fromisoformat(data_copy['timestamp'])
         return cls(**data_copy)
+    
+    @classmethod
+    def from_untrusted(cls, **kwargs: Any) -> 'ConversationTurn':
+        """
+        Create a ConversationTurn from external input, validating every field.
+        
+        Turns built internally (create_conversation_turn) come from our own
+        extractors and use the plain constructor; this is for data crossing
+        a trust boundary, such as a restored session.
+        
+        Args:
+            **kwargs: ConversationTurn fields; timestamp may be a datetime
+                or an ISO 8601 string
+            
+        Returns:
+            Validated ConversationTurn
+            
+        Raises:
+            ValueError: If a field is missing, unknown or has the wrong type
+        """
+        unknown = set(kwargs) - set(cls.__slots__)
+        if unknown:
+            raise ValueError(f"Unknown ConversationTurn fields: {sorted(unknown)}")
+        
+        for name in ('user_query', 'bot_response'):
+            if not isinstance(kwargs.get(name), str):
+                raise ValueError(f"ConversationTurn.{name} must be a string")
+        
+        for name in ('mentioned_players', 'mentioned_stats'):
+            values = kwargs.get(name, [])
+            if not isinstance(values, (list, tuple)) or not all(isinstance(v, str) for v in values):
+                raise ValueError(f"ConversationTurn.{name} must be a list of strings")
+            kwargs[name] = list(values)
+        
+        timestamp = kwargs.pop('timestamp', None)
+        if timestamp is None:
+            pass
+        elif isinstance(timestamp, str):
+            kwargs['timestamp'] = datetime.fromisoformat(timestamp)
+        elif isinstance(timestamp, datetime):
+            kwargs['timestamp'] = timestamp
+        else:
+            raise ValueError("ConversationTurn.timestamp must be a datetime or ISO 8601 string")
+        
+        return cls(**kwargs)
 
 
 class ChatbotState(TypedDict):
@@ -133,11 +180,19 @@ class ChatbotState(TypedDict):
     # Generated response from LLM Node
     generated_response: str
     
-    # Conversation history from Memory Node (last 10 turns)
-    conversation_history: List[Dict[str, Any]]
+    # Conversation history from Memory Node (last 10 turns); a MemoryHistory
+    # (read-only apart from append) or, before the first update, a list
+    conversation_history: Sequence[Dict[str, Any]]
     
     # Error information if any node fails
     error: Optional[str]
     
+    # Most recent node failure: {"node", "error_type", "recoverable"}
+    last_error: Optional[Dict[str, Any]]
+    
+    # Append-only record of node failures; each node returns only its own
+    # new entries and LangGraph concatenates them
+    audit_trace: Annotated[List[Dict[str, Any]], operator.add]
+    
     # Session identifier for tracking
     session_id: Optional[str]
@@ -17,7 +17,8 @@ from nodes.memory import (
     get_context,
     initialize_memory,
     clear_memory,
-    get_memory_summary
+    get_memory_summary,
+    MemoryHistory
 )
 
 __all__ = [
@@ -35,4 +36,5 @@ __all__ = [
     "initialize_memory",
     "clear_memory",
     "get_memory_summary",
+    "MemoryHistory",
 ]
@@ -14,11 +14,11 @@ Requirements addressed:
 """
 
 import logging
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 
 import pandas as pd
-from langchain_core.messages import HumanMessage, SystemMessage
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, SystemMessage
 from langchain_openai import ChatOpenAI
 
 from models.models import ChatbotState
@@ -26,6 +26,10 @@ from error_handler import ChatbotError, ErrorType, log_error
 
 logger = logging.getLogger(__name__)
 
+# Replayed history advances in blocks of this many turns (see
+# format_history_messages())
+HISTORY_BLOCK_SIZE = 5
+
 
 def format_dataframe_for_prompt(df: pd.DataFrame) -> str:
     """
@@ -188,66 +192,112 @@ def calculate_league_context(df: pd.DataFrame, stat: str) -> Dict[str, any]:
     return context
 
 
-def format_conversation_history(conversation_history: List[Dict]) -> str:
+INSIGHT_SYSTEM_PROMPT = """You are an expert NFL analyst providing insights about player statistics. Your goal is to generate clear, informative, and contextual analysis based on the data provided.
+
+INSTRUCTIONS FOR GENERATING INSIGHTS:
+
+1. **Maintain Conversation Context**: If there's conversation history, this is a follow-up question. Reference previous topics naturally and resolve pronouns using the history.
+2. **Cite Specific Data**: Always reference actual numbers from the statistics provided
+3. **Provide Context**: Compare to league averages, historical performance, or other relevant benchmarks when possible
+4. **Highlight Trends**: Identify notable patterns, improvements, or declines in performance
+5. **Explain Significance**: Don't just state numbers - explain what they mean and why they matter
+6. **Use Comparisons**: When comparing players, use percentage differences and absolute values
+7. **Be Conversational**: Write in a natural, engaging tone while maintaining accuracy
+8. **Structure Clearly**: Use bullet points or short paragraphs for readability
+
+For follow-up questions, use the earlier turns of the conversation to:
+- Understand references like 'he', 'his', 'that player', 'them', etc.
+- Maintain continuity with previous answers
+- Build upon previously discussed topics
+- Reference earlier statistics when relevant
+
+FORMATTING GUIDELINES:
+- Use percentage changes when comparing (e.g., "15% more yards")
+- Include absolute differences (e.g., "300 more yards")
+- Highlight exceptional performance (top 10%, career highs, etc.)
+- Mention relevant situational context (playoff performance, division games, etc.)
+- Keep responses concise but informative (3-5 paragraphs or equivalent bullet points)
+
+LEAGUE CONTEXT (Approximate 2023 NFL Averages per game):
+- Passing Yards: ~250 yards
+- Passing TDs: ~1.5 per game
+- Completion Rate: ~64%
+- Rushing Yards: ~80 yards per game
+- Receiving Yards: ~50 yards per game
+- Receptions: ~4.5 per game
+
+Generate a comprehensive yet concise analysis based on the data and context provided with the user's question.
+"""
+
+
+def format_history_messages(conversation_history: List[Dict]) -> List[BaseMessage]:
     """
-    Format conversation history for inclusion in prompt.
+    Render recent conversation turns as chat messages.
+    
+    Each turn is rendered on its own, so a turn's messages are identical
+    every time it is replayed. The window starts at a HISTORY_BLOCK_SIZE
+    boundary of the session's turn count and covers the previous block plus
+    the current one, so the replayed prefix only changes once per block
+    instead of sliding on every turn.
     
     Args:
-        conversation_history: List of previous conversation turns
+        conversation_history: Previous conversation turns (a MemoryHistory
+            or a list)
         
     Returns:
-        Formatted string of recent conversation
+        Alternating user and assistant messages, oldest first
     """
-    if not conversation_history:
-        return "No previous conversation."
-    
-    # Get last 5 turns for better context on follow-up questions
-    recent_turns = conversation_history[-5:] if len(conversation_history) >= 5 else conversation_history
-    
-    formatted = []
-    for i, turn in enumerate(recent_turns, 1):
+    history = conversation_history or []
+    # MemoryHistory also counts evicted turns, which keeps the block
+    # boundaries fixed once the bounded history is full
+    total_turns = getattr(history, "total_turns", len(history))
+    window_start = max(0, (total_turns // HISTORY_BLOCK_SIZE - 1) * HISTORY_BLOCK_SIZE)
+    recent_turns = history[max(0, window_start - (total_turns - len(history))):]
+    
+    messages = []
+    for turn in recent_turns:
         user_query = turn.get('user_query', '')
         bot_response = turn.get('bot_response', '')
         mentioned_players = turn.get('mentioned_players', [])
         mentioned_stats = turn.get('mentioned_stats', [])
         
         if user_query:
-            formatted.append(f"Turn {i} - User: {user_query}")
-        if bot_response:
-            # Truncate long responses but keep key info
-            if len(bot_response) > 300:
-                bot_response = bot_response[:300] + "..."
-            formatted.append(f"Turn {i} - Assistant: {bot_response}")
+            messages.append(HumanMessage(content=user_query))
         
-        # Add context about what was discussed
+        # Truncate long responses but keep key info
+        content = bot_response or ""
+        if len(content) > 300:
+            content = content[:300] + "..."
+        
+        # Add context about what was discussed, even if there was no response
         if mentioned_players or mentioned_stats:
             context_parts = []
             if mentioned_players:
                 context_parts.append(f"Players: {', '.join(mentioned_players)}")
             if mentioned_stats:
                 context_parts.append(f"Stats: {', '.join(mentioned_stats)}")
-            formatted.append(f"  [Context: {' | '.join(context_parts)}]")
+            context_line = f"[Context: {' | '.join(context_parts)}]"
+            content = f"{content}\n{context_line}" if content else context_line
         
-        formatted.append("")
+        if content:
+            messages.append(AIMessage(content=content))
     
-    return "\n".join(formatted)
+    return messages
 
 
-def build_insight_prompt(
+def build_data_context(
     retrieved_data: pd.DataFrame,
-    parsed_query: Dict,
-    conversation_history: List[Dict]
+    parsed_query: Dict
 ) -> str:
     """
-    Build the system prompt for generating insights.
+    Build the per-query context block with the retrieved statistics.
     
     Args:
         retrieved_data: DataFrame with player statistics
         parsed_query: Parsed query structure
-        conversation_history: Previous conversation turns
         
     Returns:
-        Formatted prompt string
+        Formatted context string
     """
     current_year = datetime.now().year
     
@@ -259,10 +309,7 @@ def build_insight_prompt(
     if parsed_query.get('comparison') and len(retrieved_data) > 1:
         comparison_metrics = calculate_comparison_metrics(retrieved_data)
     
-    # Build the prompt
-    prompt = f"""You are an expert NFL analyst providing insights about player statistics. Your goal is to generate clear, informative, and contextual analysis based on the data provided.
-
-CURRENT CONTEXT:
+    context = f"""CURRENT CONTEXT:
 - Current Year: {current_year}
 - Query Type: {parsed_query.get('query_intent', 'player_stats')}
 - Comparison Query: {'Yes' if parsed_query.get('comparison') else 'No'}
@@ -270,57 +317,133 @@ CURRENT CONTEXT:
 PLAYER STATISTICS:
 {data_str}
 """
-
+    
     # Add comparison metrics if available
     if comparison_metrics and comparison_metrics.get('comparisons'):
-        prompt += "\n\nCOMPARISON INSIGHTS:\n"
+        context += "\n\nCOMPARISON INSIGHTS:\n"
         for comp in comparison_metrics['comparisons'][:5]:  # Top 5 differences
             stat_name = comp['stat'].replace('_', ' ').title()
-            prompt += f"- {stat_name}: {comp['leader']} leads with {comp['max_value']:.1f} vs {comp['trailing']} with {comp['min_value']:.1f} "
-            prompt += f"(difference: {comp['difference']:.1f}, {comp['percent_difference']:.1f}% gap)\n"
+            context += f"- {stat_name}: {comp['leader']} leads with {comp['max_value']:.1f} vs {comp['trailing']} with {comp['min_value']:.1f} "
+            context += f"(difference: {comp['difference']:.1f}, {comp['percent_difference']:.1f}% gap)\n"
+    
+    return context
+
+
+def build_llm_messages(state: ChatbotState) -> List[BaseMessage]:
+    """
+    Assemble the LLM prompt from the most stable content to the least.
+    
+    The order is static system prompt, committed conversation history,
+    retrieved data, then the current question. Everything before the
+    retrieved data is unchanged by the new turn, so providers that cache
+    prompt prefixes can reuse it.
+    
+    Args:
+        state: Current chatbot state with retrieved_data
+        
+    Returns:
+        Messages to send to the LLM
+    """
+    user_query = state.get("user_query") or "Analyze these statistics"
     
-    # Add conversation context
-    if conversation_history:
-        history_str = format_conversation_history(conversation_history)
-        prompt += f"\n\nRECENT CONVERSATION HISTORY:\n{history_str}\n"
-        prompt += "\n**IMPORTANT**: This is a follow-up question. Use the conversation history above to:\n"
-        prompt += "- Understand references like 'he', 'his', 'that player', 'them', etc.\n"
-        prompt += "- Maintain continuity with previous answers\n"
-        prompt += "- Build upon previously discussed topics\n"
-        prompt += "- Reference earlier statistics when relevant\n\n"
+    messages: List[BaseMessage] = [SystemMessage(content=INSIGHT_SYSTEM_PROMPT)]
+    messages.extend(format_history_messages(state.get("conversation_history", [])))
+    messages.append(SystemMessage(content=build_data_context(
+        retrieved_data=state.get("retrieved_data"),
+        parsed_query=state.get("parsed_query", {})
+    )))
+    messages.append(HumanMessage(content=f"User's question: {user_query}"))
     
-    prompt += """
+    return messages
 
-INSTRUCTIONS FOR GENERATING INSIGHTS:
 
-1. **Maintain Conversation Context**: If there's conversation history, this is a follow-up question. Reference previous topics naturally and resolve pronouns using the history.
-2. **Cite Specific Data**: Always reference actual numbers from the statistics provided
-3. **Provide Context**: Compare to league averages, historical performance, or other relevant benchmarks when possible
-4. **Highlight Trends**: Identify notable patterns, improvements, or declines in performance
-5. **Explain Significance**: Don't just state numbers - explain what they mean and why they matter
-6. **Use Comparisons**: When comparing players, use percentage differences and absolute values
-7. **Be Conversational**: Write in a natural, engaging tone while maintaining accuracy
-8. **Structure Clearly**: Use bullet points or short paragraphs for readability
+def _insight_request(state: ChatbotState) -> Optional[Tuple[ChatOpenAI, List[BaseMessage]]]:
+    """
+    Build the LLM client and prompt messages for insight generation.
+    
+    Args:
+        state: Current chatbot state with retrieved_data
+        
+    Returns:
+        (llm, messages), or None if a previous node already set an error
+        
+    Raises:
+        ChatbotError: If there is no retrieved data to describe
+    """
+    # Check for errors from previous nodes
+    if state.get("error") and state.get("error") != "":
+        # Error already handled, skip LLM generation
+        return None
+    
+    retrieved_data = state.get("retrieved_data")
+    parsed_query = state.get("parsed_query", {})
+    
+    # Validate retrieved data
+    if retrieved_data is None or retrieved_data.empty:
+        raise ChatbotError(
+            error_type=ErrorType.NO_DATA_FOUND,
+            message="No data available for insight generation",
+            details={"parsed_query": parsed_query},
+            recoverable=True
+        )
+    
+    # Initialize OpenAI
+    llm = ChatOpenAI(
+        model="gpt-4",
+        temperature=0.7,  # Some creativity for engaging insights
+        max_tokens=800,  # Limit response length
+    )
+    
+    # Create messages, stable prefix first
+    return llm, build_llm_messages(state)
 
-FORMATTING GUIDELINES:
-- Use percentage changes when comparing (e.g., "15% more yards")
-- Include absolute differences (e.g., "300 more yards")
-- Highlight exceptional performance (top 10%, career highs, etc.)
-- Mention relevant situational context (playoff performance, division games, etc.)
-- Keep responses concise but informative (3-5 paragraphs or equivalent bullet points)
 
-LEAGUE CONTEXT (Approximate 2023 NFL Averages per game):
-- Passing Yards: ~250 yards
-- Passing TDs: ~1.5 per game
-- Completion Rate: ~64%
-- Rushing Yards: ~80 yards per game
-- Receiving Yards: ~50 yards per game
-- Receptions: ~4.5 per game
+def _store_insights(state: ChatbotState, response: BaseMessage) -> ChatbotState:
+    """Store the LLM response text in state."""
+    generated_response = response.content
+    state["generated_response"] = generated_response
+    
+    logger.info(f"Successfully generated insights ({len(generated_response)} characters)")
+    
+    return state
 
-Generate a comprehensive yet concise analysis based on the data and context provided above.
-"""
+
+def _insight_error(e: Exception, state: ChatbotState) -> ChatbotError:
+    """
+    Log an LLM API failure and convert it to a ChatbotError.
     
-    return prompt
+    Args:
+        e: Exception raised while generating insights
+        state: Current chatbot state
+        
+    Returns:
+        ChatbotError with the matching LLM error type
+    """
+    retrieved_data = state.get("retrieved_data")
+    log_error(
+        e,
+        context={
+            "operation": "insight_generation",
+            "data_size": len(retrieved_data) if retrieved_data is not None else 0
+        },
+        level="warning"
+    )
+    
+    # Determine specific error type
+    error_str = str(e).lower()
+    if "rate" in error_str and "limit" in error_str:
+        error_type = ErrorType.LLM_RATE_LIMIT
+    elif "timeout" in error_str:
+        error_type = ErrorType.LLM_TIMEOUT
+    else:
+        error_type = ErrorType.INSIGHT_GENERATION_ERROR
+    
+    return ChatbotError(
+        error_type=error_type,
+        message=f"Failed to generate insights: {str(e)}",
+        details={"error": str(e)},
+        recoverable=True
+    )
 
 
 async def generate_insights(state: ChatbotState) -> ChatbotState:
@@ -328,6 +451,8 @@ async def generate_insights(state: ChatbotState) -> ChatbotState:
     Generate natural language insights from retrieved player statistics.
     
     This is the main entry point for the LLM Node in the LangGraph workflow.
+    The OpenAI call is awaited, so other sessions keep running on the event
+    loop while it is in flight.
     
     Args:
         state: Current chatbot state with retrieved_data
@@ -344,88 +469,23 @@ async def generate_insights(state: ChatbotState) -> ChatbotState:
         - 2.3: Highlights differences with percentage changes
     """
     try:
-        # Check for errors from previous nodes
-        if state.get("error") and state.get("error") != "":
-            # Error already handled, skip LLM generation
+        request = _insight_request(state)
+        if request is None:
             return state
-        
-        retrieved_data = state.get("retrieved_data")
-        parsed_query = state.get("parsed_query", {})
-        conversation_history = state.get("conversation_history", [])
-        
-        # Validate retrieved data
-        if retrieved_data is None or retrieved_data.empty:
-            raise ChatbotError(
-                error_type=ErrorType.NO_DATA_FOUND,
-                message="No data available for insight generation",
-                details={"parsed_query": parsed_query},
-                recoverable=True
-            )
-        
-        # Build the prompt
-        system_prompt = build_insight_prompt(
-            retrieved_data=retrieved_data,
-            parsed_query=parsed_query,
-            conversation_history=conversation_history
-        )
-        
-        # Initialize OpenAI
-        llm = ChatOpenAI(
-            model="gpt-4",
-            temperature=0.7,  # Some creativity for engaging insights
-            max_tokens=800,  # Limit response length
-        )
-        
-        # Create messages
-        user_query = state.get("user_query", "Analyze these statistics")
-        messages = [
-            SystemMessage(content=system_prompt),
-            HumanMessage(content=f"User's question: {user_query}")
-        ]
+        llm, messages = request
         
         # Generate insights
         logger.info("Generating insights from LLM...")
-        response = llm.invoke(messages)
+        response = await llm.ainvoke(messages)
         
-        # Extract the generated text
-        generated_response = response.content
-        
-        # Store in state
-        state["generated_response"] = generated_response
-        
-        logger.info(f"Successfully generated insights ({len(generated_response)} characters)")
-        
-        return state
+        return _store_insights(state, response)
         
     except ChatbotError:
         # Re-raise ChatbotError to be handled by workflow
         raise
     except Exception as e:
         # Handle LLM API errors
-        log_error(
-            e,
-            context={
-                "operation": "insight_generation",
-                "data_size": len(retrieved_data) if retrieved_data is not None else 0
-            },
-            level="warning"
-        )
-        
-        # Determine specific error type
-        error_str = str(e).lower()
-        if "rate" in error_str and "limit" in error_str:
-            error_type = ErrorType.LLM_RATE_LIMIT
-        elif "timeout" in error_str:
-            error_type = ErrorType.LLM_TIMEOUT
-        else:
-            error_type = ErrorType.INSIGHT_GENERATION_ERROR
-        
-        raise ChatbotError(
-            error_type=error_type,
-            message=f"Failed to generate insights: {str(e)}",
-            details={"error": str(e)},
-            recoverable=True
-        )
+        raise _insight_error(e, state)
 
 
 # Synchronous version for non-async contexts
@@ -433,19 +493,29 @@ def generate_insights_sync(state: ChatbotState) -> ChatbotState:
     """
     Synchronous version of generate_insights for compatibility.
     
+    Makes the same blocking OpenAI call run_workflow has always made.
+    
     Args:
         state: Current chatbot state
         
     Returns:
         Updated state with generated insights
     """
-    import asyncio
-    
-    # Run async function in sync context
     try:
-        loop = asyncio.get_event_loop()
-    except RuntimeError:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-    
-    return loop.run_until_complete(generate_insights(state))
+        request = _insight_request(state)
+        if request is None:
+            return state
+        llm, messages = request
+        
+        # Generate insights
+        logger.info("Generating insights from LLM...")
+        response = llm.invoke(messages)
+        
+        return _store_insights(state, response)
+        
+    except ChatbotError:
+        # Re-raise ChatbotError to be handled by workflow
+        raise
+    except Exception as e:
+        # Handle LLM API errors
+        raise _insight_error(e, state)
@@ -14,7 +14,13 @@ Requirements addressed:
 
 import logging
 import re
-from typing import Any, Dict, List, Optional
+import sys
+from collections import Counter, deque
+from collections.abc import Sequence
+from functools import lru_cache
+from itertools import chain, islice
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
 from datetime import datetime
 
 from models.models import ChatbotState, ConversationTurn
@@ -24,6 +30,215 @@ logger = logging.getLogger(__name__)
 # Maximum number of conversation turns to maintain
 MAX_CONVERSATION_HISTORY = 10
 
+# Common NFL player name patterns (First Last or First Middle Last)
+# This is a simple heuristic - in production, you'd use NER or a player database
+_PLAYER_NAME_RE = re.compile(r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+){1,2}\b')
+
+# Capitalized phrases that match the name pattern but aren't players
+_NAME_FALSE_POSITIVES = frozenset({
+    'The System', 'The Player', 'The Team', 'The Game',
+    'Expected Points', 'Points Added', 'Red Zone', 'The Season',
+    'The Week', 'The League', 'The NFL', 'The Stats'
+})
+
+# Common statistical terms to look for, mapped to their stat names
+# (checked in order, as substrings of the lowercased text)
+_STAT_KEYWORDS = (
+    ('yards', 'yards'),
+    ('passing yards', 'passing_yards'),
+    ('rushing yards', 'rushing_yards'),
+    ('receiving yards', 'receiving_yards'),
+    ('touchdowns', 'touchdowns'),
+    ('tds', 'touchdowns'),
+    ('completions', 'completions'),
+    ('attempts', 'attempts'),
+    ('completion rate', 'completion_rate'),
+    ('completion percentage', 'completion_rate'),
+    ('interceptions', 'interceptions'),
+    ('picks', 'interceptions'),
+    ('receptions', 'receptions'),
+    ('catches', 'receptions'),
+    ('targets', 'targets'),
+    ('epa', 'epa'),
+    ('expected points', 'epa'),
+    ('yards per attempt', 'yards_per_attempt'),
+    ('yards per reception', 'yards_per_reception'),
+    ('yards per carry', 'yards_per_carry'),
+    ('sacks', 'sacks'),
+)
+
+# Shared read-only context returned for empty histories
+_EMPTY_CONTEXT: Mapping[str, Any] = MappingProxyType({
+    "recent_players": (),
+    "recent_stats": (),
+    "recent_queries": (),
+    "last_response": None,
+    "turn_count": 0
+})
+
+
+class MemoryHistory(Sequence):
+    """
+    Bounded conversation history that keeps running entity counts.
+    
+    Turns are stored field by field in parallel deques sharing one maxlen
+    (user queries, bot responses, mentioned players/stats as tuples and
+    timestamps) instead of one dict per turn, so readers such as
+    get_context() touch only the fields they need. Indexing, slicing and
+    iteration reassemble turn dictionaries (with list-valued mentioned
+    players/stats, as in ConversationTurn.to_dict()) on demand. It is a
+    read-only Sequence apart from append().
+    
+    Every append counts the turn's mentioned players and stats, and the turn
+    evicted by the bound is subtracted again, so get_memory_summary() is a
+    snapshot of these counts instead of a rescan of every turn.
+    total_turns counts every turn ever appended, including evicted ones.
+    """
+    
+    def __init__(
+        self,
+        turns: Iterable[Dict[str, Any]] = (),
+        maxlen: int = MAX_CONVERSATION_HISTORY
+    ):
+        """
+        Initialize the history.
+        
+        Args:
+            turns: Optional existing turn dictionaries, oldest first
+            maxlen: Maximum number of turns to keep
+        """
+        self.user_queries: deque = deque(maxlen=maxlen)
+        self.bot_responses: deque = deque(maxlen=maxlen)
+        self.mentioned_players: deque = deque(maxlen=maxlen)
+        self.mentioned_stats: deque = deque(maxlen=maxlen)
+        self.timestamps: deque = deque(maxlen=maxlen)
+        self._player_counts: Counter = Counter()
+        self._stat_counts: Counter = Counter()
+        self._total_players = 0
+        self._total_stats = 0
+        self.total_turns = 0
+        
+        for turn in turns:
+            self.append(turn)
+    
+    @property
+    def maxlen(self) -> int:
+        """Maximum number of turns kept."""
+        return self.user_queries.maxlen
+    
+    def append(self, turn: Dict[str, Any]):
+        """
+        Add a turn, evicting the oldest one when the history is full.
+        
+        Only the standard turn fields (see ConversationTurn.to_dict()) are
+        kept.
+        
+        Args:
+            turn: Conversation turn dictionary
+        """
+        if len(self.user_queries) == self.maxlen:
+            self._count(self.mentioned_players[0], self.mentioned_stats[0], -1)
+        
+        players = tuple(turn.get("mentioned_players", ()))
+        stats = tuple(turn.get("mentioned_stats", ()))
+        
+        # Same maxlen everywhere, so all fields evict the same turn
+        self.user_queries.append(turn.get("user_query"))
+        self.bot_responses.append(turn.get("bot_response"))
+        self.mentioned_players.append(players)
+        self.mentioned_stats.append(stats)
+        self.timestamps.append(turn.get("timestamp"))
+        self._count(players, stats, 1)
+        self.total_turns += 1
+    
+    def _count(self, players: Tuple[str, ...], stats: Tuple[str, ...], sign: int):
+        """Add (sign=1) or remove (sign=-1) a turn's entities from the counts."""
+        for counts, items in ((self._player_counts, players), (self._stat_counts, stats)):
+            for item in items:
+                counts[item] += sign
+                if counts[item] <= 0:
+                    del counts[item]
+        
+        self._total_players += sign * len(players)
+        self._total_stats += sign * len(stats)
+    
+    def summary(self) -> Dict[str, Any]:
+        """
+        Snapshot of the running counts.
+        
+        Returns:
+            Dictionary in the get_memory_summary() format
+        """
+        return {
+            "turn_count": len(self),
+            "total_players": self._total_players,
+            "total_stats": self._total_stats,
+            "unique_players": list(self._player_counts),
+            "unique_stats": list(self._stat_counts),
+            "oldest_turn": self.timestamps[0] if self.timestamps else None,
+            "newest_turn": self.timestamps[-1] if self.timestamps else None
+        }
+    
+    def _turn(self, index: int) -> Dict[str, Any]:
+        """Reassemble the turn dictionary at index."""
+        return {
+            "user_query": self.user_queries[index],
+            "bot_response": self.bot_responses[index],
+            "mentioned_players": list(self.mentioned_players[index]),
+            "mentioned_stats": list(self.mentioned_stats[index]),
+            "timestamp": self.timestamps[index]
+        }
+    
+    def __len__(self) -> int:
+        return len(self.user_queries)
+    
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return (self._turn(i) for i in range(len(self)))
+    
+    def __reversed__(self) -> Iterator[Dict[str, Any]]:
+        return (self._turn(i) for i in range(len(self) - 1, -1, -1))
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._turn(i) for i in range(*index.indices(len(self)))]
+        return self._turn(index)
+    
+    def __repr__(self) -> str:
+        return f"MemoryHistory({list(self)!r}, maxlen={self.maxlen})"
+
+
+@lru_cache(maxsize=1024)
+def _scan(text: str) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """
+    Extract candidate player names and stat categories from raw text in one
+    pass over the string (memoized).
+    
+    Args:
+        text: Non-empty text to scan
+        
+    Returns:
+        Tuple of (distinct candidate names in order of appearance,
+        distinct stat names in keyword order)
+    """
+    names = []
+    
+    for name in _PLAYER_NAME_RE.findall(text):
+        if name not in _NAME_FALSE_POSITIVES and name not in names:
+            # Basic validation: at least 2 words, each starting with capital
+            words = name.split()
+            if len(words) >= 2 and all(w[0].isupper() for w in words):
+                # Interned so repeated mentions across turns share one string
+                names.append(sys.intern(name))
+    
+    text_lower = text.lower()
+    stats = []
+    
+    for keyword, stat_name in _STAT_KEYWORDS:
+        if keyword in text_lower and stat_name not in stats:
+            stats.append(stat_name)
+    
+    return tuple(names), tuple(stats)
+
 
 def extract_mentioned_players(text: str, parsed_query: Optional[Dict[str, Any]] = None) -> List[str]:
     """
@@ -42,24 +257,12 @@ def extract_mentioned_players(text: str, parsed_query: Optional[Dict[str, Any]]
     if parsed_query and 'players' in parsed_query:
         players.extend(parsed_query['players'])
     
-    # Common NFL player name patterns (First Last or First Middle Last)
-    # This is a simple heuristic - in production, you'd use NER or a player database
-    name_pattern = r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+){1,2}\b'
-    potential_names = re.findall(name_pattern, text)
+    if not text:
+        return players
     
-    # Filter out common false positives
-    false_positives = {
-        'The System', 'The Player', 'The Team', 'The Game',
-        'Expected Points', 'Points Added', 'Red Zone', 'The Season',
-        'The Week', 'The League', 'The NFL', 'The Stats'
-    }
-    
-    for name in potential_names:
-        if name not in false_positives and name not in players:
-            # Basic validation: at least 2 words, each starting with capital
-            words = name.split()
-            if len(words) >= 2 and all(w[0].isupper() for w in words):
-                players.append(name)
+    for name in _scan(text)[0]:
+        if name not in players:
+            players.append(name)
     
     return players
 
@@ -81,40 +284,52 @@ def extract_mentioned_stats(text: str, parsed_query: Optional[Dict[str, Any]] =
     if parsed_query and 'statistics' in parsed_query:
         stats.extend(parsed_query['statistics'])
     
-    # Common statistical terms to look for
-    stat_keywords = {
-        'yards': 'yards',
-        'passing yards': 'passing_yards',
-        'rushing yards': 'rushing_yards',
-        'receiving yards': 'receiving_yards',
-        'touchdowns': 'touchdowns',
-        'tds': 'touchdowns',
-        'completions': 'completions',
-        'attempts': 'attempts',
-        'completion rate': 'completion_rate',
-        'completion percentage': 'completion_rate',
-        'interceptions': 'interceptions',
-        'picks': 'interceptions',
-        'receptions': 'receptions',
-        'catches': 'receptions',
-        'targets': 'targets',
-        'epa': 'epa',
-        'expected points': 'epa',
-        'yards per attempt': 'yards_per_attempt',
-        'yards per reception': 'yards_per_reception',
-        'yards per carry': 'yards_per_carry',
-        'sacks': 'sacks',
-    }
-    
-    text_lower = text.lower()
+    if not text:
+        return stats
     
-    for keyword, stat_name in stat_keywords.items():
-        if keyword in text_lower and stat_name not in stats:
+    for stat_name in _scan(text)[1]:
+        if stat_name not in stats:
             stats.append(stat_name)
     
     return stats
 
 
+def _extract_turn_entities(
+    user_query: str,
+    bot_response: str,
+    parsed_query: Optional[Dict[str, Any]] = None
+) -> Tuple[List[str], List[str]]:
+    """
+    Extract the players and stats mentioned in a query-response pair.
+    
+    Args:
+        user_query: The user's query
+        bot_response: The bot's response
+        parsed_query: Optional parsed query for better entity extraction
+        
+    Returns:
+        Tuple of (deduplicated player names, deduplicated stat names)
+    """
+    # Extract mentioned players and stats (one scan per text)
+    query_players, query_stats = _scan(user_query) if user_query else ((), ())
+    
+    # Also check the response for additional context
+    response_players, response_stats = _scan(bot_response) if bot_response else ((), ())
+    
+    # Parsed query entities first (most reliable), then combine and deduplicate;
+    # parsed names are interned like the scanned ones (stat names from
+    # _STAT_KEYWORDS are literals and already interned)
+    parsed_query = parsed_query or {}
+    all_players = list(dict.fromkeys(chain(
+        map(sys.intern, parsed_query.get('players', ())), query_players, response_players
+    )))
+    all_stats = list(dict.fromkeys(chain(
+        map(sys.intern, parsed_query.get('statistics', ())), query_stats, response_stats
+    )))
+    
+    return all_players, all_stats
+
+
 def create_conversation_turn(
     user_query: str,
     bot_response: str,
@@ -131,17 +346,7 @@ def create_conversation_turn(
     Returns:
         ConversationTurn object with extracted entities
     """
-    # Extract mentioned players and stats
-    mentioned_players = extract_mentioned_players(user_query, parsed_query)
-    mentioned_stats = extract_mentioned_stats(user_query, parsed_query)
-    
-    # Also check the response for additional context
-    response_players = extract_mentioned_players(bot_response)
-    response_stats = extract_mentioned_stats(bot_response)
-    
-    # Combine and deduplicate
-    all_players = list(dict.fromkeys(mentioned_players + response_players))
-    all_stats = list(dict.fromkeys(mentioned_stats + response_stats))
+    all_players, all_stats = _extract_turn_entities(user_query, bot_response, parsed_query)
     
     return ConversationTurn(
         user_query=user_query,
@@ -176,36 +381,40 @@ def update_memory(state: ChatbotState) -> ChatbotState:
         user_query = state.get("user_query", "")
         generated_response = state.get("generated_response", "")
         parsed_query = state.get("parsed_query")
-        conversation_history = state.get("conversation_history", [])
+        conversation_history = state.get("conversation_history")
         
         # Skip if no query or response
         if not user_query or not generated_response:
             logger.warning("Skipping memory update: missing query or response")
             return state
         
-        # Create conversation turn
-        turn = create_conversation_turn(
-            user_query=user_query,
-            bot_response=generated_response,
-            parsed_query=parsed_query
+        # Build the stored turn dictionary directly (same shape as
+        # ConversationTurn.to_dict(), without the intermediate object)
+        mentioned_players, mentioned_stats = _extract_turn_entities(
+            user_query, generated_response, parsed_query
         )
+        turn_dict = {
+            'user_query': user_query,
+            'bot_response': generated_response,
+            'mentioned_players': mentioned_players,
+            'mentioned_stats': mentioned_stats,
+            'timestamp': datetime.now().isoformat()
+        }
         
-        # Convert to dictionary for storage
-        turn_dict = turn.to_dict()
+        # Keep history in a bounded MemoryHistory so the oldest turn is evicted
+        # on append (last 10 turns); plain lists and deques are converted
+        if not isinstance(conversation_history, MemoryHistory):
+            conversation_history = MemoryHistory(conversation_history or ())
         
         # Add to conversation history
         conversation_history.append(turn_dict)
         
-        # Maintain maximum history size (last 10 turns)
-        if len(conversation_history) > MAX_CONVERSATION_HISTORY:
-            conversation_history = conversation_history[-MAX_CONVERSATION_HISTORY:]
-        
         # Update state
         state["conversation_history"] = conversation_history
         
         logger.info(
             f"Memory updated: {len(conversation_history)} turns in history, "
-            f"extracted {len(turn.mentioned_players)} players and {len(turn.mentioned_stats)} stats"
+            f"extracted {len(mentioned_players)} players and {len(mentioned_stats)} stats"
         )
         
         return state
@@ -217,7 +426,7 @@ def update_memory(state: ChatbotState) -> ChatbotState:
         return state
 
 
-def get_context(conversation_history: List[Dict[str, Any]], max_turns: int = 3) -> Dict[str, Any]:
+def get_context(conversation_history: List[Dict[str, Any]], max_turns: int = 3) -> Mapping[str, Any]:
     """
     Retrieve relevant context from conversation history for query parsing.
     
@@ -234,12 +443,17 @@ def get_context(conversation_history: List[Dict[str, Any]], max_turns: int = 3)
         - recent_stats: List of recently mentioned statistics
         - recent_queries: List of recent user queries
         - last_response: The most recent bot response
+        An empty history returns a shared read-only mapping, so callers
+        must not modify the result.
         
     Requirements:
         - 3.1: Provides relevant history for follow-up questions
         - 3.3: Enables Query Parser to access conversation context
         - 3.4: Supports pronoun and reference resolution
     """
+    if not conversation_history:
+        return _EMPTY_CONTEXT
+    
     context = {
         "recent_players": [],
         "recent_stats": [],
@@ -248,50 +462,53 @@ def get_context(conversation_history: List[Dict[str, Any]], max_turns: int = 3)
         "turn_count": len(conversation_history)
     }
     
-    if not conversation_history:
-        return context
-    
-    # Get the most recent turns
-    recent_turns = conversation_history[-max_turns:] if len(conversation_history) >= max_turns else conversation_history
-    
-    # Extract entities from recent turns
-    for turn in recent_turns:
-        # Add mentioned players
-        if "mentioned_players" in turn:
-            context["recent_players"].extend(turn["mentioned_players"])
-        
-        # Add mentioned stats
-        if "mentioned_stats" in turn:
-            context["recent_stats"].extend(turn["mentioned_stats"])
-        
-        # Add user queries
-        if "user_query" in turn:
-            context["recent_queries"].append(turn["user_query"])
-    
-    # Remove duplicates while preserving order
-    context["recent_players"] = list(dict.fromkeys(context["recent_players"]))
-    context["recent_stats"] = list(dict.fromkeys(context["recent_stats"]))
+    if isinstance(conversation_history, MemoryHistory):
+        # Read just the needed fields of the most recent turns
+        start = max(len(conversation_history) - max_turns, 0)
+        player_lists = islice(conversation_history.mentioned_players, start, None)
+        stat_lists = islice(conversation_history.mentioned_stats, start, None)
+        recent_queries = [
+            query for query in islice(conversation_history.user_queries, start, None)
+            if query is not None
+        ]
+        last_response = conversation_history.bot_responses[-1]
+    else:
+        # Get the most recent turns, oldest first, without copying the whole history
+        recent_turns = list(islice(reversed(conversation_history), max_turns))
+        recent_turns.reverse()
+        player_lists = [turn.get("mentioned_players", ()) for turn in recent_turns]
+        stat_lists = [turn.get("mentioned_stats", ()) for turn in recent_turns]
+        recent_queries = [turn["user_query"] for turn in recent_turns if "user_query" in turn]
+        last_response = conversation_history[-1].get("bot_response")
+    
+    # Extract entities from recent turns, removing duplicates while
+    # preserving order in a single hash-based pass
+    context["recent_players"] = list(dict.fromkeys(
+        player for players in player_lists for player in players
+    ))
+    context["recent_stats"] = list(dict.fromkeys(
+        stat for stats in stat_lists for stat in stats
+    ))
+    context["recent_queries"] = recent_queries
     
     # Get the last response for immediate context
-    if conversation_history:
-        last_turn = conversation_history[-1]
-        context["last_response"] = last_turn.get("bot_response")
+    context["last_response"] = last_response
     
     return context
 
 
-def initialize_memory() -> List[Dict[str, Any]]:
+def initialize_memory() -> MemoryHistory:
     """
     Initialize an empty conversation history for a new session.
     
     Returns:
-        Empty list representing a new conversation history
+        Empty MemoryHistory bounded to MAX_CONVERSATION_HISTORY turns
         
     Requirements:
         - 3.5: Initialize with empty context for new sessions
     """
     logger.info("Initializing new conversation memory")
-    return []
+    return MemoryHistory()
 
 
 def clear_memory(state: ChatbotState) -> ChatbotState:
@@ -318,14 +535,18 @@ def get_memory_summary(conversation_history: List[Dict[str, Any]]) -> Dict[str,
     """
     Generate a summary of the conversation history.
     
-    Useful for debugging and monitoring conversation state.
+    Useful for debugging and monitoring conversation state. A MemoryHistory
+    answers from its running counts; other sequences are scanned.
     
     Args:
-        conversation_history: List of conversation turn dictionaries
+        conversation_history: MemoryHistory or list of conversation turn dictionaries
         
     Returns:
         Dictionary with summary statistics
     """
+    if isinstance(conversation_history, MemoryHistory) and conversation_history:
+        return conversation_history.summary()
+    
     if not conversation_history:
         return {
             "turn_count": 0,
@@ -12,12 +12,12 @@ Requirements addressed:
 - 6.5: Request clarification for ambiguous queries
 """
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 import json
 import re
 from datetime import datetime
 
-from langchain_core.messages import HumanMessage, SystemMessage
+from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
 from langchain_openai import ChatOpenAI
 from pydantic import BaseModel, Field
 
@@ -186,7 +186,8 @@ def extract_context_from_history(conversation_history: List[Dict[str, Any]]) ->
     }
     
     # Look at last 3 turns for context
-    recent_turns = conversation_history[-3:] if len(conversation_history) >= 3 else conversation_history
+    # (list() so bounded deque histories can be sliced too)
+    recent_turns = list(conversation_history)[-3:]
     
     for turn in recent_turns:
         if "mentioned_players" in turn:
@@ -267,11 +268,97 @@ User Query: {user_query}
     return prompt
 
 
+def _parsing_request(state: ChatbotState) -> Tuple[Any, List[BaseMessage]]:
+    """
+    Build the structured-output LLM and prompt messages for a query.
+    
+    Args:
+        state: Current chatbot state containing user query and conversation history
+        
+    Returns:
+        (structured_llm, messages)
+    """
+    user_query = state.get("user_query", "")
+    conversation_history = state.get("conversation_history", [])
+    
+    # Extract context from conversation history
+    context = extract_context_from_history(conversation_history)
+    
+    # Build prompt with context
+    system_prompt = build_parsing_prompt(user_query, context)
+    
+    # Initialize OpenAI with structured output
+    llm = ChatOpenAI(
+        model="gpt-4",
+        temperature=0,  # Deterministic parsing
+    )
+    
+    # Use structured output with Pydantic model
+    structured_llm = llm.with_structured_output(ParsedQuery)
+    
+    # Create messages
+    messages = [
+        SystemMessage(content=system_prompt),
+        HumanMessage(content=user_query)
+    ]
+    
+    return structured_llm, messages
+
+
+def _store_parsed_query(state: ChatbotState, parsed_result: ParsedQuery) -> ChatbotState:
+    """
+    Normalize the parsed query and store it in state.
+    
+    Args:
+        state: Current chatbot state
+        parsed_result: Structured output from the LLM
+        
+    Returns:
+        Updated state with parsed_query field populated
+    """
+    # Normalize stat names and team names
+    parsed_result.statistics = normalize_stat_names(parsed_result.statistics)
+    parsed_result.teams = normalize_team_names(parsed_result.teams)
+    
+    # Convert to dictionary for state
+    parsed_query_dict = parsed_result.model_dump()
+    
+    # Store parsed query in state
+    state["parsed_query"] = parsed_query_dict
+    
+    # If clarification is needed, set error to signal workflow
+    if parsed_result.needs_clarification:
+        state["error"] = "clarification_needed"
+        state["generated_response"] = parsed_result.clarification_question or \
+            "I need more information to answer your question. Could you please clarify?"
+    
+    return state
+
+
+def _parsing_error(e: Exception, state: ChatbotState) -> ChatbotError:
+    """Log a parsing failure and convert it to a ChatbotError."""
+    user_query = state.get("user_query", "")
+    log_error(
+        e,
+        context={"user_query": user_query[:100]},
+        level="warning"
+    )
+    
+    return ChatbotError(
+        error_type=ErrorType.QUERY_PARSING_ERROR,
+        message=f"Failed to parse query: {str(e)}",
+        details={"user_query": user_query[:200]},
+        recoverable=True
+    )
+
+
 async def parse_query(state: ChatbotState) -> ChatbotState:
     """
     Parse natural language query into structured format using OpenAI function calling.
     
     This is the main entry point for the Query Parser Node in the LangGraph workflow.
+    The OpenAI call is awaited, so other sessions keep running on the event
+    loop while it is in flight.
     
     Args:
         state: Current chatbot state containing user query and conversation history
@@ -287,65 +374,16 @@ async def parse_query(state: ChatbotState) -> ChatbotState:
         - 6.5: Requests clarification for ambiguous queries
     """
     try:
-        user_query = state.get("user_query", "")
-        conversation_history = state.get("conversation_history", [])
-        
-        # Extract context from conversation history
-        context = extract_context_from_history(conversation_history)
-        
-        # Build prompt with context
-        system_prompt = build_parsing_prompt(user_query, context)
-        
-        # Initialize OpenAI with structured output
-        llm = ChatOpenAI(
-            model="gpt-4",
-            temperature=0,  # Deterministic parsing
-        )
-        
-        # Use structured output with Pydantic model
-        structured_llm = llm.with_structured_output(ParsedQuery)
-        
-        # Create messages
-        messages = [
-            SystemMessage(content=system_prompt),
-            HumanMessage(content=user_query)
-        ]
+        structured_llm, messages = _parsing_request(state)
         
         # Parse the query
-        parsed_result: ParsedQuery = structured_llm.invoke(messages)
-        
-        # Normalize stat names and team names
-        parsed_result.statistics = normalize_stat_names(parsed_result.statistics)
-        parsed_result.teams = normalize_team_names(parsed_result.teams)
+        parsed_result: ParsedQuery = await structured_llm.ainvoke(messages)
         
-        # Convert to dictionary for state
-        parsed_query_dict = parsed_result.model_dump()
-        
-        # Store parsed query in state
-        state["parsed_query"] = parsed_query_dict
-        
-        # If clarification is needed, set error to signal workflow
-        if parsed_result.needs_clarification:
-            state["error"] = "clarification_needed"
-            state["generated_response"] = parsed_result.clarification_question or \
-                "I need more information to answer your question. Could you please clarify?"
-        
-        return state
+        return _store_parsed_query(state, parsed_result)
         
     except Exception as e:
         # Handle parsing errors
-        log_error(
-            e,
-            context={"user_query": user_query[:100]},
-            level="warning"
-        )
-        
-        raise ChatbotError(
-            error_type=ErrorType.QUERY_PARSING_ERROR,
-            message=f"Failed to parse query: {str(e)}",
-            details={"user_query": user_query[:200]},
-            recoverable=True
-        )
+        raise _parsing_error(e, state)
 
 
 # Synchronous version for non-async contexts
@@ -353,19 +391,22 @@ def parse_query_sync(state: ChatbotState) -> ChatbotState:
     """
     Synchronous version of parse_query for compatibility.
     
+    Makes the same blocking OpenAI call run_workflow has always made.
+    
     Args:
         state: Current chatbot state
         
     Returns:
         Updated state with parsed query
     """
-    import asyncio
-    
-    # Run async function in sync context
     try:
-        loop = asyncio.get_event_loop()
-    except RuntimeError:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-    
-    return loop.run_until_complete(parse_query(state))
+        structured_llm, messages = _parsing_request(state)
+        
+        # Parse the query
+        parsed_result: ParsedQuery = structured_llm.invoke(messages)
+        
+        return _store_parsed_query(state, parsed_result)
+        
+    except Exception as e:
+        # Handle parsing errors
+        raise _parsing_error(e, state)
@@ -12,13 +12,29 @@ Requirements addressed:
 - 7.1: Implement fallback logic when primary data source fails
 """
 
+import asyncio
 import logging
-from datetime import datetime
+import re
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Dict, List, Optional
 
 import pandas as pd
 
-from data_sources.base import DataSource
+try:
+    import numexpr  # noqa: F401
+    _QUERY_ENGINE = 'numexpr'
+except ImportError:
+    # Fall back to pandas' pure-Python evaluator when numexpr isn't installed
+    _QUERY_ENGINE = 'python'
+
+try:
+    import ahocorasick
+    _AHOCORASICK_AVAILABLE = True
+except ImportError:
+    _AHOCORASICK_AVAILABLE = False
+
+from data_sources.base import DataSource, current_nfl_season
 from data_sources.kaggle_source import KaggleDataSource
 from data_sources.nflreadpy_source import NFLReadPyDataSource
 from data_sources.espn_source import ESPNDataSource
@@ -33,6 +49,63 @@ from error_handler import (
 
 logger = logging.getLogger(__name__)
 
+# Column name mapping applied by normalize_data_format
+COLUMN_MAPPING = {
+    'player': 'player_name',
+    'year': 'season',
+    'tm': 'team',
+    'pos': 'position',
+    'pass_yds': 'passing_yards',
+    'pass_td': 'passing_touchdowns',
+    'rush_yds': 'rushing_yards',
+    'rush_td': 'rushing_touchdowns',
+    'rec_yds': 'receiving_yards',
+    'rec_td': 'receiving_touchdowns',
+    'rec': 'receptions',
+    'tgt': 'targets',
+    'att': 'attempts',
+    'cmp': 'completions',
+    'int': 'interceptions',
+}
+
+# Columns coerced to numeric types by normalize_data_format
+NUMERIC_COLUMNS = [
+    'passing_yards', 'passing_touchdowns', 'completions', 'attempts',
+    'interceptions', 'rushing_yards', 'rushing_touchdowns', 'rushing_attempts',
+    'receiving_yards', 'receiving_touchdowns', 'receptions', 'targets',
+    'season', 'week', 'games_played'
+]
+
+# Identifier columns stored as categoricals by normalize_data_format
+CATEGORICAL_COLUMNS = ('player_name', 'team', 'position', 'opponent', 'home_away')
+
+# Query aggregation names mapped to pandas reducers
+_AGG_FUNCS = {
+    'sum': 'sum',
+    'average': 'mean',
+    'avg': 'mean',
+    'mean': 'mean',
+    'max': 'max',
+    'maximum': 'max',
+    'min': 'min',
+    'minimum': 'min'
+}
+
+# One direct GroupBy reducer call per pandas reducer name
+_AGG_SPECIALIZED = {
+    'sum': lambda grouped: grouped.sum(),
+    'mean': lambda grouped: grouped.mean(),
+    'max': lambda grouped: grouped.max(),
+    'min': lambda grouped: grouped.min(),
+}
+
+# In-flight retrievals keyed by (player, season, week, stats). Shared across
+# threads and event loops (retrieve_data_sync runs a fresh loop per call),
+# so concurrent identical requests wait on one fetch instead of each
+# hitting the data source.
+_inflight: Dict[tuple, Future] = {}
+_inflight_lock = threading.Lock()
+
 # Import cache manager (lazy import to avoid circular dependencies)
 _cache_manager = None
 
@@ -46,6 +119,24 @@ def _get_cache():
     return _cache_manager
 
 
+# Shared router, so the data sources and per-era routing tables are built
+# once per process instead of on every retrieval
+_router = None
+_router_lock = threading.Lock()
+
+
+def _get_router() -> "DataSourceRouter":
+    """
+    Get the shared DataSourceRouter, rebuilding it when the NFL season rolls
+    over so its routing tables stay current in long-running processes.
+    """
+    global _router
+    with _router_lock:
+        if _router is None or _router.current_season != current_nfl_season():
+            _router = DataSourceRouter()
+        return _router
+
+
 class DataSourceRouter:
     """
     Routes data retrieval requests to appropriate data sources.
@@ -75,31 +166,51 @@ class DataSourceRouter:
         self.espn_source = ESPNDataSource(timeout=espn_timeout)
         
         # Define routing rules based on season
-        inferred_year = datetime.now().year
-        if datetime.now().month < 3:
-            inferred_year -= 1
-        self.current_season = current_season or inferred_year
+        self.current_season = current_season or current_nfl_season()
         self.kaggle_max_season = 2023
+        
+        # Precompute source priority per era so routing is a dict lookup
+        self._primary_by_era: Dict[str, DataSource] = {
+            'current': self.nflreadpy_source,
+            'historical': self.kaggle_source,
+            'gap': self.nflreadpy_source,
+        }
+        self._fallbacks_by_era: Dict[str, List[DataSource]] = {
+            'current': [self.espn_source, self.kaggle_source],
+            'historical': [self.nflreadpy_source, self.espn_source],
+            'gap': [self.espn_source, self.kaggle_source],
+        }
+    
+    def _season_era(self, season: Optional[int]) -> str:
+        """
+        Classify a season relative to the available data sources.
+        
+        Args:
+            season: NFL season year
+            
+        Returns:
+            'current' for the current season (or None), 'historical' for
+            seasons covered by Kaggle, 'gap' for seasons in between
+        """
+        if season is None or season >= self.current_season:
+            return 'current'
+        elif season <= self.kaggle_max_season:
+            return 'historical'
+        return 'gap'
     
     def get_primary_source(self, season: Optional[int]) -> DataSource:
         """
         Determine primary data source based on season.
         
+        Current and gap seasons use nflreadpy; historical seasons use Kaggle.
+        
         Args:
             season: NFL season year
             
         Returns:
             Primary data source for the season
         """
-        if season is None or season >= self.current_season:
-            # Current season - use nflreadpy
-            return self.nflreadpy_source
-        elif season <= self.kaggle_max_season:
-            # Historical data - use Kaggle
-            return self.kaggle_source
-        else:
-            # Gap between Kaggle and current - try nflreadpy first
-            return self.nflreadpy_source
+        return self._primary_by_era[self._season_era(season)]
     
     def get_fallback_sources(self, season: Optional[int]) -> List[DataSource]:
         """
@@ -111,15 +222,7 @@ class DataSourceRouter:
         Returns:
             List of fallback data sources in priority order
         """
-        if season is None or season >= self.current_season:
-            # Current season fallbacks
-            return [self.espn_source, self.kaggle_source]
-        elif season <= self.kaggle_max_season:
-            # Historical fallbacks
-            return [self.nflreadpy_source, self.espn_source]
-        else:
-            # Gap year fallbacks
-            return [self.espn_source, self.kaggle_source]
+        return self._fallbacks_by_era[self._season_era(season)]
     
     def retrieve_with_fallback(
         self,
@@ -247,6 +350,37 @@ class DataSourceRouter:
             )
 
 
+def _match_any_opponent(opponents: pd.Series, patterns: List[str]) -> pd.Series:
+    """
+    Build a mask of rows whose opponent contains any of several substrings.
+    
+    Uses a single Aho-Corasick automaton scan per value when pyahocorasick
+    is installed, otherwise a case-insensitive alternation of the escaped
+    patterns.
+    
+    Args:
+        opponents: Opponent column
+        patterns: Opponent substrings to match (case-insensitive)
+        
+    Returns:
+        Boolean mask aligned with opponents
+    """
+    if not _AHOCORASICK_AVAILABLE:
+        alternation = '|'.join(re.escape(pattern) for pattern in patterns)
+        return opponents.str.contains(alternation, case=False, na=False)
+    
+    automaton = ahocorasick.Automaton()
+    for pattern in patterns:
+        automaton.add_word(pattern.lower(), pattern)
+    automaton.make_automaton()
+    
+    def matches(value) -> bool:
+        return isinstance(value, str) and next(automaton.iter(value.lower()), None) is not None
+    
+    # On categorical columns map() runs once per category, not per row
+    return opponents.map(matches).astype(bool)
+
+
 def apply_filters(
     df: pd.DataFrame,
     filters: Dict
@@ -256,7 +390,8 @@ def apply_filters(
     
     Args:
         df: DataFrame with player statistics
-        filters: Dictionary of filters from parsed query
+        filters: Dictionary of filters from parsed query. 'opponent' may
+            be a single team or a list of teams.
             
     Returns:
         Filtered DataFrame
@@ -267,7 +402,13 @@ def apply_filters(
     if filters.get('opponent'):
         opponent = filters['opponent']
         if 'opponent' in result.columns:
-            result = result[result['opponent'].str.contains(opponent, case=False, na=False)]
+            if isinstance(opponent, str):
+                mask = result['opponent'].str.contains(
+                    opponent, case=False, regex=False, na=False
+                )
+            else:
+                mask = _match_any_opponent(result['opponent'], list(opponent))
+            result = result[mask]
     
     # Apply home/away filter
     if filters.get('home_away'):
@@ -275,23 +416,26 @@ def apply_filters(
         if 'home_away' in result.columns:
             result = result[result['home_away'].str.lower() == home_away]
     
-    # Apply min value filter
-    if filters.get('min_value') is not None:
-        min_val = filters['min_value']
-        # Apply to numeric columns
-        numeric_cols = result.select_dtypes(include=['number']).columns
-        for col in numeric_cols:
-            if col not in ['season', 'week', 'games_played']:
-                result = result[result[col] >= min_val]
-    
-    # Apply max value filter
-    if filters.get('max_value') is not None:
-        max_val = filters['max_value']
-        # Apply to numeric columns
-        numeric_cols = result.select_dtypes(include=['number']).columns
-        for col in numeric_cols:
-            if col not in ['season', 'week', 'games_played']:
-                result = result[result[col] <= max_val]
+    # Apply min/max value filters to numeric stat columns in one fused expression
+    min_val = filters.get('min_value')
+    max_val = filters.get('max_value')
+    if min_val is not None or max_val is not None:
+        filter_cols = [
+            col for col in result.select_dtypes(include=['number']).columns
+            if col not in ['season', 'week', 'games_played']
+        ]
+        conditions = []
+        for col in filter_cols:
+            if min_val is not None:
+                conditions.append(f"`{col}` >= @min_val")
+            if max_val is not None:
+                conditions.append(f"`{col}` <= @max_val")
+        if conditions:
+            result = result.query(
+                " and ".join(conditions),
+                engine=_QUERY_ENGINE,
+                local_dict={'min_val': min_val, 'max_val': max_val}
+            )
     
     return result
 
@@ -301,7 +445,8 @@ def normalize_data_format(df: pd.DataFrame) -> pd.DataFrame:
     Normalize data formats across different sources.
     
     Ensures consistent column names, data types, and structure
-    regardless of which data source provided the data.
+    regardless of which data source provided the data. Normalized frames
+    are tagged with attrs['normalized'] and returned as-is on later calls.
     
     Args:
         df: DataFrame from any data source
@@ -309,47 +454,34 @@ def normalize_data_format(df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         Normalized DataFrame
     """
-    result = df.copy()
+    if df.attrs.get('normalized'):
+        return df
     
-    # Standardize column names
-    column_mapping = {
-        'player': 'player_name',
-        'year': 'season',
-        'tm': 'team',
-        'pos': 'position',
-        'pass_yds': 'passing_yards',
-        'pass_td': 'passing_touchdowns',
-        'rush_yds': 'rushing_yards',
-        'rush_td': 'rushing_touchdowns',
-        'rec_yds': 'receiving_yards',
-        'rec_td': 'receiving_touchdowns',
-        'rec': 'receptions',
-        'tgt': 'targets',
-        'att': 'attempts',
-        'cmp': 'completions',
-        'int': 'interceptions',
-    }
-    
-    result = result.rename(columns=column_mapping)
-    
-    # Ensure numeric columns are proper type
-    numeric_columns = [
-        'passing_yards', 'passing_touchdowns', 'completions', 'attempts',
-        'interceptions', 'rushing_yards', 'rushing_touchdowns', 'rushing_attempts',
-        'receiving_yards', 'receiving_touchdowns', 'receptions', 'targets',
-        'season', 'week', 'games_played'
-    ]
-    
-    for col in numeric_columns:
-        if col in result.columns:
-            result[col] = pd.to_numeric(result[col], errors='coerce')
+    # Standardize column names (rename returns a new frame, so the
+    # source's cached DataFrame is never mutated below)
+    result = df.rename(columns=COLUMN_MAPPING)
+    
+    # Ensure numeric columns are proper type (single pass over the numeric block)
+    present = result.columns.intersection(NUMERIC_COLUMNS)
+    if len(present):
+        result[present] = result[present].apply(pd.to_numeric, errors='coerce')
+    
+    # Fill NaN values with 0 for statistics, then downcast the counting
+    # stats to the smallest integer dtype that holds them (int8/int16)
+    stat_present = present.difference(['season', 'week'])
+    if len(stat_present):
+        result[stat_present] = result[stat_present].fillna(0).apply(
+            pd.to_numeric, downcast='integer'
+        )
     
-    # Fill NaN values with 0 for statistics
-    stat_columns = [col for col in numeric_columns if col not in ['season', 'week']]
-    for col in stat_columns:
+    # Store low-cardinality identifier columns as categoricals so groupby
+    # and equality filters work on integer codes instead of Python strings
+    for col in CATEGORICAL_COLUMNS:
         if col in result.columns:
-            result[col] = result[col].fillna(0)
+            result[col] = result[col].astype('category')
     
+    result.attrs['normalized'] = True
+    result.attrs['numeric_cols'] = result.select_dtypes(include=['number']).columns.tolist()
     return result
 
 
@@ -381,8 +513,10 @@ def aggregate_data(
     if not group_by:
         return df
     
-    # Select numeric columns for aggregation
-    numeric_cols = df.select_dtypes(include=['number']).columns.tolist()
+    # Numeric columns recorded by normalize_data_format, if still accurate
+    numeric_cols = df.attrs.get('numeric_cols')
+    if numeric_cols is None or not set(numeric_cols).issubset(df.columns):
+        numeric_cols = df.select_dtypes(include=['number']).columns.tolist()
     
     # Exclude grouping columns
     agg_cols = [col for col in numeric_cols if col not in group_by]
@@ -391,27 +525,74 @@ def aggregate_data(
         return df
     
     # Perform aggregation
-    agg_func_map = {
-        'sum': 'sum',
-        'average': 'mean',
-        'avg': 'mean',
-        'mean': 'mean',
-        'max': 'max',
-        'maximum': 'max',
-        'min': 'min',
-        'minimum': 'min'
-    }
-    
-    agg_func = agg_func_map.get(aggregation.lower(), 'sum')
+    reducer = _AGG_SPECIALIZED[_AGG_FUNCS.get(aggregation.lower(), 'sum')]
     
     try:
-        result = df.groupby(group_by)[agg_cols].agg(agg_func).reset_index()
+        # observed=True keeps categorical keys from expanding into the
+        # cartesian product of every category combination
+        result = reducer(df.groupby(group_by, observed=True)[agg_cols]).reset_index()
         return result
     except Exception as e:
         logger.warning(f"Aggregation failed: {e}. Returning original data.")
         return df
 
 
+async def _retrieve_coalesced(
+    router: DataSourceRouter,
+    player_name: str,
+    season: Optional[int],
+    week: Optional[int],
+    stats: Optional[List[str]]
+) -> pd.DataFrame:
+    """
+    Retrieve player data, sharing one fetch among identical concurrent requests.
+    
+    The first caller for a key runs router.retrieve_with_fallback in a worker
+    thread; callers arriving while it is in flight await the same result
+    (or exception) instead of starting another fetch.
+    
+    Args:
+        router: DataSourceRouter used by the first caller
+        player_name: Name of the player
+        season: NFL season year
+        week: Specific week number
+        stats: List of specific statistics to retrieve
+        
+    Returns:
+        DataFrame containing the player's statistics
+    """
+    key = (player_name, season, week, tuple(stats) if stats else None)
+    
+    with _inflight_lock:
+        future = _inflight.get(key)
+        is_owner = future is None
+        if is_owner:
+            future = Future()
+            _inflight[key] = future
+    
+    if not is_owner:
+        logger.debug(f"Joining in-flight retrieval for {player_name}")
+        return await asyncio.wrap_future(future)
+    
+    try:
+        result = await asyncio.to_thread(
+            router.retrieve_with_fallback,
+            player_name=player_name,
+            season=season,
+            week=week,
+            stats=stats
+        )
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    else:
+        future.set_result(result)
+        return result
+    finally:
+        with _inflight_lock:
+            _inflight.pop(key, None)
+
+
 async def retrieve_data(state: ChatbotState) -> ChatbotState:
     """
     Retrieve player statistics based on parsed query.
@@ -469,11 +650,11 @@ async def retrieve_data(state: ChatbotState) -> ChatbotState:
         cached_result = cache.get_query_result(query_params)
         if cached_result is not None:
             logger.info(f"Returning cached query result for {len(players)} player(s)")
-            state["retrieved_data"] = cached_result
+            # Cached frames are read-only; callers get their own copy
+            state["retrieved_data"] = cached_result.copy()
             return state
         
-        # Initialize router
-        router = DataSourceRouter()
+        router = _get_router()
         
         # Retrieve data for each player
         all_data = []
@@ -488,8 +669,10 @@ async def retrieve_data(state: ChatbotState) -> ChatbotState:
                     if specific_weeks:
                         week = specific_weeks[0]
                 
-                # Retrieve data with fallback
-                player_data = router.retrieve_with_fallback(
+                # Retrieve data with fallback (coalesced with identical
+                # in-flight requests)
+                player_data = await _retrieve_coalesced(
+                    router,
                     player_name=player,
                     season=season,
                     week=week,
@@ -522,8 +705,11 @@ async def retrieve_data(state: ChatbotState) -> ChatbotState:
                 recoverable=True
             )
         
-        # Combine all player data
-        combined_data = pd.concat(all_data, ignore_index=True)
+        # Combine all player data (single-player queries skip the concat copy)
+        if len(all_data) == 1:
+            combined_data = all_data[0]
+        else:
+            combined_data = pd.concat(all_data, ignore_index=True, copy=False)
         
         # Apply aggregation if requested
         if aggregation:
@@ -567,19 +753,22 @@ def retrieve_data_sync(state: ChatbotState) -> ChatbotState:
     """
     Synchronous version of retrieve_data for compatibility.
     
+    Runs the coroutine on a fresh event loop via asyncio.run. When called
+    from a thread that already has a running loop (e.g. a sync workflow
+    invoked from a Chainlit handler), the coroutine is run on a fresh loop
+    in a worker thread instead, since the running loop cannot be re-entered.
+    
     Args:
         state: Current chatbot state
         
     Returns:
         Updated state with retrieved data
     """
-    import asyncio
-    
-    # Run async function in sync context
     try:
-        loop = asyncio.get_event_loop()
+        asyncio.get_running_loop()
     except RuntimeError:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
+        # No running loop in this thread
+        return asyncio.run(retrieve_data(state))
     
-    return loop.run_until_complete(retrieve_data(state))
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, retrieve_data(state)).result()
@@ -9,6 +9,7 @@ import logging
 import os
 from dotenv import load_dotenv
 from workflow import run_workflow, configure_logging
+from cache_utils import warm_nflreadpy_cache
 
 # Load environment variables
 load_dotenv()
@@ -198,6 +199,9 @@ def main():
         print("Please set up your .env file with your OpenAI API key.\n")
         return
     
+    # Pre-fetch the current season so the first query doesn't pay the cold load
+    warm_nflreadpy_cache()
+    
     # Parse command line arguments
     if len(sys.argv) > 1:
         if sys.argv[1] == "interactive":
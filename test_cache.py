@@ -12,6 +12,7 @@ import logging
 import time
 from datetime import timedelta
 import pandas as pd
+import pytest
 
 from cache_manager import CacheManager, get_cache_manager, initialize_cache_manager
 from cache_utils import (
@@ -31,38 +32,46 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def test_cache_manager_initialization():
-    """Test cache manager initialization."""
-    print("\n" + "=" * 80)
-    print("TEST: Cache Manager Initialization")
-    print("=" * 80)
-    
-    # Initialize with custom settings
+@pytest.fixture(scope="module")
+def cache():
+    """Shared global cache manager for the whole module."""
     cache = initialize_cache_manager(
         kaggle_cache_enabled=True,
         nflreadpy_ttl_hours=1,  # Short TTL for testing
         query_cache_capacity=10,
         query_cache_ttl_hours=1
     )
+    yield cache
+    cache.close()
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache(cache):
+    """Start every test from empty caches instead of rebuilding the manager."""
+    cache.clear_all()
+
+
+def test_cache_manager_initialization(cache):
+    """Test cache manager initialization."""
+    print("\n" + "=" * 80)
+    print("TEST: Cache Manager Initialization")
+    print("=" * 80)
     
     assert cache is not None, "Cache manager should be initialized"
+    assert cache is get_cache_manager(), "Fixture should be the global cache manager"
     print("✓ Cache manager initialized successfully")
     
     # Get stats
     stats = cache.get_stats()
     print(f"✓ Initial stats retrieved: {stats}")
-    
-    return cache
 
 
-def test_kaggle_cache():
+def test_kaggle_cache(cache):
     """Test Kaggle dataset caching."""
     print("\n" + "=" * 80)
     print("TEST: Kaggle Dataset Cache")
     print("=" * 80)
     
-    cache = get_cache_manager()
-    
     # Create sample data
     sample_data = pd.DataFrame({
         'player_name': ['Patrick Mahomes', 'Josh Allen', 'Joe Burrow'],
@@ -81,6 +90,15 @@ def test_kaggle_cache():
     assert len(cached_data) == 3, "Should have 3 records"
     print(f"✓ Retrieved {len(cached_data)} records from cache")
     
+    # Cached frames are shared, not copied, so in-place writes must fail
+    try:
+        cached_data.loc[0, 'passing_yards'] = 0
+        assert False, "Cached data should be read-only"
+    except ValueError:
+        pass
+    assert cached_data['passing_yards'].iloc[0] == 5250, "Cached data should be unchanged"
+    print("✓ Cached data is read-only")
+    
     # Get cache info
     info = cache.get_kaggle_cache_info()
     print(f"✓ Cache info: {info}")
@@ -91,14 +109,12 @@ def test_kaggle_cache():
     print("✓ Cache cleared successfully")
 
 
-def test_nflreadpy_cache():
+def test_nflreadpy_cache(cache):
     """Test nflreadpy data caching with TTL."""
     print("\n" + "=" * 80)
     print("TEST: nflreadpy Data Cache (with TTL)")
     print("=" * 80)
     
-    cache = get_cache_manager()
-    
     # Create sample data
     sample_data = pd.DataFrame({
         'player_name': ['Patrick Mahomes'],
@@ -138,14 +154,12 @@ def test_nflreadpy_cache():
     print("✓ Invalidation verified")
 
 
-def test_query_cache():
+def test_query_cache(cache):
     """Test query results caching."""
     print("\n" + "=" * 80)
     print("TEST: Query Results Cache")
     print("=" * 80)
     
-    cache = get_cache_manager()
-    
     # Create sample query and result
     query_params = {
         "players": ["Patrick Mahomes"],
@@ -166,6 +180,11 @@ def test_query_cache():
     cache.set_query_result(query_params, result_data)
     print("✓ Query result cached")
     
+    # The cache keeps its own frozen copy; the caller's frame stays writable
+    result_data.loc[0, 'passing_yards'] = 0
+    assert cache.get_query_result(query_params)['passing_yards'].iloc[0] == 5250, "Cached result should be unchanged"
+    print("✓ Caller's frame stays writable")
+    
     # Retrieve from cache
     cached_result = cache.get_query_result(query_params)
     assert cached_result is not None, "Should retrieve cached result"
@@ -183,6 +202,30 @@ def test_query_cache():
     print(f"✓ Query cache stats: hits={stats['hits']}, misses={stats['misses']}, hit_rate={stats['hit_rate']}%")
 
 
+def test_query_key_canonicalization(cache):
+    """Test that query cache keys depend on parameter values, not ordering."""
+    print("\n" + "=" * 80)
+    print("TEST: Query Key Canonicalization")
+    print("=" * 80)
+    
+    # Key order (including nested filters) must not change the key
+    params_a = {"players": ["Josh Allen"], "season": 2023, "filters": {"opponent": "KC", "home_away": "home"}}
+    params_b = {"filters": {"home_away": "home", "opponent": "KC"}, "season": 2023, "players": ["Josh Allen"]}
+    assert cache._make_query_key(params_a) == cache._make_query_key(params_b), \
+        "Equal params should produce the same key"
+    print("✓ Parameter ordering ignored")
+    
+    # DataFrame-valued params key on column names and contents
+    df = pd.DataFrame({'passing_yards': [300, 250]})
+    same_df = pd.DataFrame({'passing_yards': [300, 250]})
+    renamed_df = pd.DataFrame({'rushing_yards': [300, 250]})
+    assert cache._make_query_key({"data": df}) == cache._make_query_key({"data": same_df}), \
+        "Equal DataFrames should produce the same key"
+    assert cache._make_query_key({"data": df}) != cache._make_query_key({"data": renamed_df}), \
+        "DataFrames with different columns should produce different keys"
+    print("✓ DataFrame params hashed by content and columns")
+
+
 def test_cache_expiration():
     """Test cache TTL and expiration."""
     print("\n" + "=" * 80)
@@ -190,7 +233,8 @@ def test_cache_expiration():
     print("=" * 80)
     
     # Create cache with very short TTL for testing
-    cache = initialize_cache_manager(
+    # (a standalone manager so the shared fixture keeps its settings)
+    cache = CacheManager(
         kaggle_cache_enabled=True,
         nflreadpy_ttl_hours=0.0001,  # ~0.36 seconds
         query_cache_capacity=10,
@@ -221,6 +265,8 @@ def test_cache_expiration():
     
     cleanup_results = cache.cleanup_expired()
     print(f"✓ Cleanup removed {cleanup_results['nflreadpy']} expired entries")
+    
+    cache.close()
 
 
 def test_lru_eviction():
@@ -230,7 +276,8 @@ def test_lru_eviction():
     print("=" * 80)
     
     # Create cache with small capacity
-    cache = initialize_cache_manager(
+    # (a standalone manager so the shared fixture keeps its settings)
+    cache = CacheManager(
         kaggle_cache_enabled=True,
         nflreadpy_ttl_hours=24,
         query_cache_capacity=3,  # Small capacity for testing
@@ -256,9 +303,11 @@ def test_lru_eviction():
         cached = cache.get_query_result(params)
         assert cached is not None, f"Item {i} should still be in cache"
     print("✓ Recent items retained in cache")
+    
+    cache.close()
 
 
-def test_cache_statistics():
+def test_cache_statistics(cache):
     """Test cache statistics reporting."""
     print("\n" + "=" * 80)
     print("TEST: Cache Statistics")
@@ -275,30 +324,19 @@ def test_cache_statistics():
 
 
 def run_all_tests():
-    """Run all cache tests."""
+    """Run all cache tests (shim kept for running this file as a script)."""
     print("\n" + "=" * 80)
     print("RUNNING CACHE TESTS")
     print("=" * 80)
     
-    try:
-        test_cache_manager_initialization()
-        test_kaggle_cache()
-        test_nflreadpy_cache()
-        test_query_cache()
-        test_cache_expiration()
-        test_lru_eviction()
-        test_cache_statistics()
-        
-        print("\n" + "=" * 80)
-        print("✓ ALL TESTS PASSED")
-        print("=" * 80 + "\n")
-        
-    except AssertionError as e:
-        print(f"\n✗ TEST FAILED: {e}\n")
-        raise
-    except Exception as e:
-        print(f"\n✗ ERROR: {e}\n")
-        raise
+    exit_code = pytest.main([__file__, "-v", "-s"])
+    if exit_code != 0:
+        print(f"\n✗ TESTS FAILED (pytest exit code {exit_code})\n")
+        raise SystemExit(exit_code)
+    
+    print("\n" + "=" * 80)
+    print("✓ ALL TESTS PASSED")
+    print("=" * 80 + "\n")
 
 
 if __name__ == "__main__":
@@ -6,12 +6,16 @@ can remember context and handle follow-up questions correctly.
 """
 
 import logging
-from workflow import run_workflow, configure_logging
+import os
+from workflow import run_workflow, run_workflow_batch, configure_logging
 
 # Configure logging
 configure_logging("INFO")
 logger = logging.getLogger(__name__)
 
+# Set TEST_VERBOSE=0 to skip the per-turn display (e.g. in CI)
+VERBOSE = os.getenv("TEST_VERBOSE", "1") == "1"
+
 
 def test_conversation_flow():
     """Test a multi-turn conversation with follow-up questions."""
@@ -35,44 +39,44 @@ def test_conversation_flow():
         "Who had more yards?"
     ]
     
-    for i, query in enumerate(test_queries, 1):
+    # Run all turns through one compiled workflow; session history carries over
+    results = run_workflow_batch(test_queries, session_state)
+    
+    for i, (query, result) in enumerate(zip(test_queries, results), 1):
         print(f"\n{'='*80}")
         print(f"Turn {i}: {query}")
         print('='*80)
         
-        # Run workflow with session state
-        result = run_workflow(query, session_state)
-        
-        # Update session state with conversation history
-        session_state["conversation_history"] = result.get("conversation_history", [])
-        
         # Display results
-        print(f"\nParsed Query:")
-        parsed = result.get("parsed_query", {})
-        print(f"  Players: {parsed.get('players', [])}")
-        print(f"  Statistics: {parsed.get('statistics', [])}")
-        print(f"  Time Period: {parsed.get('time_period', {})}")
-        print(f"  Comparison: {parsed.get('comparison', False)}")
-        
-        print(f"\nResponse:")
-        response = result.get("generated_response", "No response")
-        # Truncate for readability
-        if len(response) > 300:
-            print(f"  {response[:300]}...")
-        else:
-            print(f"  {response}")
-        
-        if result.get("error"):
-            print(f"\nError: {result['error']}")
-        
-        print(f"\nConversation History Size: {len(session_state['conversation_history'])} turns")
+        if VERBOSE:
+            print(f"\nParsed Query:")
+            parsed = result.get("parsed_query", {})
+            print(f"  Players: {parsed.get('players', [])}")
+            print(f"  Statistics: {parsed.get('statistics', [])}")
+            print(f"  Time Period: {parsed.get('time_period', {})}")
+            print(f"  Comparison: {parsed.get('comparison', False)}")
+            
+            print(f"\nResponse:")
+            response = result.get("generated_response", "No response")
+            # Truncate for readability
+            if len(response) > 300:
+                print(f"  {response[:300]}...")
+            else:
+                print(f"  {response}")
+            
+            if result.get("error"):
+                print(f"\nError: {result['error']}")
+            
+            print(f"\nConversation History Size: {len(session_state['conversation_history'])} turns")
         
         # Show what's in memory
         if session_state['conversation_history']:
             last_turn = session_state['conversation_history'][-1]
-            print(f"Last Turn Memory:")
-            print(f"  - Players mentioned: {last_turn.get('mentioned_players', [])}")
-            print(f"  - Stats mentioned: {last_turn.get('mentioned_stats', [])}")
+            logger.info(
+                "Last turn memory: players=%s, stats=%s",
+                last_turn.get('mentioned_players', []),
+                last_turn.get('mentioned_stats', [])
+            )
     
     print("\n" + "="*80)
     print("Conversation Test Complete!")
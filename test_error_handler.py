@@ -2,6 +2,8 @@
 Test script for error handler module.
 """
 
+import os
+
 from error_handler import (
     ErrorType,
     ChatbotError,
@@ -10,6 +12,9 @@ from error_handler import (
     create_error_response
 )
 
+# Set TEST_VERBOSE=0 to skip printing the generated messages (e.g. in CI)
+VERBOSE = os.getenv("TEST_VERBOSE", "1") == "1"
+
 def test_error_messages():
     """Test user-friendly error messages."""
     print("\n" + "=" * 80)
@@ -26,8 +31,9 @@ def test_error_messages():
     
     for error_type in error_types:
         msg = get_user_friendly_message(error_type, include_suggestions=False)
-        print(f"\n{error_type.value}:")
-        print(f"  {msg}")
+        if VERBOSE:
+            print(f"\n{error_type.value}:")
+            print(f"  {msg}")
 
 
 def test_chatbot_error():
@@ -44,10 +50,11 @@ def test_chatbot_error():
             recoverable=True
         )
     except ChatbotError as e:
-        print(f"\nError Type: {e.error_type.value}")
-        print(f"Message: {e.message}")
-        print(f"Recoverable: {e.recoverable}")
-        print(f"Details: {e.details}")
+        if VERBOSE:
+            print(f"\nError Type: {e.error_type.value}")
+            print(f"Message: {e.message}")
+            print(f"Recoverable: {e.recoverable}")
+            print(f"Details: {e.details}")
 
 
 def test_handle_error():
@@ -64,10 +71,11 @@ def test_handle_error():
             context={"test": "context", "operation": "test_operation"},
             default_error_type=ErrorType.UNKNOWN_ERROR
         )
-        print(f"\nError Type: {error_info['error_type']}")
-        print(f"Recoverable: {error_info['recoverable']}")
-        print(f"User Message (first 150 chars):")
-        print(f"  {error_info['user_message'][:150]}...")
+        if VERBOSE:
+            print(f"\nError Type: {error_info['error_type']}")
+            print(f"Recoverable: {error_info['recoverable']}")
+            print(f"User Message (first 150 chars):")
+            print(f"  {error_info['user_message'][:150]}...")
 
 
 def test_error_response():
@@ -82,9 +90,10 @@ def test_error_response():
         details={"player": "Patrick Mahomes", "season": 2023}
     )
     
-    print(f"\nError: {response['error']}")
-    print(f"Generated Response (first 150 chars):")
-    print(f"  {response['generated_response'][:150]}...")
+    if VERBOSE:
+        print(f"\nError: {response['error']}")
+        print(f"Generated Response (first 150 chars):")
+        print(f"  {response['generated_response'][:150]}...")
 
 
 if __name__ == "__main__":
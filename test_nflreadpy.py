@@ -3,6 +3,7 @@ Test script for nflreadpy data fetching functionality.
 """
 
 import logging
+import os
 from data_sources.nflreadpy_source import NFLReadPyDataSource
 
 # Set up logging
@@ -13,6 +14,9 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+# Set TEST_VERBOSE=0 to skip dumping fetched DataFrames (e.g. in CI)
+VERBOSE = os.getenv("TEST_VERBOSE", "1") == "1"
+
 
 def test_nflreadpy_availability():
     """Test if nflreadpy is available."""
@@ -46,9 +50,10 @@ def test_fetch_player_stats(source):
             
             print(f"✓ Successfully fetched data")
             print(f"  Rows: {len(stats)}")
-            print(f"  Columns: {list(stats.columns)}")
+            if VERBOSE:
+                print(f"  Columns: {list(stats.columns)}")
             
-            if not stats.empty:
+            if VERBOSE and not stats.empty:
                 print(f"\nSample data:")
                 print(stats.head())
             
@@ -100,9 +105,10 @@ def test_specific_stats(source):
         )
         
         print(f"✓ Successfully fetched specific stats")
-        print(f"  Columns returned: {list(stats.columns)}")
+        if VERBOSE:
+            print(f"  Columns returned: {list(stats.columns)}")
         
-        if not stats.empty:
+        if VERBOSE and not stats.empty:
             print(f"\nData:")
             print(stats)
         
@@ -34,6 +34,10 @@ def test_player_name_normalization():
     # Test whitespace handling
     assert normalize_player_name("  josh allen  ") == "Josh Allen"
     
+    # Test punctuation/spacing variants of known corrections
+    assert normalize_player_name("Patrick-Mahomes") == "Patrick Mahomes"
+    assert normalize_player_name("cee dee lamb") == "CeeDee Lamb"
+    
     # Test special cases
     assert "Mc" in normalize_player_name("christian mccaffrey")
     
@@ -59,6 +63,36 @@ def test_fuzzy_matching():
     print("✓ Fuzzy matching tests passed")
 
 
+def test_fuzzy_matching_backends_agree():
+    """Test that the difflib fallback scores names like rapidfuzz."""
+    print("\nTesting fuzzy matching with and without rapidfuzz...")
+    
+    import validators
+    if not validators._RAPIDFUZZ_AVAILABLE:
+        print("✓ Skipped (rapidfuzz not installed)")
+        return
+    
+    available_names = [
+        "Patrick Mahomes", "Josh Allen", "Joe Burrow", "Lamar Jackson",
+        "Jalen Hurts", "Josh Jacobs", "Joe Flacco", "Justin Jefferson"
+    ]
+    queries = ["patrick mahommes", "josh alen", "jo burow", "jalen hurst", "justin jeferson", "joe"]
+    
+    for query in queries:
+        with_rapidfuzz = find_similar_player_names(query, available_names, threshold=0.5)
+        validators._RAPIDFUZZ_AVAILABLE = False
+        try:
+            fallback = find_similar_player_names(query, available_names, threshold=0.5)
+        finally:
+            validators._RAPIDFUZZ_AVAILABLE = True
+        
+        assert [name for name, _ in fallback] == [name for name, _ in with_rapidfuzz], query
+        for (_, expected), (_, actual) in zip(with_rapidfuzz, fallback):
+            assert abs(expected - actual) < 1e-9, query
+    
+    print("✓ Both backends return the same matches and scores")
+
+
 def test_season_validation():
     """Test season validation."""
     print("\nTesting season validation...")
@@ -166,7 +200,8 @@ def test_dataframe_normalization():
         "Pass TD": [3, 2],
         "Comp": [25, 22],
         "Att": [35, 30],
-        "Season": [2023, 2023]
+        "Season": [2023, 2023],
+        "Team": [" KC ", None]
     })
     
     # Normalize columns
@@ -184,6 +219,9 @@ def test_dataframe_normalization():
     assert df_normalized["player_name"].iloc[0] == "Patrick Mahomes"
     assert df_normalized["player_name"].iloc[1] == "Josh Allen"
     
+    # Check that string columns are stripped and keep missing values as None
+    assert df_normalized["team"].tolist() == ["KC", None]
+    
     print("✓ DataFrame normalization tests passed")
 
 
@@ -217,6 +255,7 @@ if __name__ == "__main__":
     
     test_player_name_normalization()
     test_fuzzy_matching()
+    test_fuzzy_matching_backends_agree()
     test_season_validation()
     test_week_validation()
     test_time_period_validation()
@@ -0,0 +1,34 @@
+"""
+Shared helpers for the test suite.
+"""
+
+from typing import Any
+
+from models.models import ChatbotState
+
+
+def make_state(**overrides: Any) -> ChatbotState:
+    """
+    Build a fresh ChatbotState for a test.
+    
+    Every call creates new messages, parsed_query and conversation_history
+    containers, so a test that mutates its state can't leak into another.
+    
+    Args:
+        **overrides: Fields to set instead of the defaults
+        
+    Returns:
+        New chatbot state
+    """
+    state: ChatbotState = {
+        "messages": [],
+        "user_query": "",
+        "parsed_query": {},
+        "retrieved_data": None,
+        "generated_response": "",
+        "conversation_history": [],
+        "error": None,
+        "session_id": "test-session"
+    }
+    state.update(overrides)
+    return state
@@ -0,0 +1,120 @@
+"""
+Unit tests for the LLM Node prompt assembly.
+
+Covers message construction only; no LLM calls are made.
+"""
+
+import asyncio
+import unittest
+from unittest import mock
+
+import pandas as pd
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
+
+from nodes.llm_node import (
+    HISTORY_BLOCK_SIZE,
+    INSIGHT_SYSTEM_PROMPT,
+    build_llm_messages,
+    format_history_messages,
+    generate_insights,
+    generate_insights_sync,
+)
+from nodes.memory import MemoryHistory
+
+
+class TestBuildLLMMessages(unittest.TestCase):
+    """Test cases for build_llm_messages."""
+    
+    def _state(self, user_query, history):
+        return {
+            "user_query": user_query,
+            "parsed_query": {"players": ["Josh Allen"], "statistics": ["passing_yards"]},
+            "retrieved_data": pd.DataFrame({"player_name": ["Josh Allen"], "passing_yards": [4306]}),
+            "conversation_history": history
+        }
+    
+    def test_dynamic_content_is_at_the_tail(self):
+        """Test that the retrieved data and question come last."""
+        messages = build_llm_messages(self._state("How did Josh Allen do?", []))
+        
+        self.assertEqual(messages[0], SystemMessage(content=INSIGHT_SYSTEM_PROMPT))
+        self.assertIn("PLAYER STATISTICS", messages[-2].content)
+        self.assertEqual(messages[-1], HumanMessage(content="User's question: How did Josh Allen do?"))
+    
+    def test_prefix_is_stable_across_turns(self):
+        """Test that a new turn only appends to the previous prompt prefix."""
+        history = [{"user_query": "How did Josh Allen do?", "bot_response": "He threw for 4,306 yards."}]
+        first = build_llm_messages(self._state("How did Josh Allen do?", []))
+        second = build_llm_messages(self._state("What about his touchdowns?", history))
+        
+        # Everything before the data and question is replayed byte for byte
+        self.assertEqual(second[:len(first) - 2], first[:-2])
+        self.assertEqual(second[len(first) - 2].content, "How did Josh Allen do?")
+    
+    def test_history_window_advances_in_blocks(self):
+        """Test that replayed history only resets at block boundaries."""
+        history = MemoryHistory()
+        previous = None
+        resets = []
+        for i in range(3 * HISTORY_BLOCK_SIZE):
+            history.append({"user_query": f"Q{i}", "bot_response": f"A{i}"})
+            messages = format_history_messages(history)
+            if previous is not None and messages[:len(previous)] != previous:
+                resets.append(history.total_turns)
+            previous = messages
+        
+        # Evicted turns still count, so the bounded history keeps the blocks
+        self.assertEqual(resets, [2 * HISTORY_BLOCK_SIZE, 3 * HISTORY_BLOCK_SIZE])
+        self.assertEqual(messages[0].content, f"Q{2 * HISTORY_BLOCK_SIZE}")
+    
+    def test_context_kept_without_response(self):
+        """Test that a turn without a response still carries its context."""
+        history = [{"user_query": "Josh Allen?", "bot_response": None,
+                    "mentioned_players": ["Josh Allen"], "mentioned_stats": []}]
+        
+        messages = format_history_messages(history)
+        
+        self.assertEqual(messages, [
+            HumanMessage(content="Josh Allen?"),
+            AIMessage(content="[Context: Players: Josh Allen]")
+        ])
+
+
+
+class TestGenerateInsights(unittest.TestCase):
+    """Test cases for the async and sync LLM calls."""
+    
+    def _state(self):
+        return {
+            "user_query": "How did Josh Allen do?",
+            "parsed_query": {"players": ["Josh Allen"], "statistics": ["passing_yards"]},
+            "retrieved_data": pd.DataFrame({"player_name": ["Josh Allen"], "passing_yards": [4306]}),
+            "conversation_history": []
+        }
+    
+    def test_async_path_awaits_the_llm(self):
+        """Test that generate_insights does not block the event loop on the LLM call."""
+        with mock.patch("nodes.llm_node.ChatOpenAI") as chat:
+            llm = chat.return_value
+            llm.ainvoke = mock.AsyncMock(return_value=AIMessage(content="Great season."))
+            
+            state = asyncio.run(generate_insights(self._state()))
+        
+        self.assertEqual(state["generated_response"], "Great season.")
+        llm.ainvoke.assert_awaited_once()
+        llm.invoke.assert_not_called()
+    
+    def test_sync_path_invokes_the_llm(self):
+        """Test that generate_insights_sync keeps the blocking call."""
+        with mock.patch("nodes.llm_node.ChatOpenAI") as chat:
+            llm = chat.return_value
+            llm.invoke.return_value = AIMessage(content="Great season.")
+            
+            state = generate_insights_sync(self._state())
+        
+        self.assertEqual(state["generated_response"], "Great season.")
+        llm.invoke.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
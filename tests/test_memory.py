@@ -17,18 +17,21 @@ from nodes.memory import (
     extract_mentioned_stats,
     create_conversation_turn,
     get_memory_summary,
+    MemoryHistory,
     MAX_CONVERSATION_HISTORY
 )
-from models.models import ChatbotState, ConversationTurn
+from models.models import ConversationTurn
+from tests.helpers import make_state
 
 
 class TestMemoryNode(unittest.TestCase):
     """Test cases for Memory Node functionality."""
     
     def test_initialize_memory(self):
-        """Test that memory initializes as empty list."""
+        """Test that memory initializes as an empty bounded history."""
         history = initialize_memory()
-        self.assertIsInstance(history, list)
+        self.assertIsInstance(history, MemoryHistory)
+        self.assertEqual(history.maxlen, MAX_CONVERSATION_HISTORY)
         self.assertEqual(len(history), 0)
     
     def test_extract_mentioned_players(self):
@@ -72,18 +75,32 @@ class TestMemoryNode(unittest.TestCase):
         self.assertTrue(len(turn.mentioned_stats) > 0)
         self.assertIsInstance(turn.timestamp, datetime)
     
+    def test_conversation_turn_from_untrusted(self):
+        """Test validation of externally supplied ConversationTurn fields."""
+        turn = ConversationTurn.from_untrusted(
+            user_query="Who led the league in rushing?",
+            bot_response="Derrick Henry.",
+            mentioned_players=("Derrick Henry",),
+            timestamp="2024-01-07T12:00:00"
+        )
+        
+        self.assertEqual(turn.mentioned_players, ["Derrick Henry"])
+        self.assertEqual(turn.timestamp, datetime(2024, 1, 7, 12, 0))
+        
+        with self.assertRaises(ValueError):
+            ConversationTurn.from_untrusted(user_query=None, bot_response="x")
+        with self.assertRaises(ValueError):
+            ConversationTurn.from_untrusted(user_query="q", bot_response="r", mentioned_stats=[1])
+        with self.assertRaises(ValueError):
+            ConversationTurn.from_untrusted(user_query="q", bot_response="r", extra=True)
+    
     def test_update_memory_single_turn(self):
         """Test updating memory with a single conversation turn."""
-        state: ChatbotState = {
-            "messages": [],
-            "user_query": "How did Patrick Mahomes perform?",
-            "parsed_query": {"players": ["Patrick Mahomes"], "statistics": ["passing_yards"]},
-            "retrieved_data": None,
-            "generated_response": "Patrick Mahomes had 4,183 passing yards.",
-            "conversation_history": [],
-            "error": None,
-            "session_id": "test-session"
-        }
+        state = make_state(
+            user_query="How did Patrick Mahomes perform?",
+            parsed_query={"players": ["Patrick Mahomes"], "statistics": ["passing_yards"]},
+            generated_response="Patrick Mahomes had 4,183 passing yards."
+        )
         
         updated_state = update_memory(state)
         
@@ -94,16 +111,7 @@ class TestMemoryNode(unittest.TestCase):
     
     def test_update_memory_max_history(self):
         """Test that memory maintains only last 10 turns."""
-        state: ChatbotState = {
-            "messages": [],
-            "user_query": "",
-            "parsed_query": {},
-            "retrieved_data": None,
-            "generated_response": "",
-            "conversation_history": [],
-            "error": None,
-            "session_id": "test-session"
-        }
+        state = make_state()
         
         # Add 12 turns
         for i in range(12):
@@ -111,6 +119,12 @@ class TestMemoryNode(unittest.TestCase):
             state["generated_response"] = f"Response {i+1}"
             state["parsed_query"] = {"players": [f"Player{i+1}"], "statistics": ["yards"]}
             state = update_memory(state)
+            
+            with self.subTest(turn=i + 1):
+                self.assertEqual(
+                    len(state["conversation_history"]),
+                    min(i + 1, MAX_CONVERSATION_HISTORY)
+                )
         
         # Should only keep last 10
         self.assertEqual(len(state["conversation_history"]), MAX_CONVERSATION_HISTORY)
@@ -159,16 +173,11 @@ class TestMemoryNode(unittest.TestCase):
     
     def test_clear_memory(self):
         """Test clearing conversation history."""
-        state: ChatbotState = {
-            "messages": [],
-            "user_query": "Test query",
-            "parsed_query": {},
-            "retrieved_data": None,
-            "generated_response": "Test response",
-            "conversation_history": [{"user_query": "Old query", "bot_response": "Old response"}],
-            "error": None,
-            "session_id": "test-session"
-        }
+        state = make_state(
+            user_query="Test query",
+            generated_response="Test response",
+            conversation_history=[{"user_query": "Old query", "bot_response": "Old response"}]
+        )
         
         cleared_state = clear_memory(state)
         
@@ -213,18 +222,45 @@ class TestMemoryNode(unittest.TestCase):
         self.assertIn("Patrick Mahomes", summary["unique_players"])
         self.assertIn("Josh Allen", summary["unique_players"])
     
+    def test_memory_history_summary_tracks_eviction(self):
+        """Test that MemoryHistory's running counts match a full rescan."""
+        history = MemoryHistory(maxlen=2)
+        turns = [
+            {"user_query": "Q1", "mentioned_players": ["Josh Allen"], "mentioned_stats": ["yards"]},
+            {"user_query": "Q2", "mentioned_players": ["Patrick Mahomes"], "mentioned_stats": []},
+            {"user_query": "Q3", "mentioned_players": ["Patrick Mahomes"], "mentioned_stats": ["touchdowns"]},
+        ]
+        for turn in turns:
+            history.append(turn)
+        
+        summary = get_memory_summary(history)
+        rescanned = get_memory_summary(list(history))
+        
+        # Q1 was evicted, so Josh Allen and yards are no longer counted
+        self.assertEqual(summary["turn_count"], 2)
+        self.assertEqual(summary["total_players"], 2)
+        self.assertEqual(summary["unique_players"], ["Patrick Mahomes"])
+        self.assertEqual(summary["unique_stats"], ["touchdowns"])
+        self.assertEqual(summary, rescanned)
+    
+    def test_memory_history_reads_back_lists(self):
+        """Test that stored turns read back like ConversationTurn.to_dict()."""
+        history = MemoryHistory([
+            {"user_query": "Q1", "mentioned_players": ["Josh Allen"], "mentioned_stats": ["yards"]},
+            {"user_query": "Q2", "mentioned_players": [], "mentioned_stats": []},
+        ])
+        
+        self.assertEqual(history[0]["mentioned_players"], ["Josh Allen"])
+        self.assertEqual(history[0]["mentioned_stats"], ["yards"])
+        self.assertEqual([turn["user_query"] for turn in history[-1:]], ["Q2"])
+        self.assertEqual(history[:], list(history))
+    
     def test_update_memory_skips_empty_query(self):
         """Test that memory update skips when query or response is empty."""
-        state: ChatbotState = {
-            "messages": [],
-            "user_query": "",  # Empty query
-            "parsed_query": {},
-            "retrieved_data": None,
-            "generated_response": "Some response",
-            "conversation_history": [],
-            "error": None,
-            "session_id": "test-session"
-        }
+        state = make_state(
+            user_query="",  # Empty query
+            generated_response="Some response"
+        )
         
         updated_state = update_memory(state)
         
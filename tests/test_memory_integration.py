@@ -6,8 +6,9 @@ in follow-up queries.
 """
 
 import unittest
+
 from nodes.memory import update_memory, get_context, initialize_memory
-from models.models import ChatbotState
+from tests.helpers import make_state
 
 
 class TestMemoryIntegration(unittest.TestCase):
@@ -24,20 +25,15 @@ class TestMemoryIntegration(unittest.TestCase):
         4. Memory should provide context about previous query
         """
         # First interaction
-        state: ChatbotState = {
-            "messages": [],
-            "user_query": "How did Patrick Mahomes perform in 2023?",
-            "parsed_query": {
+        state = make_state(
+            user_query="How did Patrick Mahomes perform in 2023?",
+            parsed_query={
                 "players": ["Patrick Mahomes"],
                 "statistics": ["passing_yards", "touchdowns"],
                 "time_period": {"season": 2023}
             },
-            "retrieved_data": None,
-            "generated_response": "Patrick Mahomes had 4,183 passing yards and 27 touchdowns in 2023.",
-            "conversation_history": [],
-            "error": None,
-            "session_id": "test-session"
-        }
+            generated_response="Patrick Mahomes had 4,183 passing yards and 27 touchdowns in 2023."
+        )
         
         # Update memory with first interaction
         state = update_memory(state)
@@ -88,19 +84,14 @@ class TestMemoryIntegration(unittest.TestCase):
         2. User asks: "What about his completion rate?" (pronoun "his")
         3. Memory should provide Patrick Mahomes as context
         """
-        state: ChatbotState = {
-            "messages": [],
-            "user_query": "How did Patrick Mahomes perform in 2023?",
-            "parsed_query": {
+        state = make_state(
+            user_query="How did Patrick Mahomes perform in 2023?",
+            parsed_query={
                 "players": ["Patrick Mahomes"],
                 "statistics": ["passing_yards"]
             },
-            "retrieved_data": None,
-            "generated_response": "Patrick Mahomes had 4,183 passing yards in 2023.",
-            "conversation_history": [],
-            "error": None,
-            "session_id": "test-session"
-        }
+            generated_response="Patrick Mahomes had 4,183 passing yards in 2023."
+        )
         
         # First interaction
         state = update_memory(state)
@@ -124,16 +115,7 @@ class TestMemoryIntegration(unittest.TestCase):
         Verifies that get_context returns only the most recent turns
         for efficient context resolution.
         """
-        state: ChatbotState = {
-            "messages": [],
-            "user_query": "",
-            "parsed_query": {},
-            "retrieved_data": None,
-            "generated_response": "",
-            "conversation_history": [],
-            "error": None,
-            "session_id": "test-session"
-        }
+        state = make_state()
         
         # Add 5 turns with different players
         players = ["Player1", "Player2", "Player3", "Player4", "Player5"]
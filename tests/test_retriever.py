@@ -0,0 +1,35 @@
+"""
+Unit tests for the Retriever Node's shared data source router.
+"""
+
+import unittest
+from unittest import mock
+
+from nodes import retriever
+
+
+class TestSharedRouter(unittest.TestCase):
+    """Test cases for _get_router."""
+    
+    def setUp(self):
+        patcher = mock.patch.object(retriever, "_router", None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+    
+    def test_router_is_reused(self):
+        """Test that retrievals share one router."""
+        self.assertIs(retriever._get_router(), retriever._get_router())
+    
+    def test_router_rebuilt_on_season_rollover(self):
+        """Test that a new season gets a router with fresh routing tables."""
+        with mock.patch.object(retriever, "current_nfl_season", return_value=2025):
+            old = retriever._get_router()
+        with mock.patch.object(retriever, "current_nfl_season", return_value=2026):
+            new = retriever._get_router()
+        
+        self.assertIsNot(old, new)
+        self.assertEqual(new.current_season, 2026)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,170 @@
+"""
+Unit tests for the LangGraph workflow entry points.
+
+Covers the paths that complete without calling the LLM or data sources.
+"""
+
+import asyncio
+import threading
+import time
+import unittest
+from datetime import datetime
+from unittest import mock
+
+import pandas as pd
+
+import workflow
+from workflow import arun_workflow, get_compiled_workflow, run_workflow
+from nodes.memory import MemoryHistory
+
+
+class TestWorkflow(unittest.TestCase):
+    """Test cases for run_workflow and arun_workflow."""
+    
+    def setUp(self):
+        # No background nflreadpy downloads outside the prewarm tests
+        patcher = mock.patch.object(workflow, "_start_prewarm", return_value=False)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+    
+    def test_compiled_workflow_is_shared(self):
+        """Test that the compiled graph is built once and reused."""
+        self.assertIs(get_compiled_workflow(), get_compiled_workflow())
+        self.assertIs(workflow.create_workflow(), workflow.create_workflow())
+    
+    def test_run_workflow_empty_query(self):
+        """Test that an empty query exits early with a prompt to ask again."""
+        session_state = {}
+        result = run_workflow("   ", session_state)
+        
+        self.assertEqual(result["error"], "empty_query")
+        self.assertIn("Please provide a question", result["generated_response"])
+        self.assertIsInstance(session_state["conversation_history"], MemoryHistory)
+    
+    def test_arun_workflow_empty_query(self):
+        """Test that the async entry point matches run_workflow."""
+        result = asyncio.run(arun_workflow("   "))
+        
+        self.assertEqual(result["error"], "empty_query")
+        self.assertEqual(result["generated_response"], run_workflow("   ")["generated_response"])
+    
+    def test_adopted_history_is_put_in_timestamp_order(self):
+        """Test that a plain-list history is sorted oldest first once adopted."""
+        session_state = {"conversation_history": [
+            {"user_query": "Third", "bot_response": "C", "timestamp": datetime(2024, 1, 7, 12, 10)},
+            {"user_query": "Second", "bot_response": "B", "timestamp": "2024-01-07T12:05:00"},
+            {"user_query": "First", "bot_response": "A"}
+        ]}
+        state = workflow._initial_state("Fourth", session_state)
+        
+        # Turns without a timestamp sort first; datetimes and strings compare
+        self.assertEqual(
+            [turn["user_query"] for turn in state["conversation_history"]],
+            ["First", "Second", "Third"]
+        )
+        self.assertIs(session_state["conversation_history"], state["conversation_history"])
+    
+    def test_cache_key_handles_missing_turn_fields(self):
+        """Test that history turns with missing fields don't break the cache key."""
+        session_state = {"conversation_history": [{"user_query": "Q1", "mentioned_players": ["A B"]}]}
+        state = workflow._initial_state("hi there", session_state)
+        
+        self.assertTrue(workflow._response_cache_key(state).startswith("response:"))
+    
+    def test_routing_returns_fallback_in_command(self):
+        """Test that routing writes its fallback response through the Command."""
+        state = {"user_query": "q", "retrieved_data": None, "generated_response": "", "error": None}
+        command = workflow.should_continue_after_retriever(state)
+        
+        self.assertEqual(command.goto, "exit")
+        self.assertIn("couldn't find any statistics", command.update["generated_response"])
+        self.assertEqual(state["generated_response"], "")
+    
+    def test_node_failure_is_recorded_in_audit_trace(self):
+        """Test that a failing node appends one audit entry and routes on it."""
+        with mock.patch("workflow.parse_query_sync", side_effect=RuntimeError("boom")):
+            result = run_workflow("How did Josh Allen do in 2023?")
+        
+        expected = {"node": "query_parser", "error_type": "query_parsing_error", "recoverable": True}
+        self.assertEqual(result["last_error"], expected)
+        self.assertEqual(result["audit_trace"], [expected])
+        self.assertEqual(result["error"], "query_parsing_error")
+    
+    def test_cached_response_skips_graph_and_records_turn(self):
+        """Test that a cached response is returned and added to memory."""
+        query = "How many passing yards did Josh Allen have in 2023?"
+        state = workflow._initial_state(query, {})
+        workflow._cache_final_state(workflow._response_cache_key(state), {
+            "parsed_query": {"players": ["Josh Allen"], "statistics": ["passing_yards"]},
+            "retrieved_data": pd.DataFrame({"player_name": ["Josh Allen"], "passing_yards": [4306]}),
+            "generated_response": "Josh Allen threw for 4,306 yards.",
+            "error": None
+        })
+        self.addCleanup(workflow._response_cache.clear)
+        
+        session_state = {}
+        result = run_workflow("  how many passing yards did JOSH ALLEN have in 2023? ", session_state)
+        
+        self.assertIsNone(result["error"])
+        self.assertEqual(result["generated_response"], "Josh Allen threw for 4,306 yards.")
+        self.assertEqual(len(session_state["conversation_history"]), 1)
+        
+        # Each hit gets its own copy of the cached frame
+        again = run_workflow(query)
+        self.assertIsNot(again["retrieved_data"], result["retrieved_data"])
+        
+        # The same question later in the conversation has different context
+        follow_up = workflow._initial_state(query, session_state)
+        self.assertNotEqual(
+            workflow._response_cache_key(follow_up),
+            workflow._response_cache_key(state)
+        )
+
+
+class TestPrewarm(unittest.TestCase):
+    """Test cases for the background season prewarm."""
+    
+    def setUp(self):
+        self.cache = workflow.get_cache_manager()
+    
+    def test_prewarm_runs_in_background(self):
+        """Test that a slow season prewarm doesn't hold up the query."""
+        started = threading.Event()
+        release = threading.Event()
+        self.addCleanup(release.set)
+        
+        def slow_load(season):
+            started.set()
+            release.wait(5)
+        
+        source = mock.Mock()
+        source.get_season_stats.side_effect = slow_load
+        with mock.patch.object(workflow, "_prewarm_source", source), \
+                mock.patch.object(self.cache, "has_nflreadpy_season_data", return_value=False), \
+                mock.patch.object(workflow, "_prewarm_running", False), \
+                mock.patch.object(workflow, "_prewarm_next_attempt", 0.0), \
+                mock.patch("workflow.parse_query_sync", side_effect=RuntimeError("boom")):
+            start = time.monotonic()
+            result = run_workflow("How did Josh Allen do in 2023?")
+            elapsed = time.monotonic() - start
+            
+            self.assertTrue(started.wait(1))
+            # Only one load at a time
+            self.assertFalse(workflow._start_prewarm())
+        
+        self.assertEqual(result["error"], "query_parsing_error")
+        self.assertLess(elapsed, 1)
+    
+    def test_prewarm_skipped_when_season_cached(self):
+        """Test that a cached season (startup warm or refresh) starts no load."""
+        with mock.patch.object(self.cache, "has_nflreadpy_season_data", return_value=True), \
+                mock.patch.object(workflow, "_prewarm_running", False), \
+                mock.patch.object(workflow, "_prewarm_next_attempt", 0.0), \
+                mock.patch("workflow.threading.Thread") as thread:
+            self.assertFalse(workflow._start_prewarm())
+        
+        thread.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
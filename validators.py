@@ -13,16 +13,42 @@ Requirements addressed:
 """
 
 import re
-from datetime import datetime
+from datetime import date
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Tuple, Union
 from difflib import SequenceMatcher
 
+import numpy as np
 import pandas as pd
 
+try:
+    from rapidfuzz import fuzz, process
+    _RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    _RAPIDFUZZ_AVAILABLE = False
+
 
 # Valid NFL seasons range (based on available data)
 MIN_SEASON = 1999
-MAX_SEASON = datetime.now().year if datetime.now().month >= 9 else datetime.now().year - 1
+
+
+@lru_cache(maxsize=1)
+def _max_season_on(today: date) -> int:
+    """
+    Latest valid season on a given date (seasons start in September).
+    
+    Args:
+        today: Current date
+        
+    Returns:
+        Latest season year
+    """
+    return today.year if today.month >= 9 else today.year - 1
+
+
+# Latest season at import time; validate_season re-checks the date so
+# long-running processes pick up a new season in September
+MAX_SEASON = _max_season_on(date.today())
 
 # Valid week numbers
 MIN_WEEK = 1
@@ -55,7 +81,7 @@ PLAYER_NAME_CORRECTIONS = {
 }
 
 # Standardized statistical field names
-VALID_STAT_FIELDS = {
+VALID_STAT_FIELDS = frozenset({
     # Passing stats
     "completions", "attempts", "passing_yards", "passing_touchdowns",
     "interceptions", "sacks", "sack_yards", "completion_rate",
@@ -75,6 +101,45 @@ VALID_STAT_FIELDS = {
     
     # Team/position info
     "team", "position", "season", "week"
+})
+
+# Player name cleanup patterns
+_WS_RE = re.compile(r'\s+')
+_INITIALS_RE = re.compile(r'\b([a-z])([a-z])\b')
+_MC_RE = re.compile(r"Mc([a-z])")
+_O_RE = re.compile(r"O'([a-z])")
+_NON_ALNUM_RE = re.compile(r'[^a-z0-9]')
+
+# Corrections keyed on letters and digits only, so "a.j. brown" or
+# "patrick  mahomes" hit the same entry as "aj brown" / "patrick mahomes"
+_AGGRESSIVE_CORRECTIONS = {
+    _NON_ALNUM_RE.sub('', key): correction
+    for key, correction in PLAYER_NAME_CORRECTIONS.items()
+}
+
+# Stat name cleanup: spaces and hyphens become underscores, then anything
+# outside [a-z0-9_] is dropped
+_STAT_TRANS = str.maketrans({' ': '_', '-': '_'})
+_NON_STAT_CHARS = re.compile(r'[^a-z0-9_]')
+
+# Common column name variations -> standardized column names
+_COLUMN_ALIASES = {
+    alias: column
+    for column, aliases in (
+        ('passing_yards', ('pass_yds', 'passyds', 'pass_yards')),
+        ('passing_touchdowns', ('pass_td', 'passtd', 'pass_touchdowns')),
+        ('rushing_yards', ('rush_yds', 'rushyds', 'rush_yards')),
+        ('rushing_touchdowns', ('rush_td', 'rushtd', 'rush_touchdowns')),
+        ('receiving_yards', ('rec_yds', 'recyds', 'rec_yards')),
+        ('receiving_touchdowns', ('rec_td', 'rectd', 'rec_touchdowns')),
+        ('completions', ('comp', 'comps')),
+        ('attempts', ('att', 'atts')),
+        ('interceptions', ('int', 'ints')),
+        ('receptions', ('rec', 'recs')),
+        ('targets', ('tgt', 'tgts')),
+        ('player_name', ('player', 'name', 'playername')),
+    )
+    for alias in aliases
 }
 
 # Data type specifications for each stat field
@@ -118,6 +183,10 @@ STAT_DATA_TYPES = {
     "position": str,
 }
 
+# Stat fields by numeric kind, for column-at-a-time validation
+INT_STATS = frozenset(name for name, kind in STAT_DATA_TYPES.items() if kind is int)
+FLOAT_STATS = frozenset(name for name, kind in STAT_DATA_TYPES.items() if kind is float)
+
 
 class ValidationError(Exception):
     """Custom exception for validation errors."""
@@ -151,6 +220,20 @@ def normalize_player_name(name: str, strict: bool = False) -> str:
             raise ValidationError(f"Invalid player name: {name}")
         return ""
     
+    return _normalize_player_name_cached(name)
+
+
+@lru_cache(maxsize=4096)
+def _normalize_player_name_cached(name: str) -> str:
+    """
+    Normalize a non-empty player name string (memoized).
+    
+    Args:
+        name: Raw player name
+        
+    Returns:
+        Normalized player name
+    """
     # Strip whitespace and convert to lowercase for lookup
     name_clean = name.strip().lower()
     
@@ -158,24 +241,93 @@ def normalize_player_name(name: str, strict: bool = False) -> str:
     if name_clean in PLAYER_NAME_CORRECTIONS:
         return PLAYER_NAME_CORRECTIONS[name_clean]
     
+    correction = _AGGRESSIVE_CORRECTIONS.get(_NON_ALNUM_RE.sub('', name_clean))
+    if correction is not None:
+        return correction
+    
     # Apply standard normalization
     # Remove extra whitespace
-    normalized = re.sub(r'\s+', ' ', name_clean)
+    normalized = _WS_RE.sub(' ', name_clean)
     
     # Handle common punctuation patterns
     # Convert "AJ" to "A.J.", "DJ" to "D.J.", etc.
-    normalized = re.sub(r'\b([a-z])([a-z])\b', r'\1.\2.', normalized)
+    normalized = ' '.join(_expand_initials(token) for token in normalized.split(' '))
     
     # Convert to Title Case
     normalized = normalized.title()
     
     # Handle special cases like "McCaffrey", "O'Brien"
-    normalized = re.sub(r"Mc([a-z])", lambda m: f"Mc{m.group(1).upper()}", normalized)
-    normalized = re.sub(r"O'([a-z])", lambda m: f"O'{m.group(1).upper()}", normalized)
+    if 'Mc' in normalized:
+        normalized = _MC_RE.sub(lambda m: f"Mc{m.group(1).upper()}", normalized)
+    if "O'" in normalized:
+        normalized = _O_RE.sub(lambda m: f"O'{m.group(1).upper()}", normalized)
     
     return normalized
 
 
+def _expand_initials(token: str) -> str:
+    """
+    Expand a two-letter lowercase token into initials ("aj" -> "a.j.").
+    
+    Tokens made only of word characters are checked directly; tokens with
+    punctuation (e.g. "ja'marr") go through _INITIALS_RE, whose word
+    boundaries can fall inside them.
+    
+    Args:
+        token: Lowercased, space-free part of a player name
+        
+    Returns:
+        Token with any two-letter words expanded
+    """
+    if token.isalnum():
+        if len(token) == 2 and token.isascii() and token.isalpha():
+            return f"{token[0]}.{token[1]}."
+        return token
+    
+    return _INITIALS_RE.sub(r'\1.\2.', token)
+
+
+@lru_cache(maxsize=8)
+def _lowercase_names(names: Tuple[str, ...]) -> Tuple[str, ...]:
+    """
+    Lowercase a roster of candidate names (memoized).
+    
+    Args:
+        names: Candidate player names
+        
+    Returns:
+        Lowercased names, in the same order
+    """
+    return tuple(name.lower() for name in names)
+
+
+def _indel_ratio(a: str, b: str) -> float:
+    """
+    Normalized Indel similarity, 2 * LCS(a, b) / (len(a) + len(b)).
+    
+    This is the score rapidfuzz's fuzz.ratio computes (as a percentage), so
+    find_similar_player_names ranks and cuts off names the same way with or
+    without rapidfuzz installed.
+    
+    Args:
+        a: First string
+        b: Second string
+        
+    Returns:
+        Similarity from 0.0 to 1.0
+    """
+    # Longest common subsequence, one DP row at a time
+    previous = [0] * (len(b) + 1)
+    for char_a in a:
+        current = [0]
+        for j, char_b in enumerate(b):
+            current.append(previous[j] + 1 if char_a == char_b else max(previous[j + 1], current[j]))
+        previous = current
+    
+    total = len(a) + len(b)
+    return 2 * previous[-1] / total if total else 1.0
+
+
 def find_similar_player_names(
     name: str,
     available_names: List[str],
@@ -196,15 +348,40 @@ def find_similar_player_names(
         
     Requirements: 6.4
     """
-    normalized_input = normalize_player_name(name)
+    normalized_input = normalize_player_name(name).lower()
+    
+    # Rosters are usually the same list call after call, so the lowercased
+    # candidates are cached (keyed by the names themselves)
+    available_names = tuple(available_names)
+    lowered_names = _lowercase_names(available_names)
+    
+    if _RAPIDFUZZ_AVAILABLE:
+        # fuzz.ratio is the normalized Indel similarity, 2 * LCS / T, scored
+        # 0-100 by a C++ kernel (not SequenceMatcher.ratio, whose matching
+        # blocks can score lower); the fallback below computes the same score
+        results = process.extract(
+            normalized_input,
+            lowered_names,
+            scorer=fuzz.ratio,
+            score_cutoff=threshold * 100,
+            limit=None
+        )
+        return [(available_names[index], score / 100.0) for _, score, index in results]
+    
     matches = []
     
-    for available_name in available_names:
-        similarity = SequenceMatcher(
-            None,
-            normalized_input.lower(),
-            available_name.lower()
-        ).ratio()
+    for available_name, lowered_name in zip(available_names, lowered_names):
+        if lowered_name == normalized_input:
+            matches.append((available_name, 1.0))
+            continue
+        
+        # real_quick_ratio (lengths only) and quick_ratio (character counts)
+        # are upper bounds on the LCS similarity, so most non-matches stop here
+        matcher = SequenceMatcher(None, normalized_input, lowered_name)
+        if matcher.real_quick_ratio() < threshold or matcher.quick_ratio() < threshold:
+            continue
+        
+        similarity = _indel_ratio(normalized_input, lowered_name)
         
         if similarity >= threshold:
             matches.append((available_name, similarity))
@@ -231,20 +408,23 @@ def validate_season(season: Union[int, str], strict: bool = True) -> int:
         
     Requirements: 6.4
     """
+    min_season = MIN_SEASON
+    max_season = _max_season_on(date.today())
+    
     try:
         season_int = int(season)
     except (ValueError, TypeError):
         if strict:
             raise ValidationError(f"Invalid season format: {season}")
-        return MAX_SEASON
+        return max_season
     
-    if season_int < MIN_SEASON or season_int > MAX_SEASON:
+    if season_int < min_season or season_int > max_season:
         if strict:
             raise ValidationError(
-                f"Season {season_int} out of valid range ({MIN_SEASON}-{MAX_SEASON})"
+                f"Season {season_int} out of valid range ({min_season}-{max_season})"
             )
         # Clamp to valid range
-        season_int = max(MIN_SEASON, min(MAX_SEASON, season_int))
+        season_int = max(min_season, min(max_season, season_int))
     
     return season_int
 
@@ -372,11 +552,11 @@ def validate_stat_value(
     
     # Try to convert to expected type
     try:
-        if expected_type == int:
+        if expected_type is int:
             return int(float(value))  # Handle "123.0" strings
-        elif expected_type == float:
+        elif expected_type is float:
             return float(value)
-        elif expected_type == str:
+        elif expected_type is str:
             return str(value).strip()
         else:
             return value
@@ -388,6 +568,85 @@ def validate_stat_value(
         return None
 
 
+def validate_stat_column(stat_name: str, values: pd.Series) -> pd.Series:
+    """
+    Validate and convert a whole column of statistical values at once.
+    
+    Column-wise counterpart of validate_stat_value: invalid values become
+    missing, integer stats are truncated (as int(float(value)) would) and
+    stored as nullable Int64, float stats as nullable Float64.
+    
+    Args:
+        stat_name: Name of the statistical field
+        values: Raw column values
+        
+    Returns:
+        Converted column; unchanged if stat_name isn't a numeric stat
+        
+    Requirements: 4.3
+    """
+    if stat_name in INT_STATS:
+        numeric = pd.to_numeric(values, errors='coerce')
+        if pd.api.types.is_float_dtype(numeric):
+            numeric = np.trunc(numeric)
+        return numeric.astype('Int64')
+    
+    if stat_name in FLOAT_STATS:
+        return pd.to_numeric(values, errors='coerce').astype('Float64')
+    
+    return values
+
+
+def strip_string_column(values: pd.Series) -> pd.Series:
+    """
+    Convert a column to stripped strings, keeping missing values as None.
+    
+    Column-wise counterpart of validate_stat_value for string stats: each
+    present value becomes str(value).strip(), in one vectorized pass.
+    
+    Args:
+        values: Raw column values
+        
+    Returns:
+        Object-dtype column of stripped strings and None
+        
+    Requirements: 4.3
+    """
+    present = values.notna().to_numpy()
+    result = np.full(len(values), None, dtype=object)
+    result[present] = values[present].astype(str).str.strip().to_numpy()
+    return pd.Series(result, index=values.index, name=values.name)
+
+
+@lru_cache(maxsize=1024)
+def _resolve_stat_name(stat_key: str) -> str:
+    """
+    Resolve a translated stat name to a standardized field (memoized).
+    
+    The cache is bounded, since stat names come from user queries.
+    
+    Args:
+        stat_key: Lowercased stat name with spaces/hyphens as underscores
+        
+    Returns:
+        Standardized stat field, or the cleaned name if none matches
+    """
+    # Remove any non-alphanumeric characters except underscores
+    stat_clean = _NON_STAT_CHARS.sub('', stat_key)
+    
+    # Check if it's a valid stat field
+    if stat_clean in VALID_STAT_FIELDS:
+        return stat_clean
+    
+    # Try to find close match
+    for valid_stat in VALID_STAT_FIELDS:
+        if stat_clean in valid_stat or valid_stat in stat_clean:
+            return valid_stat
+    
+    # Keep original if no match found
+    return stat_clean
+
+
 def normalize_stat_names(stats: List[str]) -> List[str]:
     """
     Normalize statistical field names to standardized format.
@@ -403,26 +662,44 @@ def normalize_stat_names(stats: List[str]) -> List[str]:
     normalized = []
     
     for stat in stats:
-        # Convert to lowercase and replace spaces with underscores
-        stat_clean = stat.lower().strip().replace(' ', '_').replace('-', '_')
+        # Convert to lowercase and replace spaces/hyphens with underscores
+        stat_key = stat.strip().lower().translate(_STAT_TRANS)
         
-        # Remove any non-alphanumeric characters except underscores
-        stat_clean = re.sub(r'[^a-z0-9_]', '', stat_clean)
+        normalized.append(_resolve_stat_name(stat_key))
+    
+    return normalized
+
+
+@lru_cache(maxsize=64)
+def _compute_column_map(columns: Tuple[str, ...]) -> Dict[str, str]:
+    """
+    Build the column rename mapping for a set of columns (memoized).
+    
+    The returned dict is shared between calls and must not be modified.
+    
+    Args:
+        columns: DataFrame column names, in order
         
-        # Check if it's a valid stat field
-        if stat_clean in VALID_STAT_FIELDS:
-            normalized.append(stat_clean)
+    Returns:
+        Mapping from each column name to its normalized name
+    """
+    column_mapping = {}
+    
+    for col in columns:
+        # Normalize column name (names already made of [a-z0-9_] pass
+        # through unchanged)
+        if col.isascii() and col.replace('_', '').isalnum() and col.lower() == col:
+            normalized = col
         else:
-            # Try to find close match
-            for valid_stat in VALID_STAT_FIELDS:
-                if stat_clean in valid_stat or valid_stat in stat_clean:
-                    normalized.append(valid_stat)
-                    break
-            else:
-                # Keep original if no match found
-                normalized.append(stat_clean)
+            normalized = col.lower().strip().replace(' ', '_').replace('-', '_')
+            normalized = _NON_STAT_CHARS.sub('', normalized)
+        
+        # Map common variations
+        normalized = _COLUMN_ALIASES.get(normalized, normalized)
+        
+        column_mapping[col] = normalized
     
-    return normalized
+    return column_mapping
 
 
 def normalize_dataframe_columns(df: pd.DataFrame) -> pd.DataFrame:
@@ -435,51 +712,20 @@ def normalize_dataframe_columns(df: pd.DataFrame) -> pd.DataFrame:
         df: DataFrame with potentially inconsistent column names
         
     Returns:
-        DataFrame with normalized column names
+        DataFrame with normalized column names, sharing df's data
         
     Requirements: 4.3
     """
     if df.empty:
         return df
     
-    # Create column mapping
-    column_mapping = {}
-    
-    for col in df.columns:
-        # Normalize column name
-        normalized = col.lower().strip().replace(' ', '_').replace('-', '_')
-        normalized = re.sub(r'[^a-z0-9_]', '', normalized)
-        
-        # Map common variations
-        if normalized in ['pass_yds', 'passyds', 'pass_yards']:
-            normalized = 'passing_yards'
-        elif normalized in ['pass_td', 'passtd', 'pass_touchdowns']:
-            normalized = 'passing_touchdowns'
-        elif normalized in ['rush_yds', 'rushyds', 'rush_yards']:
-            normalized = 'rushing_yards'
-        elif normalized in ['rush_td', 'rushtd', 'rush_touchdowns']:
-            normalized = 'rushing_touchdowns'
-        elif normalized in ['rec_yds', 'recyds', 'rec_yards']:
-            normalized = 'receiving_yards'
-        elif normalized in ['rec_td', 'rectd', 'rec_touchdowns']:
-            normalized = 'receiving_touchdowns'
-        elif normalized in ['comp', 'comps']:
-            normalized = 'completions'
-        elif normalized in ['att', 'atts']:
-            normalized = 'attempts'
-        elif normalized in ['int', 'ints']:
-            normalized = 'interceptions'
-        elif normalized in ['rec', 'recs']:
-            normalized = 'receptions'
-        elif normalized in ['tgt', 'tgts']:
-            normalized = 'targets'
-        elif normalized in ['player', 'name', 'playername']:
-            normalized = 'player_name'
-        
-        column_mapping[col] = normalized
+    # Sources emit the same columns call after call, so the mapping is
+    # cached per column tuple
+    column_mapping = _compute_column_map(tuple(df.columns))
     
-    # Rename columns
-    df_normalized = df.rename(columns=column_mapping)
+    # Rename columns (only the column index changes, so the data is shared
+    # with df rather than copied)
+    df_normalized = df.rename(columns=column_mapping, copy=False)
     
     return df_normalized
 
@@ -521,18 +767,17 @@ def validate_dataframe_schema(
             if strict:
                 raise ValidationError(f"Missing required columns: {missing_columns}")
     
-    # Validate data types for known columns
+    # Validate data types for known numeric columns (string columns are
+    # generally fine, and numeric dtypes convert trivially)
     for col in df.columns:
-        if col in STAT_DATA_TYPES:
-            expected_type = STAT_DATA_TYPES[col]
+        if col in INT_STATS or col in FLOAT_STATS:
+            values = df[col]
+            if pd.api.types.is_numeric_dtype(values):
+                continue
             
-            # Check if column can be converted to expected type
+            # Check if column can be converted to a number
             try:
-                if expected_type == int:
-                    pd.to_numeric(df[col], errors='coerce')
-                elif expected_type == float:
-                    pd.to_numeric(df[col], errors='coerce')
-                # String columns are generally fine
+                pd.to_numeric(values, errors='coerce')
             except Exception as e:
                 issues.append(f"Column {col} has invalid data type: {e}")
     
@@ -561,34 +806,40 @@ def normalize_dataframe_values(df: pd.DataFrame) -> pd.DataFrame:
     if df.empty:
         return df
     
-    df_normalized = df.copy()
-    
-    # Normalize player names if present
-    if 'player_name' in df_normalized.columns:
-        df_normalized['player_name'] = df_normalized['player_name'].apply(
-            lambda x: normalize_player_name(x) if pd.notna(x) else None
-        )
-    
-    # Normalize each column based on its data type
-    for col in df_normalized.columns:
+    # Assemble the result column by column: untouched columns are shared
+    # with df instead of copying the whole frame up front
+    columns = []
+    
+    for position, col in enumerate(df.columns):
+        values = df.iloc[:, position]
+        
+        # Normalize player names (once per distinct name, then take the
+        # results back onto the rows by factorized code; missing names
+        # have code -1 and pick up the trailing None)
+        if col == 'player_name':
+            codes, distinct_names = pd.factorize(values)
+            normalized_names = np.array(
+                [normalize_player_name(name) for name in distinct_names] + [None],
+                dtype=object
+            )
+            values = pd.Series(normalized_names[codes], index=values.index, name=col)
+        
+        # Normalize each column based on its data type
         if col in STAT_DATA_TYPES:
             expected_type = STAT_DATA_TYPES[col]
             
-            if expected_type in [int, float]:
-                # Convert to numeric, coercing errors to NaN
-                df_normalized[col] = pd.to_numeric(df_normalized[col], errors='coerce')
-                
-                # Convert to int if specified (but keep NaN as NaN)
-                if expected_type == int:
-                    # Only convert non-null values
-                    mask = df_normalized[col].notna()
-                    df_normalized.loc[mask, col] = df_normalized.loc[mask, col].astype(int)
+            if expected_type is int or expected_type is float:
+                # Convert the whole column to nullable Int64/Float64
+                values = validate_stat_column(col, values)
             
-            elif expected_type == str:
+            elif expected_type is str:
                 # Convert to string, handling None/NaN
-                df_normalized[col] = df_normalized[col].apply(
-                    lambda x: str(x).strip() if pd.notna(x) else None
-                )
+                values = strip_string_column(values)
+        
+        columns.append(values)
+    
+    df_normalized = pd.DataFrame(dict(enumerate(columns)), copy=False)
+    df_normalized.columns = df.columns
     
     return df_normalized
 
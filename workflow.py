@@ -10,32 +10,93 @@ Requirements addressed:
 - 7.5: Continue operating for subsequent queries after encountering errors
 """
 
+import copy
+import hashlib
 import logging
-from typing import Any, Dict, Literal
+import threading
+import time
+from datetime import datetime, timedelta
+from functools import lru_cache
+from itertools import islice
+from types import MappingProxyType
+from typing import Any, Dict, List, Literal, Optional, Union
 
 from langgraph.graph import StateGraph, END
+from langgraph.types import Command
 from langchain_core.messages import HumanMessage
+from langchain_core.runnables import RunnableLambda
 
+from cache_manager import LRUCache, get_cache_manager
+from data_sources.base import current_nfl_season
+from data_sources.nflreadpy_source import NFLReadPyDataSource
 from models.models import ChatbotState
-from nodes.query_parser import parse_query_sync
-from nodes.retriever import retrieve_data_sync
-from nodes.llm_node import generate_insights_sync
-from nodes.memory import update_memory_sync, initialize_memory
+from nodes.query_parser import parse_query, parse_query_sync
+from nodes.retriever import retrieve_data, retrieve_data_sync
+from nodes.llm_node import generate_insights, generate_insights_sync
+from nodes.memory import update_memory_sync, initialize_memory, MemoryHistory
 from error_handler import (
     handle_error,
     ErrorType,
     ChatbotError,
     create_error_response,
+    handle_llm_error,
     is_recoverable_error,
     log_error
 )
+from logging_config import setup_logging
 
 logger = logging.getLogger(__name__)
 
+# The graph is static, so it is compiled once (on first use) and shared
+# between queries and sessions instead of being rebuilt for every one
+_compiled_workflow: Optional[Any] = None
+_compiled_workflow_lock = threading.Lock()
+
+# Successful responses are cached per (normalized query, recent history), so
+# repeating a question skips the parser, data fetch and LLM entirely. The
+# LLM sees the last RESPONSE_CACHE_CONTEXT_TURNS turns, so those are part of
+# the key; the TTL matches the query result cache so live stats refresh.
+RESPONSE_CACHE_SIZE = 1024
+RESPONSE_CACHE_TTL = timedelta(hours=1)
+RESPONSE_CACHE_CONTEXT_TURNS = 5
+_response_cache = LRUCache(capacity=RESPONSE_CACHE_SIZE)
+
+# The current season's nflreadpy stats are preloaded in a background
+# thread started by the entry node, so the query never waits for it. In
+# app.py the startup warm_caches() and the periodic refresh normally keep
+# the season frame cached, and then this does nothing; it covers
+# run_workflow callers without either (scripts, tests of the full stack),
+# a refresh interval of 0, and a failed startup load. At most one load
+# runs at a time, and the next one waits PREWARM_INTERVAL after a success
+# or PREWARM_RETRY_DELAY after a failure, so an nflreadpy outage costs one
+# background attempt per delay instead of one per query.
+PREWARM_INTERVAL = timedelta(hours=1)
+PREWARM_RETRY_DELAY = timedelta(minutes=10)
+_prewarm_source: Optional[NFLReadPyDataSource] = None
+_prewarm_lock = threading.Lock()
+_prewarm_running = False
+_prewarm_next_attempt = 0.0
+
+# Fields of the initial state that are the same for every query; copied
+# per run, with the mutable fields (messages, parsed_query, audit_trace)
+# set fresh each time
+_STATE_TEMPLATE = MappingProxyType({
+    "messages": None,
+    "user_query": "",
+    "parsed_query": None,
+    "retrieved_data": None,
+    "generated_response": "",
+    "conversation_history": None,
+    "error": None,
+    "last_error": None,
+    "audit_trace": None,
+    "session_id": None
+})
+
 
 # Node Functions
 
-def entry_node(state: ChatbotState) -> ChatbotState:
+def entry_node(state: ChatbotState) -> Command[Literal["query_parser", "__end__"]]:
     """
     Entry node that initializes the workflow state.
     
@@ -45,9 +106,11 @@ def entry_node(state: ChatbotState) -> ChatbotState:
         state: Initial chatbot state with user_query
         
     Returns:
-        Initialized state ready for processing
+        Command going to "query_parser" (with the season prewarm started in
+        the background), or ending the workflow straight away for an empty
+        query
     """
-    logger.info(f"Entry node: Processing query - '{state.get('user_query', '')[:50]}...'")
+    logger.info("Entry node: Processing query - '%.50s...'", state.get('user_query', ''))
     
     # Initialize conversation history if not present
     if "conversation_history" not in state or state["conversation_history"] is None:
@@ -65,16 +128,25 @@ def entry_node(state: ChatbotState) -> ChatbotState:
     if state.get("user_query"):
         state["messages"].append(HumanMessage(content=state["user_query"]))
     
-    # Validate user query
+    # Validate user query; an empty one is answered here, so the workflow
+    # ends without another step through the exit node
     if not state.get("user_query") or not state["user_query"].strip():
-        state["error"] = "empty_query"
-        state["generated_response"] = "Please provide a question about NFL player statistics."
         logger.warning("Entry node: Empty query received")
+        return _node_command(
+            state,
+            "entry",
+            END,
+            error="empty_query",
+            generated_response="Please provide a question about NFL player statistics."
+        )
     
-    return state
+    _start_prewarm()
+    
+    logger.info("Routing: Entry -> Query Parser")
+    return _node_command(state, "entry", "query_parser")
 
 
-def query_parser_node(state: ChatbotState) -> ChatbotState:
+def query_parser_node(state: ChatbotState) -> Command[Literal["retriever", "exit"]]:
     """
     Query Parser Node wrapper for the workflow.
     
@@ -84,7 +156,7 @@ def query_parser_node(state: ChatbotState) -> ChatbotState:
         state: Current chatbot state
         
     Returns:
-        State with parsed_query populated
+        Command carrying the state with parsed_query populated
         
     Requirements:
         - 7.2: Provides clear error messages
@@ -95,29 +167,60 @@ def query_parser_node(state: ChatbotState) -> ChatbotState:
     
     try:
         state = parse_query_sync(state)
-        logger.info(f"Query Parser Node: Successfully parsed query - {state.get('parsed_query', {}).get('query_intent', 'unknown')}")
-    except ChatbotError as e:
-        # Handle known chatbot errors
-        error_info = handle_error(
-            e,
-            context={"node": "query_parser", "query": state.get("user_query", "")[:100]}
-        )
-        state["error"] = error_info["error_type"]
-        state["generated_response"] = error_info["user_message"]
     except Exception as e:
-        # Handle unexpected errors
-        error_info = handle_error(
-            e,
-            context={"node": "query_parser", "query": state.get("user_query", "")[:100]},
-            default_error_type=ErrorType.QUERY_PARSING_ERROR
-        )
-        state["error"] = error_info["error_type"]
-        state["generated_response"] = error_info["user_message"]
+        state = _query_parser_failed(state, e)
+    else:
+        state = _query_parser_done(state)
     
+    return should_continue_after_parser(state)
+
+
+async def query_parser_node_async(state: ChatbotState) -> Command[Literal["retriever", "exit"]]:
+    """
+    Async Query Parser Node, used when the workflow runs via ainvoke.
+    
+    Args:
+        state: Current chatbot state
+        
+    Returns:
+        Command carrying the state with parsed_query populated
+    """
+    logger.info("Query Parser Node: Parsing user query")
+    
+    try:
+        state = await parse_query(state)
+    except Exception as e:
+        state = _query_parser_failed(state, e)
+    else:
+        state = _query_parser_done(state)
+    
+    return should_continue_after_parser(state)
+
+
+def _query_parser_done(state: ChatbotState) -> ChatbotState:
+    """Log the outcome of a successful parse."""
+    logger.info("Query Parser Node: Successfully parsed query - %s", state.get('parsed_query', {}).get('query_intent', 'unknown'))
+    return state
+
+
+def _query_parser_failed(state: ChatbotState, e: Exception) -> ChatbotState:
+    """Record a parsing error (ChatbotErrors keep their own type)."""
+    error_info = handle_error(
+        e,
+        context={"node": "query_parser", "query": state.get("user_query", "")[:100]},
+        default_error_type=ErrorType.QUERY_PARSING_ERROR
+    )
+    state["error"] = error_info["error_type"]
+    state["generated_response"] = error_info["user_message"]
+    state["last_error"] = {
+        "node": "query_parser",
+        "error_type": error_info["error_type"],
+        "recoverable": error_info["recoverable"]
+    }
     return state
 
 
-def retriever_node(state: ChatbotState) -> ChatbotState:
+def retriever_node(state: ChatbotState) -> Command[Literal["llm", "exit"]]:
     """
     Retriever Node wrapper for the workflow.
     
@@ -127,7 +230,7 @@ def retriever_node(state: ChatbotState) -> ChatbotState:
         state: Current chatbot state with parsed_query
         
     Returns:
-        State with retrieved_data populated
+        Command carrying the state with retrieved_data populated
         
     Requirements:
         - 7.1: Implements fallback logic for data source failures
@@ -138,51 +241,79 @@ def retriever_node(state: ChatbotState) -> ChatbotState:
     
     try:
         state = retrieve_data_sync(state)
+    except Exception as e:
+        state = _retriever_failed(state, e)
+    else:
+        state = _retriever_done(state)
+    
+    return should_continue_after_retriever(state)
+
+
+async def retriever_node_async(state: ChatbotState) -> Command[Literal["llm", "exit"]]:
+    """
+    Async Retriever Node, used when the workflow runs via ainvoke.
+    
+    Args:
+        state: Current chatbot state with parsed_query
         
-        if state.get("retrieved_data") is not None and not state["retrieved_data"].empty:
-            logger.info(f"Retriever Node: Retrieved {len(state['retrieved_data'])} records")
-        else:
-            logger.warning("Retriever Node: No data retrieved")
-            # Create helpful error response
-            parsed_query = state.get("parsed_query", {})
-            context = {
-                "players": parsed_query.get("players", []),
-                "season": parsed_query.get("time_period", {}).get("season")
-            }
-            error_response = create_error_response(
-                ErrorType.NO_DATA_FOUND,
-                details=context
-            )
-            state["error"] = error_response["error"]
-            state["generated_response"] = error_response["generated_response"]
-    except ChatbotError as e:
-        # Handle known chatbot errors
-        error_info = handle_error(
-            e,
-            context={
-                "node": "retriever",
-                "parsed_query": state.get("parsed_query", {})
-            }
-        )
-        state["error"] = error_info["error_type"]
-        state["generated_response"] = error_info["user_message"]
+    Returns:
+        Command carrying the state with retrieved_data populated
+    """
+    logger.info("Retriever Node: Fetching player statistics")
+    
+    try:
+        state = await retrieve_data(state)
     except Exception as e:
-        # Handle unexpected errors
-        error_info = handle_error(
-            e,
-            context={
-                "node": "retriever",
-                "parsed_query": state.get("parsed_query", {})
-            },
-            default_error_type=ErrorType.DATA_RETRIEVAL_FAILED
+        state = _retriever_failed(state, e)
+    else:
+        state = _retriever_done(state)
+    
+    return should_continue_after_retriever(state)
+
+
+def _retriever_done(state: ChatbotState) -> ChatbotState:
+    """Log retrieved records, or record a no-data error with suggestions."""
+    if state.get("retrieved_data") is not None and not state["retrieved_data"].empty:
+        logger.info("Retriever Node: Retrieved %d records", len(state['retrieved_data']))
+    else:
+        logger.warning("Retriever Node: No data retrieved")
+        # Create helpful error response
+        parsed_query = state.get("parsed_query", {})
+        context = {
+            "players": parsed_query.get("players", []),
+            "season": parsed_query.get("time_period", {}).get("season")
+        }
+        error_response = create_error_response(
+            ErrorType.NO_DATA_FOUND,
+            details=context
         )
-        state["error"] = error_info["error_type"]
-        state["generated_response"] = error_info["user_message"]
+        state["error"] = error_response["error"]
+        state["generated_response"] = error_response["generated_response"]
     
     return state
 
 
-def llm_node(state: ChatbotState) -> ChatbotState:
+def _retriever_failed(state: ChatbotState, e: Exception) -> ChatbotState:
+    """Record a retrieval error (ChatbotErrors keep their own type)."""
+    error_info = handle_error(
+        e,
+        context={
+            "node": "retriever",
+            "parsed_query": state.get("parsed_query", {})
+        },
+        default_error_type=ErrorType.DATA_RETRIEVAL_FAILED
+    )
+    state["error"] = error_info["error_type"]
+    state["generated_response"] = error_info["user_message"]
+    state["last_error"] = {
+        "node": "retriever",
+        "error_type": error_info["error_type"],
+        "recoverable": error_info["recoverable"]
+    }
+    return state
+
+
+def llm_node(state: ChatbotState) -> Command[Literal["memory", "exit"]]:
     """
     LLM Node wrapper for the workflow.
     
@@ -192,7 +323,7 @@ def llm_node(state: ChatbotState) -> ChatbotState:
         state: Current chatbot state with retrieved_data
         
     Returns:
-        State with generated_response populated
+        Command carrying the state with generated_response populated
         
     Requirements:
         - 7.2: Provides clear error messages
@@ -202,27 +333,109 @@ def llm_node(state: ChatbotState) -> ChatbotState:
     
     try:
         state = generate_insights_sync(state)
+    except Exception as e:
+        state = _llm_failed(state, e)
+    else:
+        state = _llm_done(state)
+    
+    return should_continue_after_llm(state)
+
+
+async def llm_node_async(state: ChatbotState) -> Command[Literal["memory", "exit"]]:
+    """
+    Async LLM Node, used when the workflow runs via ainvoke.
+    
+    Args:
+        state: Current chatbot state with retrieved_data
         
-        if state.get("generated_response"):
-            logger.info(f"LLM Node: Generated response ({len(state['generated_response'])} chars)")
-        else:
-            logger.warning("LLM Node: No response generated")
-    except ChatbotError as e:
-        # Handle known chatbot errors
-        from error_handler import handle_llm_error
-        error_response = handle_llm_error(e, operation="insight generation")
-        state["error"] = error_response["error"]
-        state["generated_response"] = error_response["generated_response"]
+    Returns:
+        Command carrying the state with generated_response populated
+    """
+    logger.info("LLM Node: Generating insights")
+    
+    try:
+        state = await generate_insights(state)
     except Exception as e:
-        # Handle unexpected errors (likely LLM API errors)
-        from error_handler import handle_llm_error
-        error_response = handle_llm_error(e, operation="insight generation")
-        state["error"] = error_response["error"]
-        state["generated_response"] = error_response["generated_response"]
+        state = _llm_failed(state, e)
+    else:
+        state = _llm_done(state)
+    
+    return should_continue_after_llm(state)
+
+
+def _llm_done(state: ChatbotState) -> ChatbotState:
+    """Log the size of the generated response."""
+    if state.get("generated_response"):
+        logger.info("LLM Node: Generated response (%d chars)", len(state['generated_response']))
+    else:
+        logger.warning("LLM Node: No response generated")
     
     return state
 
 
+def _llm_failed(state: ChatbotState, e: Exception) -> ChatbotState:
+    """Record an LLM error (known chatbot errors and API errors alike)."""
+    error_response = handle_llm_error(e, operation="insight generation")
+    state["error"] = error_response["error"]
+    state["generated_response"] = error_response["generated_response"]
+    state["last_error"] = {
+        "node": "llm",
+        "error_type": error_response["error"],
+        "recoverable": is_recoverable_error(e)
+    }
+    return state
+
+
+def _start_prewarm() -> bool:
+    """
+    Start loading the current season's nflreadpy stats in the background.
+    
+    The load runs in a daemon thread outside the graph, so no step waits
+    for it; current-season retrievals that come after it finds the season
+    frame already cached. Does nothing if the season is already cached,
+    while a load is running, or until the delay after the previous attempt
+    has passed.
+    
+    Returns:
+        True if a background load was started
+    """
+    global _prewarm_running
+    
+    if get_cache_manager().has_nflreadpy_season_data(current_nfl_season()):
+        return False
+    
+    with _prewarm_lock:
+        if _prewarm_running or time.monotonic() < _prewarm_next_attempt:
+            return False
+        _prewarm_running = True
+    
+    threading.Thread(target=_prewarm_current_season, name="nflreadpy-prewarm", daemon=True).start()
+    return True
+
+
+def _prewarm_current_season():
+    """Load the current season's stats into the shared cache (background thread body)."""
+    global _prewarm_source, _prewarm_running, _prewarm_next_attempt
+    
+    # Same season the retriever's router treats as current
+    season = current_nfl_season()
+    delay = PREWARM_RETRY_DELAY
+    
+    try:
+        if _prewarm_source is None:
+            _prewarm_source = NFLReadPyDataSource()
+        if _prewarm_source.is_available():
+            _prewarm_source.get_season_stats(season)
+            logger.info("Prewarm: Season %d stats cached", season)
+            delay = PREWARM_INTERVAL
+    except Exception as e:
+        logger.warning("Prewarm: Could not preload season %d stats: %s", season, e)
+    finally:
+        with _prewarm_lock:
+            _prewarm_running = False
+            _prewarm_next_attempt = time.monotonic() + delay.total_seconds()
+
+
 def memory_node(state: ChatbotState) -> ChatbotState:
     """
     Memory Node wrapper for the workflow.
@@ -233,7 +446,8 @@ def memory_node(state: ChatbotState) -> ChatbotState:
         state: Current chatbot state with user_query and generated_response
         
     Returns:
-        State with updated conversation_history
+        Partial state update containing only conversation_history, so the
+        graph doesn't rewrite every other channel
         
     Requirements:
         - 7.3: Logs errors with detail
@@ -244,7 +458,7 @@ def memory_node(state: ChatbotState) -> ChatbotState:
     try:
         state = update_memory_sync(state)
         history_size = len(state.get("conversation_history", []))
-        logger.info(f"Memory Node: History updated ({history_size} turns)")
+        logger.info("Memory Node: History updated (%d turns)", history_size)
     except Exception as e:
         # Log error but don't fail workflow for memory errors
         log_error(
@@ -255,7 +469,7 @@ def memory_node(state: ChatbotState) -> ChatbotState:
         logger.warning("Memory Node: Continuing despite error")
         # Memory errors are non-critical, workflow continues
     
-    return state
+    return {"conversation_history": state.get("conversation_history")}
 
 
 def exit_node(state: ChatbotState) -> ChatbotState:
@@ -281,35 +495,64 @@ def exit_node(state: ChatbotState) -> ChatbotState:
     
     # Log final state
     if state.get("error"):
-        logger.warning(f"Exit Node: Workflow completed with error - {state['error']}")
+        logger.warning("Exit Node: Workflow completed with error - %s", state['error'])
     else:
         logger.info("Exit Node: Workflow completed successfully")
     
-    return state
+    return _node_update(state)
 
 
-# Conditional Edge Functions
+# Routing Functions
+#
+# Each node ends by calling its routing function, which returns a Command
+# with the node's state update and next node. Routing and any fallback
+# response are then written together, and nothing is lost the way in-place
+# edits inside a conditional edge function would be.
 
-def should_continue_after_entry(state: ChatbotState) -> Literal["query_parser", "exit"]:
+
+def _node_update(state: ChatbotState) -> Dict[str, Any]:
     """
-    Determine whether to continue to query parser or exit after entry node.
+    Turn a node's working copy of the state into its state update.
+    
+    audit_trace is append-only (its reducer concatenates), so the entries
+    already in the state are left out rather than written back.
     
     Args:
-        state: Current chatbot state
+        state: The node's working copy of the state
         
     Returns:
-        Next node name: "query_parser" or "exit"
+        State update without audit_trace
+    """
+    return {key: value for key, value in state.items() if key != "audit_trace"}
+
+
+def _node_command(state: ChatbotState, node: str, goto: Union[str, List[str]], **changes: Any) -> Command:
     """
-    # Check for errors in entry node
-    if state.get("error") == "empty_query":
-        logger.info("Routing: Entry -> Exit (empty query)")
-        return "exit"
+    Build the Command that ends a node.
     
-    logger.info("Routing: Entry -> Query Parser")
-    return "query_parser"
+    If the node itself failed (last_error names it), its error is appended
+    to the audit trace.
+    
+    Args:
+        state: The node's working copy of the state
+        node: Name of the node that is finishing
+        goto: Next node name(s)
+        **changes: Extra fields to set in the update
+        
+    Returns:
+        Command with the node's update and destination
+    """
+    update = _node_update(state)
+    update.update(changes)
+    
+    last_error = update.get("last_error")
+    if last_error and last_error["node"] == node:
+        update["audit_trace"] = [last_error]
+    
+    return Command(update=update, goto=goto)
 
 
-def should_continue_after_parser(state: ChatbotState) -> Literal["retriever", "exit"]:
+def should_continue_after_parser(state: ChatbotState) -> Command[Literal["retriever", "exit"]]:
     """
     Determine whether to continue to retriever or exit after query parser.
     
@@ -317,30 +560,39 @@ def should_continue_after_parser(state: ChatbotState) -> Literal["retriever", "e
         state: Current chatbot state
         
     Returns:
-        Next node name: "retriever" or "exit"
+        Command going to "retriever" or "exit"
     """
+    error = state.get("error")
+    last_error = state.get("last_error")
+    
     # Check for parsing errors
-    if state.get("error") and "query_parser" in state["error"]:
+    if last_error and last_error["node"] == "query_parser":
         logger.info("Routing: Query Parser -> Exit (parsing error)")
-        return "exit"
+        return _node_command(state, "query_parser", "exit")
     
     # Check if clarification is needed
-    if state.get("error") == "clarification_needed":
+    if error == "clarification_needed":
         logger.info("Routing: Query Parser -> Exit (clarification needed)")
-        return "exit"
+        return _node_command(state, "query_parser", "exit")
     
     # Check if query was parsed successfully
     if not state.get("parsed_query"):
         logger.warning("Routing: Query Parser -> Exit (no parsed query)")
-        state["error"] = "parsing_failed"
-        state["generated_response"] = "I couldn't understand your question. Please try rephrasing it."
-        return "exit"
+        if state.get("generated_response"):
+            return _node_command(state, "query_parser", "exit")
+        return _node_command(
+            state,
+            "query_parser",
+            "exit",
+            error="parsing_failed",
+            generated_response="I couldn't understand your question. Please try rephrasing it."
+        )
     
     logger.info("Routing: Query Parser -> Retriever")
-    return "retriever"
+    return _node_command(state, "query_parser", "retriever")
 
 
-def should_continue_after_retriever(state: ChatbotState) -> Literal["llm", "exit"]:
+def should_continue_after_retriever(state: ChatbotState) -> Command[Literal["llm", "exit"]]:
     """
     Determine whether to continue to LLM or exit after retriever.
     
@@ -348,29 +600,35 @@ def should_continue_after_retriever(state: ChatbotState) -> Literal["llm", "exit
         state: Current chatbot state
         
     Returns:
-        Next node name: "llm" or "exit"
+        Command going to "llm" or "exit"
     """
     # Check for retrieval errors
-    if state.get("error") and "retriever" in state["error"]:
+    last_error = state.get("last_error")
+    if last_error and last_error["node"] == "retriever":
         logger.info("Routing: Retriever -> Exit (retrieval error)")
-        return "exit"
+        return _node_command(state, "retriever", "exit")
     
     # Check if data was retrieved
     retrieved_data = state.get("retrieved_data")
     if retrieved_data is None or retrieved_data.empty:
         logger.info("Routing: Retriever -> Exit (no data)")
-        if not state.get("generated_response"):
-            state["generated_response"] = (
+        if state.get("generated_response"):
+            return _node_command(state, "retriever", "exit")
+        return _node_command(
+            state,
+            "retriever",
+            "exit",
+            generated_response=(
                 "I couldn't find any statistics matching your query. "
                 "Please check the player name and time period."
             )
-        return "exit"
+        )
     
     logger.info("Routing: Retriever -> LLM")
-    return "llm"
+    return _node_command(state, "retriever", "llm")
 
 
-def should_continue_after_llm(state: ChatbotState) -> Literal["memory", "exit"]:
+def should_continue_after_llm(state: ChatbotState) -> Command[Literal["memory", "exit"]]:
     """
     Determine whether to continue to memory or exit after LLM.
     
@@ -378,26 +636,32 @@ def should_continue_after_llm(state: ChatbotState) -> Literal["memory", "exit"]:
         state: Current chatbot state
         
     Returns:
-        Next node name: "memory" or "exit"
+        Command going to "memory" or "exit"
     """
     # Check for LLM errors
-    if state.get("error") and "llm" in state["error"]:
+    last_error = state.get("last_error")
+    if last_error and last_error["node"] == "llm":
         logger.warning("Routing: LLM -> Memory (with error, but continuing)")
         # Continue to memory even with errors to maintain conversation history
-        return "memory"
+        return _node_command(state, "llm", "memory")
     
     # Check if response was generated
     if not state.get("generated_response"):
         logger.warning("Routing: LLM -> Exit (no response generated)")
-        state["generated_response"] = "I couldn't generate a response. Please try again."
-        return "exit"
+        return _node_command(
+            state,
+            "llm",
+            "exit",
+            generated_response="I couldn't generate a response. Please try again."
+        )
     
     logger.info("Routing: LLM -> Memory")
-    return "memory"
+    return _node_command(state, "llm", "memory")
 
 
 # Workflow Builder
 
+@lru_cache(maxsize=1)
 def create_workflow() -> StateGraph:
     """
     Create and configure the LangGraph workflow.
@@ -408,6 +672,11 @@ def create_workflow() -> StateGraph:
     Returns:
         Configured StateGraph ready for compilation
         
+    Note:
+        The graph takes no parameters, so it is built once and the same
+        StateGraph is returned on every call; don't modify it. Use
+        create_workflow.cache_clear() to force a rebuild.
+        
     Requirements:
         - 1.3: Orchestrates query processing pipeline
         - 7.2: Implements error handling with clear messages
@@ -418,53 +687,31 @@ def create_workflow() -> StateGraph:
     # Initialize the state graph
     workflow = StateGraph(ChatbotState)
     
-    # Add nodes to the workflow
-    workflow.add_node("entry", entry_node)
-    workflow.add_node("query_parser", query_parser_node)
-    workflow.add_node("retriever", retriever_node)
-    workflow.add_node("llm", llm_node)
-    workflow.add_node("memory", memory_node)
-    workflow.add_node("exit", exit_node)
-    
-    # Set entry point
-    workflow.set_entry_point("entry")
-    
-    # Add conditional edges for error handling
-    workflow.add_conditional_edges(
-        "entry",
-        should_continue_after_entry,
-        {
-            "query_parser": "query_parser",
-            "exit": "exit"
-        }
-    )
-    
-    workflow.add_conditional_edges(
+    # Add nodes to the workflow. Nodes that route return a Command, so
+    # their possible destinations are declared here instead of as edges.
+    workflow.add_node("entry", entry_node, destinations=("query_parser", END))
+    # The I/O-bound nodes have async variants, which run when the graph is
+    # driven with ainvoke (arun_workflow) instead of invoke
+    workflow.add_node(
         "query_parser",
-        should_continue_after_parser,
-        {
-            "retriever": "retriever",
-            "exit": "exit"
-        }
+        RunnableLambda(query_parser_node, afunc=query_parser_node_async),
+        destinations=("retriever", "exit")
     )
-    
-    workflow.add_conditional_edges(
+    workflow.add_node(
         "retriever",
-        should_continue_after_retriever,
-        {
-            "llm": "llm",
-            "exit": "exit"
-        }
+        RunnableLambda(retriever_node, afunc=retriever_node_async),
+        destinations=("llm", "exit")
     )
-    
-    workflow.add_conditional_edges(
+    workflow.add_node(
         "llm",
-        should_continue_after_llm,
-        {
-            "memory": "memory",
-            "exit": "exit"
-        }
+        RunnableLambda(llm_node, afunc=llm_node_async),
+        destinations=("memory", "exit")
     )
+    workflow.add_node("memory", memory_node)
+    workflow.add_node("exit", exit_node)
+    
+    # Set entry point
+    workflow.set_entry_point("entry")
     
     # Memory always goes to exit
     workflow.add_edge("memory", "exit")
@@ -492,6 +739,27 @@ def compile_workflow() -> Any:
     return compiled
 
 
+def get_compiled_workflow() -> Any:
+    """
+    Get the shared compiled workflow, compiling it on first use.
+    
+    Returns:
+        Compiled workflow ready for execution
+        
+    Note:
+        The compiled graph holds no per-query state, so one instance serves
+        every query and session. Call compile_workflow() for a fresh one.
+    """
+    global _compiled_workflow
+    
+    if _compiled_workflow is None:
+        with _compiled_workflow_lock:
+            if _compiled_workflow is None:
+                _compiled_workflow = compile_workflow()
+    
+    return _compiled_workflow
+
+
 # Convenience function for running the workflow
 
 def run_workflow(user_query: str, session_state: Dict[str, Any] = None) -> Dict[str, Any]:
@@ -516,41 +784,270 @@ def run_workflow(user_query: str, session_state: Dict[str, Any] = None) -> Dict[
         >>> result = run_workflow("How did Patrick Mahomes perform in 2023?")
         >>> print(result["generated_response"])
     """
-    # Compile workflow
-    app = compile_workflow()
-    
-    # Initialize state
-    initial_state: ChatbotState = {
-        "messages": [],
-        "user_query": user_query,
-        "parsed_query": {},
-        "retrieved_data": None,
-        "generated_response": "",
-        "conversation_history": session_state.get("conversation_history", []) if session_state else [],
-        "error": None,
-        "session_id": session_state.get("session_id") if session_state else None
-    }
+    return _invoke_workflow(get_compiled_workflow(), user_query, session_state)
+
+
+def run_workflow_batch(queries: List[str], session_state: Dict[str, Any] = None) -> List[Dict[str, Any]]:
+    """
+    Run several queries of one conversation through a single compiled graph.
+    
+    Each query is invoked in order on the shared compiled workflow.
+    Conversation history carries over between turns through session_state
+    exactly as with repeated run_workflow calls.
+    
+    Args:
+        queries: User queries in conversation order
+        session_state: Optional existing session state with conversation history
+        
+    Returns:
+        List of final state dictionaries, one per query
+        
+    Example:
+        >>> results = run_workflow_batch(["How did Mahomes do in 2023?", "What about his TDs?"])
+        >>> print(results[-1]["generated_response"])
+    """
+    if session_state is None:
+        session_state = {}
+    
+    app = get_compiled_workflow()
+    
+    results = []
+    for user_query in queries:
+        result = _invoke_workflow(app, user_query, session_state)
+        session_state["conversation_history"] = result.get(
+            "conversation_history", session_state.get("conversation_history")
+        )
+        results.append(result)
+    
+    return results
+
+
+async def arun_workflow(user_query: str, session_state: Dict[str, Any] = None) -> Dict[str, Any]:
+    """
+    Run the workflow with a user query without blocking the event loop.
+    
+    Async counterpart of run_workflow: the graph is driven with ainvoke, so
+    the query parser, retriever and LLM nodes await their I/O on the
+    caller's event loop and concurrent sessions don't each hold a thread.
+    
+    Args:
+        user_query: The user's natural language query
+        session_state: Optional existing session state with conversation history
+        
+    Returns:
+        Final state dictionary with generated_response
+        
+    Example:
+        >>> result = await arun_workflow("How did Patrick Mahomes perform in 2023?")
+        >>> print(result["generated_response"])
+    """
+    initial_state = _initial_state(user_query, session_state)
+    cache_key = _response_cache_key(initial_state)
+    
+    cached_state = _cached_final_state(cache_key, initial_state)
+    if cached_state is not None:
+        return cached_state
     
     # Run workflow
-    logger.info(f"Running workflow for query: '{user_query[:50]}...'")
+    logger.info("Running workflow for query: '%.50s...'", user_query)
+    
+    try:
+        final_state = await get_compiled_workflow().ainvoke(initial_state)
+        logger.info("Workflow execution completed")
+        _cache_final_state(cache_key, final_state)
+        return final_state
+    except Exception as e:
+        return _workflow_failed(initial_state, e)
+
+
+def _invoke_workflow(app: Any, user_query: str, session_state: Dict[str, Any] = None) -> Dict[str, Any]:
+    """
+    Invoke a compiled workflow for a single query.
+    
+    Args:
+        app: Compiled workflow from compile_workflow()
+        user_query: The user's natural language query
+        session_state: Optional existing session state with conversation history
+        
+    Returns:
+        Final state dictionary with generated_response
+    """
+    initial_state = _initial_state(user_query, session_state)
+    cache_key = _response_cache_key(initial_state)
+    
+    cached_state = _cached_final_state(cache_key, initial_state)
+    if cached_state is not None:
+        return cached_state
+    
+    # Run workflow
+    logger.info("Running workflow for query: '%.50s...'", user_query)
     
     try:
         final_state = app.invoke(initial_state)
         logger.info("Workflow execution completed")
+        _cache_final_state(cache_key, final_state)
         return final_state
     except Exception as e:
-        # Handle workflow-level errors
-        error_info = handle_error(
-            e,
-            context={"query": user_query[:100]},
-            default_error_type=ErrorType.WORKFLOW_ERROR
-        )
+        return _workflow_failed(initial_state, e)
+
+
+def _initial_state(user_query: str, session_state: Dict[str, Any] = None) -> ChatbotState:
+    """
+    Build the initial workflow state for a query.
+    
+    Args:
+        user_query: The user's natural language query
+        session_state: Optional existing session state with conversation history
         
-        return {
-            **initial_state,
-            "error": error_info["error_type"],
-            "generated_response": error_info["user_message"]
-        }
+    Returns:
+        Initial chatbot state
+    """
+    # Keep the session's history as a bounded MemoryHistory (a ring buffer of
+    # the last MAX_CONVERSATION_HISTORY turns) shared with the caller.
+    # Invariant: turns are oldest first, so the LLM prompt built from them is
+    # the same for the same conversation. The memory node only ever appends
+    # the newest turn; a plain list handed in (e.g. restored from storage) is
+    # put in timestamp order once, when it is adopted.
+    history = session_state.get("conversation_history") if session_state else None
+    if not isinstance(history, MemoryHistory):
+        history = MemoryHistory(sorted(history or (), key=_turn_sort_key))
+        if session_state is not None:
+            session_state["conversation_history"] = history
+    
+    state = _STATE_TEMPLATE.copy()
+    state["messages"] = []
+    state["user_query"] = user_query
+    state["parsed_query"] = {}
+    state["conversation_history"] = history
+    state["audit_trace"] = []
+    if session_state:
+        state["session_id"] = session_state.get("session_id")
+    
+    return state
+
+
+def _turn_sort_key(turn: Dict[str, Any]) -> str:
+    """
+    Sort key putting conversation turns in timestamp order.
+    
+    Timestamps may be ISO 8601 strings (ConversationTurn.to_dict), datetimes
+    or missing, so all are compared as ISO strings; missing ones sort first.
+    
+    Args:
+        turn: Conversation turn dictionary
+        
+    Returns:
+        Comparable timestamp string
+    """
+    timestamp = turn.get("timestamp")
+    if isinstance(timestamp, datetime):
+        return timestamp.isoformat()
+    return timestamp or ""
+
+
+def _response_cache_key(initial_state: ChatbotState) -> str:
+    """
+    Build the response cache key for a query in its conversation.
+    
+    Args:
+        initial_state: State the workflow is about to be invoked with
+        
+    Returns:
+        Cache key string
+    """
+    normalized_query = " ".join(initial_state["user_query"].lower().split())
+    hash_obj = hashlib.blake2b(normalized_query.encode(), digest_size=16)
+    
+    # Must be computed before the run, since the memory node appends to
+    # the same history
+    history = initial_state["conversation_history"]
+    for turn in islice(reversed(history), RESPONSE_CACHE_CONTEXT_TURNS):
+        hash_obj.update(b"\0")
+        # Fields can be present but None (MemoryHistory fills in missing ones)
+        hash_obj.update((turn.get("user_query") or "").encode())
+        hash_obj.update(b"\0")
+        hash_obj.update((turn.get("bot_response") or "").encode())
+    
+    return f"response:{hash_obj.hexdigest()}"
+
+
+def _cached_final_state(cache_key: str, initial_state: ChatbotState) -> Optional[Dict[str, Any]]:
+    """
+    Build the final state for a cached response, recording the turn in memory.
+    
+    Args:
+        cache_key: Key from _response_cache_key()
+        initial_state: State the workflow would have been invoked with
+        
+    Returns:
+        Final state dictionary, or None if the response isn't cached
+    """
+    cached = _response_cache.get(cache_key)
+    if cached is None:
+        return None
+    
+    logger.info("Response cache hit for query: '%.50s...'", initial_state['user_query'])
+    
+    # Each hit gets its own copies, so one session can't modify what
+    # another is handed
+    retrieved_data = cached["retrieved_data"]
+    final_state = {
+        **initial_state,
+        "parsed_query": copy.deepcopy(cached["parsed_query"]),
+        "retrieved_data": retrieved_data.copy() if retrieved_data is not None else None,
+        "generated_response": cached["generated_response"],
+        "messages": [HumanMessage(content=initial_state["user_query"])]
+    }
+    
+    # Record the turn as the memory node would have
+    return update_memory_sync(final_state)
+
+
+def _cache_final_state(cache_key: str, final_state: Dict[str, Any]):
+    """
+    Cache the response fields of a successful workflow run.
+    
+    Args:
+        cache_key: Key from _response_cache_key()
+        final_state: Final state returned by the workflow
+    """
+    if final_state.get("error") or not final_state.get("generated_response"):
+        return
+    
+    _response_cache.set(
+        key=cache_key,
+        value={
+            "parsed_query": final_state.get("parsed_query", {}),
+            "retrieved_data": final_state.get("retrieved_data"),
+            "generated_response": final_state["generated_response"]
+        },
+        ttl=RESPONSE_CACHE_TTL
+    )
+
+
+def _workflow_failed(initial_state: ChatbotState, e: Exception) -> Dict[str, Any]:
+    """
+    Build the final state for a workflow-level error.
+    
+    The initial state is local to the failed run, so it is updated in place
+    and returned rather than copied.
+    
+    Args:
+        initial_state: State the workflow was invoked with
+        e: The exception raised by the workflow
+        
+    Returns:
+        Final state dictionary with the error and a user-friendly message
+    """
+    error_info = handle_error(
+        e,
+        context={"query": initial_state["user_query"][:100]},
+        default_error_type=ErrorType.WORKFLOW_ERROR
+    )
+    
+    initial_state["error"] = error_info["error_type"]
+    initial_state["generated_response"] = error_info["user_message"]
+    return initial_state
 
 
 # Logging configuration
@@ -565,8 +1062,6 @@ def configure_logging(level: str = "INFO"):
     Requirements:
         - 7.3: Configures logging with appropriate detail
     """
-    from logging_config import setup_logging
-    
     setup_logging(
         log_level=level,
         console_output=True,